@@ -19,7 +19,6 @@
 import os
 import sys
 import subprocess
-import json
 import pkgutil
 import uuid
 import shutil
@@ -37,6 +36,7 @@ from PyFlow.Core.PathsRegistry import PathsRegistry
 from PyFlow.Core.version import *
 from PyFlow.Core.GraphBase import GraphBase
 from PyFlow.Core.GraphManager import GraphManagerSingleton
+from PyFlow.Core.GraphFile import readGraphFile, writeGraphFile
 from PyFlow.ConfigManager import ConfigManager
 from PyFlow.UI.Canvas.UICommon import *
 from PyFlow.UI.Widgets.BlueprintCanvas import BlueprintCanvasWidget
@@ -346,11 +346,10 @@ class PyFlow(QMainWindow):
         self.updateLabel()
 
     def loadFromFile(self, filePath):
-        with open(filePath, 'r') as f:
-            data = json.load(f)
-            self.loadFromData(data, clearHistory=True)
-            self.currentFileName = filePath
-            EditorHistory().saveState("Open {}".format(os.path.basename(self.currentFileName)))
+        data = readGraphFile(filePath)
+        self.loadFromData(data, clearHistory=True)
+        self.currentFileName = filePath
+        EditorHistory().saveState("Open {}".format(os.path.basename(self.currentFileName)))
 
     def load(self):
         name_filter = "Graph files (*.pygraph)"
@@ -394,9 +393,8 @@ class PyFlow(QMainWindow):
             self.currentFileName += ".pygraph"
 
         if not self.currentFileName == '':
-            with open(self.currentFileName, 'w') as f:
-                saveData = self.graphManager.get().serialize()
-                json.dump(saveData, f, indent=4)
+            saveData = self.graphManager.get().serialize()
+            writeGraphFile(self.currentFileName, saveData, binary=ConfigManager().shouldSaveBinaryGraphs())
             print(str("// saved: '{0}'".format(self.currentFileName)))
             self.modified = False
             self.updateLabel()
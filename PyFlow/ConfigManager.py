@@ -51,6 +51,10 @@ class ConfigManager(object):
     def shouldRedirectOutput():
         return ConfigManager().getPrefsValue("PREFS", "General/RedirectOutput") == "true"
 
+    @staticmethod
+    def shouldSaveBinaryGraphs():
+        return ConfigManager().getPrefsValue("PREFS", "General/BinaryGraphFiles") == "true"
+
     def registerConfigFile(self, alias, absPath):
         if alias not in self.CONFIGS_STORAGE:
             self.CONFIGS_STORAGE[alias] = absPath
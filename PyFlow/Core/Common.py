@@ -26,6 +26,8 @@ import time
 import inspect
 import struct
 import weakref
+import itertools
+from collections import Counter
 try:
     from queue import Queue
 except:
@@ -218,9 +220,70 @@ def wrapStringToFunctionDef(functionName, scriptString, kwargs=None):
     return result
 
 
+_topologicalIndices = itertools.count()
+
+
+def newTopologicalIndex():
+    """Returns index for newly created pin
+
+    All pins are kept in topological order: pin always has smaller index than pins it affects.
+    New pins affect nothing, so they are placed to the end.
+
+    :rtype: int
+    """
+    return next(_topologicalIndices)
+
+
+def _collectPins(start, getNext, accept):
+    visited = set([start])
+    stack = [start]
+    while len(stack) > 0:
+        pin = stack.pop()
+        for nextPin in getNext(pin):
+            if nextPin not in visited and accept(nextPin):
+                visited.add(nextPin)
+                stack.append(nextPin)
+    return visited
+
+
+def updateTopologicalOrder(lhs, rhs):
+    """Restores topological order after **lhs** started to affect **rhs**
+
+    Pearce-Kelly dynamic topological sort. Only pins between **rhs** and **lhs** in current order are visited and reindexed.
+
+    :param lhs: Affecting pin
+    :type lhs: :py:class:`PyFlow.Core.PinBase.PinBase`
+    :param rhs: Affected pin
+    :type rhs: :py:class:`PyFlow.Core.PinBase.PinBase`
+    :returns: False if order can not be restored because **rhs** affects **lhs**
+    :rtype: bool
+    """
+    lowerBound = rhs.topologicalIndex
+    upperBound = lhs.topologicalIndex
+    if upperBound < lowerBound:
+        return True
+
+    forward = _collectPins(rhs, lambda pin: pin.affects, lambda pin: pin.topologicalIndex <= upperBound)
+    if lhs in forward:
+        return False
+    backward = _collectPins(lhs, lambda pin: pin.affected_by, lambda pin: pin.topologicalIndex >= lowerBound)
+
+    # backward set goes first, both keep their relative order
+    backward = sorted(backward, key=lambda pin: pin.topologicalIndex)
+    forward = sorted(forward, key=lambda pin: pin.topologicalIndex)
+    indices = sorted([pin.topologicalIndex for pin in backward + forward])
+    for pin, index in zip(backward + forward, indices):
+        pin.topologicalIndex = index
+    return True
+
+
 def cycleCheck(src, dst):
     """Check for cycle connected nodes
 
+    Checks if **src** is reachable from **dst**. Only pins placed between them in topological order are visited.
+
+    .. seealso:: :func:`~PyFlow.Core.Common.updateTopologicalOrder`
+
     :param src: hand side pin
     :type src: :class:`PyFlow.Core.PinBase`
     :param dst: hand side pin
@@ -230,12 +293,24 @@ def cycleCheck(src, dst):
     """
     if src.direction == PinDirection.Input:
         src, dst = dst, src
-    start = src
     if src in dst.affects:
         return True
-    for i in dst.affects:
-        if cycleCheck(start, i):
+    upperBound = getattr(src, "topologicalIndex", None)
+    if upperBound is not None and upperBound < dst.topologicalIndex:
+        return False
+
+    visited = set()
+    stack = list(dst.affects)
+    while len(stack) > 0:
+        pin = stack.pop()
+        if pin is src:
             return True
+        if pin in visited:
+            continue
+        visited.add(pin)
+        if upperBound is not None and pin.topologicalIndex > upperBound:
+            continue
+        stack.extend(pin.affects)
     return False
 
 
@@ -293,6 +368,8 @@ def pinAffects(lhs, rhs):
     assert(lhs is not rhs), "pin can not affect itself"
     lhs.affects.add(rhs)
     rhs.affected_by.add(lhs)
+    # order of pins which form a cycle is restored when cycle is broken, see GraphBase.batch
+    updateTopologicalOrder(lhs, rhs)
 
 
 def canConnectPins(src, dst):
@@ -317,8 +394,11 @@ def canConnectPins(src, dst):
     if src.direction == PinDirection.Input:
         src, dst = dst, src
 
-    if cycleCheck(src, dst):
-        return False
+    srcGraph = src.owningNode().graph
+    if srcGraph is None or srcGraph() is None or not srcGraph().isBatching():
+        # cycles created in batch are removed when batch is finished
+        if cycleCheck(src, dst):
+            return False
 
     if src.isExec() and dst.isExec():
         return True
@@ -457,6 +537,11 @@ def connectPins(src, dst):
     src.aboutToConnect(dst)
 
     pinAffects(src, dst)
+    graph = src.owningNode().graph
+    if graph is not None and graph() is not None:
+        graph().bumpTopologyVersion()
+        if graph().isBatching():
+            graph().deferConnection(src, dst)
     src.setDirty()
 
     dst.setData(src.currentData())
@@ -464,6 +549,8 @@ def connectPins(src, dst):
     dst.pinConnected(src)
     src.pinConnected(dst)
     push(dst)
+    src.owningNode().notifyModified()
+    dst.owningNode().notifyModified()
     return True
 
 
@@ -547,11 +634,16 @@ def disconnectPins(src, dst):
             src, dst = dst, src
         src.affects.remove(dst)
         dst.affected_by.remove(src)
+        graph = src.owningNode().graph
+        if graph is not None and graph() is not None:
+            graph().bumpTopologyVersion()
         src.pinDisconnected(dst)
         dst.pinDisconnected(src)
         push(dst)
         if src.isExec() and dst.isExec():
             src.onExecute.disconnect(dst.call)
+        src.owningNode().notifyModified()
+        dst.owningNode().notifyModified()
         return True
     return False
 
@@ -559,16 +651,29 @@ def disconnectPins(src, dst):
 def push(start_from):
     """Marks dirty all ports from start to the right
 
-    this part of graph will be recomputed every tick
+    this part of graph will be recomputed every tick. Every pin is visited once,
+    marked pins are added to dirty frontier of their graphs
+
+    .. seealso:: :meth:`~PyFlow.Core.GraphBase.GraphBase.getDirtyFrontier`
 
-    :param start_from: pin from which recursion begins
+    :param start_from: pin from which propagation begins
     :type start_from: :py:class:`~PyFlow.Core.PinBase.PinBase`
     """
-    if not len(start_from.affects) == 0:
-        start_from.setDirty()
-        for i in start_from.affects:
-            i.setDirty()
-            push(i)
+    graph = start_from.owningNode().graph
+    if graph is not None and graph() is not None and graph().isBatching():
+        graph().deferPush(start_from)
+        return
+    if len(start_from.affects) == 0:
+        return
+    visited = set([start_from])
+    stack = [start_from]
+    while len(stack) > 0:
+        pin = stack.pop()
+        pin.invalidate()
+        for affected in pin.affects:
+            if affected not in visited:
+                visited.add(affected)
+                stack.append(affected)
 
 
 def extractDigitsFromEndOfString(string):
@@ -627,6 +732,106 @@ def getUniqNameFromList(existingNames, name):
     return nameNoDigits + str(idx)
 
 
+class NamesIndex(object):
+    """Maps names to objects. Several objects can share one name
+
+    Keeps per-prefix counters to produce unique names without scanning all existing names.
+    Names can be reserved for objects which are not created yet, reserved names are not given out.
+
+    >>> index = NamesIndex()
+    >>> index.add("node", nodeA)
+    >>> index.getUniqName("node")
+    >>> "node1"
+    """
+    def __init__(self):
+        self._items = {}
+        self._counters = {}
+        self._reserved = Counter()
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def names(self):
+        return list(self._items)
+
+    def reservedNames(self):
+        return list(self._reserved)
+
+    def add(self, name, obj):
+        if name in self._items:
+            if obj not in self._items[name]:
+                self._items[name].append(obj)
+        else:
+            self._items[name] = [obj]
+
+    def remove(self, name, obj):
+        if name in self._items:
+            objects = self._items[name]
+            if obj in objects:
+                objects.remove(obj)
+            if len(objects) == 0:
+                self._items.pop(name)
+
+    def rename(self, oldName, newName, obj):
+        self.remove(oldName, obj)
+        self.add(newName, obj)
+
+    def get(self, name, default=None):
+        if name in self._items:
+            return self._items[name][0]
+        return default
+
+    def getAll(self, name):
+        return list(self._items.get(name, []))
+
+    def reserve(self, name):
+        """Prevents name from being returned by :meth:`getUniqName` until it is released
+
+        Name can be reserved several times, every reservation should be paired with :meth:`release`
+        """
+        self._reserved[name] += 1
+
+    def release(self, name):
+        if self._reserved[name] > 1:
+            self._reserved[name] -= 1
+        else:
+            self._reserved.pop(name, None)
+
+    def isTaken(self, name):
+        """Whether name is registered or reserved
+
+        :rtype: bool
+        """
+        return name in self._items or name in self._reserved
+
+    def clear(self):
+        self._items.clear()
+        self._counters.clear()
+        self._reserved.clear()
+
+    def getUniqName(self, name):
+        """Returns name that is not registered yet
+
+        :param name: Desired name
+        :type name: str
+        :rtype: str
+        """
+        if not self.isTaken(name):
+            return name
+        prefix = removeDigitsFromEndOfString(name)
+        idx = self._counters.get(prefix, 0)
+        while True:
+            idx += 1
+            result = prefix + str(idx)
+            if not self.isTaken(result):
+                break
+        self._counters[prefix] = idx
+        return result
+
+
 def clearSignal(signal):
     """Disconnects all receivers
 
@@ -877,7 +1082,11 @@ class NodeMeta:
     :var CATEGORY: To specify category for node. Will be considered by node box
     :var KEYWORDS: To specify list of additional keywords, used in node box search field
     :var CACHE_ENABLED: To specify if node is cached or not
+    :var SIDE_EFFECT_FREE: To specify that function has no side effects and can be evaluated in another process
+    :var VECTORIZABLE: To specify that node can evaluate whole arrays at once. Name of equivalent NumPy function, function which takes same arguments as arrays, or True if function itself works with arrays
     """
     CATEGORY = "Category"
     KEYWORDS = "Keywords"
     CACHE_ENABLED = "CacheEnabled"
+    SIDE_EFFECT_FREE = "SideEffectFree"
+    VECTORIZABLE = "Vectorizable"
@@ -0,0 +1,215 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+"""
+.. sidebar:: **CompoundRegistry.py**
+
+    Registry of compounds exported to package Compounds folders.
+
+Every .compound file is parsed once into :class:`CompoundDefinition`. File is parsed again only when its
+modification time changes. Compound nodes created from definition share its serialized graph.
+Graphs which can be compiled are evaluated by one function shared by all nodes of definition,
+other nodes create own graph when they are evaluated. Nodes create own graph when they are opened.
+"""
+
+import os
+import json
+import uuid
+import logging
+from copy import deepcopy
+
+from PyFlow.Core.Common import *
+
+logger = logging.getLogger(None)
+
+
+COMPOUND_FILE_EXTENSION = ".compound"
+
+
+class CompoundDefinition(object):
+    """Parsed .compound file
+
+    :var graphData: Serialized graph. Shared by all compound nodes created from this definition, must not be modified
+    :vartype graphData: dict
+    """
+    def __init__(self, packageName, path, mtime, graphData):
+        self.packageName = packageName
+        self.path = path
+        self.mtime = mtime
+        self.graphData = graphData
+        self._bCompiled = False
+        self._compiledGraph = None
+        # owns pins of compiled graph
+        self._graphManager = None
+
+    @property
+    def name(self):
+        return self.graphData["name"]
+
+    @property
+    def category(self):
+        return self.graphData["category"]
+
+    def getCompiledGraph(self):
+        """Returns graph of definition compiled to single function. Graph is created and compiled once,
+        in own graph manager, and is shared by all compound nodes created from this definition
+
+        Pins of compiled graph belong to that graph, compound nodes match them by name.
+
+        :rtype: :class:`~PyFlow.Core.PyCodeCompiler.CompiledGraph` or None
+        """
+        if self._bCompiled:
+            return self._compiledGraph
+        self._bCompiled = True
+        from PyFlow.Core.GraphManager import GraphManager
+        from PyFlow.Core.GraphBase import GraphBase
+        from PyFlow.Core.PyCodeCompiler import Py3GraphCompiler, GraphNotCompilable
+        self._graphManager = GraphManager()
+        graph = GraphBase(self.name, self._graphManager, self._graphManager.activeGraph())
+        try:
+            # populating modifies data
+            graph.populateFromJson(deepcopy(self.graphData))
+            self._compiledGraph = Py3GraphCompiler().compile(graph)
+        except GraphNotCompilable:
+            self._compiledGraph = None
+        except Exception:
+            logger.exception("Failed to compile compound {0}, instances will be evaluated node by node".format(self.name))
+            self._compiledGraph = None
+        if self._compiledGraph is None:
+            self._graphManager = None
+        return self._compiledGraph
+
+    def instanceData(self):
+        """Returns copy of graph data with new uids, so every compound node gets own nodes, pins and variables
+
+        :rtype: dict
+        """
+        data = deepcopy(self.graphData)
+        uidsMap = {}
+        graphs = [data]
+        while len(graphs) > 0:
+            graphData = graphs.pop()
+            for varJson in graphData["vars"]:
+                uidsMap[varJson["uuid"]] = varJson["uuid"] = str(uuid.uuid4())
+            for nodeJson in graphData["nodes"]:
+                uidsMap[nodeJson["uuid"]] = nodeJson["uuid"] = str(uuid.uuid4())
+                for pinJson in nodeJson["inputs"] + nodeJson["outputs"]:
+                    pinJson["uuid"] = str(uuid.uuid4())
+                if "graphData" in nodeJson:
+                    graphs.append(nodeJson["graphData"])
+
+        # references to renamed uids
+        graphs = [data]
+        while len(graphs) > 0:
+            graphData = graphs.pop()
+            for nodeJson in graphData["nodes"]:
+                if "varUid" in nodeJson:
+                    nodeJson["varUid"] = uidsMap.get(nodeJson["varUid"], nodeJson["varUid"])
+                for pinJson in nodeJson["inputs"] + nodeJson["outputs"]:
+                    for linkData in pinJson["linkedTo"]:
+                        linkData["lhsNodeUid"] = uidsMap.get(linkData["lhsNodeUid"], linkData["lhsNodeUid"])
+                        linkData["rhsNodeUid"] = uidsMap.get(linkData["rhsNodeUid"], linkData["rhsNodeUid"])
+                if "graphData" in nodeJson:
+                    graphs.append(nodeJson["graphData"])
+        return data
+
+
+@SingletonDecorator
+class CompoundRegistry(object):
+    """Definitions of exported compounds by package and name
+    """
+    def __init__(self):
+        # path -> CompoundDefinition
+        self._definitions = {}
+        # package name -> {compound name: path}
+        self._indexes = {}
+
+    @staticmethod
+    def getCompoundsFolder(packageName):
+        """Returns folder exported compounds of package are stored in
+
+        :param packageName: Package name
+        :type packageName: str
+        :rtype: str or None
+        """
+        from PyFlow import GET_PACKAGE_PATH
+        packagePath = GET_PACKAGE_PATH(packageName)
+        if packagePath is None:
+            return None
+        return os.path.join(packagePath, "Compounds")
+
+    def _load(self, packageName, path):
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            self._definitions.pop(path, None)
+            return None
+        definition = self._definitions.get(path)
+        if definition is None or definition.mtime != mtime:
+            try:
+                with open(path, "r") as f:
+                    definition = CompoundDefinition(packageName, path, mtime, json.load(f))
+            except Exception as e:
+                logger.warning("Failed to load compound {0}: {1}".format(path, e))
+                definition = None
+            self._definitions[path] = definition
+        return definition
+
+    def _scan(self, packageName):
+        index = {}
+        folder = self.getCompoundsFolder(packageName)
+        if folder is not None and os.path.isdir(folder):
+            for path, dirs, files in os.walk(folder):
+                for fileName in files:
+                    if os.path.splitext(fileName)[1] == COMPOUND_FILE_EXTENSION:
+                        definition = self._load(packageName, os.path.join(path, fileName))
+                        if definition is not None:
+                            index[definition.name] = definition.path
+        self._indexes[packageName] = index
+        return index
+
+    def getDefinitions(self, packageName):
+        """Returns all compounds of package, rescanning folder
+
+        :param packageName: Package name
+        :type packageName: str
+        :rtype: list(:class:`CompoundDefinition`)
+        """
+        index = self._scan(packageName)
+        return [self._definitions[path] for path in index.values()]
+
+    def findDefinition(self, packageName, name):
+        """Returns compound definition. Changed files are parsed again
+
+        :param packageName: Package name
+        :type packageName: str
+        :param name: Compound name
+        :type name: str
+        :rtype: :class:`CompoundDefinition` or None
+        """
+        index = self._indexes.get(packageName)
+        if index is not None and name in index:
+            definition = self._load(packageName, index[name])
+            if definition is not None and definition.name == name:
+                return definition
+        # folder was changed or package was not scanned yet
+        index = self._scan(packageName)
+        if name in index:
+            return self._definitions[index[name]]
+        return None
+
+    def clear(self):
+        self._definitions.clear()
+        self._indexes.clear()
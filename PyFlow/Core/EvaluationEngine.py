@@ -13,14 +13,29 @@
 ## limitations under the License.
 
 
+import weakref
+import logging
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
 from PyFlow.Core.Common import *
 from PyFlow.Core.Interfaces import IEvaluationEngine
+from PyFlow.Core.FunctionLibrary import callVectorized
+
+logger = logging.getLogger(None)
 
 
 class DefaultEvaluationEngine_Impl(IEvaluationEngine):
     """Default evaluation engine implementation
     """
 
+    # node -> (topology version, evaluation order)
+    _plans = weakref.WeakKeyDictionary()
+    # pin -> (topology version, dependent nodes)
+    _dependentPlans = weakref.WeakKeyDictionary()
+
     def __init__(self):
         super(DefaultEvaluationEngine_Impl, self).__init__()
 
@@ -34,30 +49,121 @@ class DefaultEvaluationEngine_Impl(IEvaluationEngine):
         if not bOwningNodeCallable:
             return pin.currentData()
 
-        order = DefaultEvaluationEngine_Impl.getEvaluationOrderIterative(pin.owningNode())
+        order = DefaultEvaluationEngine_Impl.getEvaluationPlan(pin.owningNode())
         [node.processNode() for node in order]
-
-        if not bOwningNodeCallable:
-            pin.owningNode().processNode()
         return pin.currentData()
 
+    @staticmethod
+    def getEvaluationPlan(node):
+        """Returns cached evaluation order for node
+
+        Order is rebuilt only when :attr:`~PyFlow.Core.GraphManager.GraphManager.topologyVersion` of node's graph manager changes
+
+        :param node: Node to collect dependencies for
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        graph = node.graph() if node.graph is not None else None
+        if graph is None:
+            return DefaultEvaluationEngine_Impl.getEvaluationOrderIterative(node)
+
+        version = graph.graphManager.topologyVersion
+        plan = DefaultEvaluationEngine_Impl._plans.get(node)
+        if plan is None or plan[0] != version:
+            plan = (version, DefaultEvaluationEngine_Impl.getEvaluationOrderIterative(node))
+            DefaultEvaluationEngine_Impl._plans[node] = plan
+        return plan[1]
+
+    @staticmethod
+    def getDependentPlan(pin):
+        """Returns nodes of owning node's evaluation plan which depend on pin, in evaluation order
+
+        Result is cached same way as :meth:`~PyFlow.Core.EvaluationEngine.DefaultEvaluationEngine_Impl.getEvaluationPlan`
+
+        :param pin: Output pin of node, which value changes between evaluations. For example loop index
+        :type pin: :class:`~PyFlow.Core.PinBase.PinBase`
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        node = pin.owningNode()
+        graph = node.graph() if node.graph is not None else None
+        version = graph.graphManager.topologyVersion if graph is not None else None
+        cached = DefaultEvaluationEngine_Impl._dependentPlans.get(pin)
+        if cached is not None and version is not None and cached[0] == version:
+            return cached[1]
+
+        visited = set([pin])
+        stack = [pin]
+        dependentNodes = set()
+        while len(stack) > 0:
+            current = stack.pop()
+            dependentNodes.add(current.owningNode())
+            for affected in current.affects:
+                if affected not in visited:
+                    visited.add(affected)
+                    stack.append(affected)
+        plan = [n for n in DefaultEvaluationEngine_Impl.getEvaluationPlan(node) if n in dependentNodes]
+
+        if version is not None:
+            DefaultEvaluationEngine_Impl._dependentPlans[pin] = (version, plan)
+        return plan
+
+    @staticmethod
+    def evaluateBatch(loopPin, values, resultPin=None):
+        """Evaluates pure nodes which depend on loop pin for every value
+
+        Used by loop nodes when loop body has no side effects. Instead of firing exec pins and
+        evaluating whole upstream graph for every iteration, nodes which do not depend on loop pin are
+        processed once and only dependent nodes are processed per value, in cached order.
+
+        :param loopPin: Output pin of loop node, which receives values one by one
+        :type loopPin: :class:`~PyFlow.Core.PinBase.PinBase`
+        :param values: Values to evaluate
+        :type values: iterable
+        :param resultPin: Input pin of loop node to collect after every value
+        :type resultPin: :class:`~PyFlow.Core.PinBase.PinBase` or None
+        :returns: Values of result pin, empty if it is not connected
+        :rtype: list
+        """
+        plan = DefaultEvaluationEngine_Impl.getEvaluationPlan(loopPin.owningNode())
+        dependent = DefaultEvaluationEngine_Impl.getDependentPlan(loopPin)
+        dependentSet = set(dependent)
+        for node in plan:
+            if node not in dependentSet:
+                node.processNode()
+
+        bCollect = resultPin is not None and resultPin.hasConnections()
+        results = []
+        for value in values:
+            loopPin.setData(value)
+            for node in dependent:
+                node.processNode()
+            if bCollect:
+                results.append(resultPin.currentData())
+        return results
+
     @staticmethod
     def getEvaluationOrderIterative(node):
-        visited = set()
-        stack = [node]
-        order = []
-        while len(stack):
-            node = stack[-1]
-            stack.pop()
+        """Returns upstream pure nodes sorted so every node goes after nodes it depends on
 
-            if node not in visited:
-                order.insert(0, node)
-                visited.add(node)
+        Same as :meth:`~PyFlow.Core.EvaluationEngine.DefaultEvaluationEngine_Impl.getEvaluationOrder`, but without recursion
 
-            lhsNodes = DefaultEvaluationEngine_Impl().getNextLayerNodes(node)
-            for n in lhsNodes:
-                if n not in visited:
-                    stack.append(n)
+        :param node: Node to collect dependencies for. Not included in result
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        visited = set([node])
+        order = []
+        stack = [(node, iter(DefaultEvaluationEngine_Impl.getNextLayerNodes(node)))]
+        while len(stack):
+            current, lhsNodes = stack[-1]
+            for lhsNode in lhsNodes:
+                if lhsNode not in visited:
+                    visited.add(lhsNode)
+                    stack.append((lhsNode, iter(DefaultEvaluationEngine_Impl.getNextLayerNodes(lhsNode))))
+                    break
+            else:
+                stack.pop()
+                order.append(current)
         order.pop()
         return order
 
@@ -88,7 +194,7 @@ class DefaultEvaluationEngine_Impl(IEvaluationEngine):
                     # check if it is compound node and dive in
                     affectedByPins = set()
                     for pin in inputPin.affected_by:
-                        if pin.owningNode().isCompoundNode:
+                        if pin.owningNode().isCompoundNode and not pin.owningNode().isCompiled():
                             innerPin = pin.owningNode().outputsMap[pin]
                             affectedByPins.add(innerPin)
                         else:
@@ -107,10 +213,304 @@ class DefaultEvaluationEngine_Impl(IEvaluationEngine):
         return nodes
 
 
+class IncrementalEvaluationEngine_Impl(DefaultEvaluationEngine_Impl):
+    """Evaluation engine that recomputes only dirty nodes
+
+    Relies on dirty flags maintained by :func:`~PyFlow.Core.Common.push` and
+    :meth:`~PyFlow.Core.PinBase.PinBase.setDirty`. Upstream nodes which outputs are clean
+    keep their last computed values and are not processed again.
+    """
+
+    def __init__(self):
+        super(IncrementalEvaluationEngine_Impl, self).__init__()
+
+    @staticmethod
+    def getPinData(pin):
+        if not pin.hasConnections():
+            return pin.currentData()
+
+        if not pin.owningNode().bCallable:
+            return pin.currentData()
+
+        order = IncrementalEvaluationEngine_Impl.getEvaluationPlan(pin.owningNode())
+        for node in order:
+            if IncrementalEvaluationEngine_Impl.needsProcessing(node):
+                node.processNode()
+        return pin.currentData()
+
+    @staticmethod
+    def needsProcessing(node):
+        """Whether node should be computed or it's outputs can be reused
+
+        Node is processed if any of it's value outputs is dirty, if it has no value outputs at all
+        or if it's results can change without any input change (:attr:`~PyFlow.Core.Common.PinOptions.AlwaysPushDirty`
+        outputs or :attr:`~PyFlow.Core.Common.NodeMeta.CACHE_ENABLED` explicitly disabled in meta).
+
+        :param node: Node to check
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: bool
+        """
+        meta = node.getMetaData()
+        if meta is not None and meta.get(NodeMeta.CACHE_ENABLED, True) is False:
+            return True
+
+        bHasValueOutputs = False
+        for outPin in node.outputs.values():
+            if outPin.isExec():
+                continue
+            bHasValueOutputs = True
+            if outPin.dirty or outPin.optionEnabled(PinOptions.AlwaysPushDirty):
+                return True
+        return not bHasValueOutputs
+
+
+def callFunction(foo, kwargs, refNames, bVectorized=False, argNames=None):
+    """Calls function library function outside of node
+
+    Reference arguments are replaced with collectors. Used by workers of
+    :class:`~PyFlow.Core.EvaluationEngine.ParallelEvaluationEngine_Impl`
+
+    :param foo: Function library function
+    :type foo: function
+    :param kwargs: Value arguments
+    :type kwargs: dict
+    :param refNames: Names of reference arguments
+    :type refNames: list(str)
+    :param bVectorized: Whether function should be called with arrays, see :func:`~PyFlow.Core.FunctionLibrary.callVectorized`
+    :type bVectorized: bool
+    :param argNames: Argument names of function in order, used in vectorized mode
+    :type argNames: list(str) or None
+    :returns: Function result and dict with values passed to references
+    :rtype: tuple(object, dict)
+    """
+    refs = {}
+    for refName in refNames:
+        refs[refName] = []
+        kwargs[refName] = refs[refName].append
+    if bVectorized:
+        result = callVectorized(foo, kwargs, argNames)
+    else:
+        result = foo(**kwargs)
+    refValues = {}
+    for refName, values in refs.items():
+        if len(values) > 0:
+            refValues[refName] = values[-1]
+    return result, refValues
+
+
+class ParallelEvaluationEngine_Impl(DefaultEvaluationEngine_Impl):
+    """Evaluation engine that processes independent upstream branches concurrently
+
+    Evaluation plan is split into dependency levels. Nodes of one level do not depend on each other.
+    Functions of pure function library nodes are called using thread pool, functions marked with
+    :attr:`~PyFlow.Core.Common.NodeMeta.SIDE_EFFECT_FREE` are called using process pool.
+    Results are set to output pins afterwards on calling thread, so dirty propagation and pin signals
+    never leave it. Other nodes are processed on calling thread while workers are busy.
+
+    Functions are sent to worker processes by reference, so worker must be able to import them.
+    With ``fork`` start method workers inherit loaded packages. With ``spawn`` and ``forkserver``
+    workers import function library modules by name, so packages which are not importable in fresh
+    interpreter, for example ones found only through additional package locations, are evaluated
+    on calling thread instead. Such fallback is logged with debug level.
+
+    Example:
+
+    >>> EvaluationEngine().setImpl(ParallelEvaluationEngine_Impl(maxThreads=8))
+
+    :param maxThreads: Thread pool size. If None, default of :class:`concurrent.futures.ThreadPoolExecutor` is used
+    :type maxThreads: int or None
+    :param maxProcesses: Process pool size. If None, number of processors is used
+    :type maxProcesses: int or None
+    :param bIncremental: If True, clean nodes are skipped like in :class:`~PyFlow.Core.EvaluationEngine.IncrementalEvaluationEngine_Impl`
+    :type bIncremental: bool
+    """
+
+    # node -> (topology version, levels)
+    _levels = weakref.WeakKeyDictionary()
+
+    def __init__(self, maxThreads=None, maxProcesses=None, bIncremental=False):
+        super(ParallelEvaluationEngine_Impl, self).__init__()
+        assert(futures is not None), "concurrent.futures module is required for parallel evaluation"
+        self.maxThreads = maxThreads
+        self.maxProcesses = maxProcesses
+        self.bIncremental = bIncremental
+        self._threadPool = None
+        self._processPool = None
+        #: Number of nodes evaluated in worker processes
+        self.remoteCalls = 0
+
+    def threadPool(self):
+        if self._threadPool is None:
+            self._threadPool = futures.ThreadPoolExecutor(max_workers=self.maxThreads)
+        return self._threadPool
+
+    def processPool(self):
+        if self._processPool is None:
+            self._processPool = futures.ProcessPoolExecutor(max_workers=self.maxProcesses)
+        return self._processPool
+
+    def shutdown(self, wait=True):
+        """Shuts down worker pools. They will be recreated on next evaluation if needed
+        """
+        if self._threadPool is not None:
+            self._threadPool.shutdown(wait=wait)
+            self._threadPool = None
+        if self._processPool is not None:
+            self._processPool.shutdown(wait=wait)
+            self._processPool = None
+
+    def getPinData(self, pin):
+        if not pin.hasConnections():
+            return pin.currentData()
+
+        if not pin.owningNode().bCallable:
+            return pin.currentData()
+
+        for level in self.getEvaluationLevels(pin.owningNode()):
+            self.processLevel(level)
+        return pin.currentData()
+
+    @staticmethod
+    def getEvaluationLevels(node):
+        """Splits cached evaluation plan into dependency levels
+
+        Nodes of one level depend only on nodes of previous levels
+
+        :param node: Node to collect dependencies for
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: list(list(:class:`~PyFlow.Core.NodeBase.NodeBase`))
+        """
+        order = DefaultEvaluationEngine_Impl.getEvaluationPlan(node)
+        graph = node.graph() if node.graph is not None else None
+        version = graph.graphManager.topologyVersion if graph is not None else None
+        cached = ParallelEvaluationEngine_Impl._levels.get(node)
+        if cached is not None and version is not None and cached[0] == version:
+            return cached[1]
+
+        nodeLevels = {}
+        levels = []
+        for n in order:
+            level = 0
+            for lhsNode in DefaultEvaluationEngine_Impl.getNextLayerNodes(n):
+                if lhsNode in nodeLevels:
+                    level = max(level, nodeLevels[lhsNode] + 1)
+            nodeLevels[n] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(n)
+
+        if version is not None:
+            ParallelEvaluationEngine_Impl._levels[node] = (version, levels)
+        return levels
+
+    @staticmethod
+    def isSideEffectFree(node):
+        """Whether node can be evaluated in worker process
+
+        :param node: Node to check
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: bool
+        """
+        if node.getFunction() is None:
+            return False
+        meta = node.getMetaData()
+        return meta is not None and bool(meta.get(NodeMeta.SIDE_EFFECT_FREE, False))
+
+    def processLevel(self, nodes):
+        """Processes independent nodes concurrently
+
+        :param nodes: Nodes of one dependency level
+        :type nodes: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        if self.bIncremental:
+            nodes = [n for n in nodes if IncrementalEvaluationEngine_Impl.needsProcessing(n)]
+
+        if len(nodes) == 0:
+            return
+
+        if len(nodes) == 1:
+            nodes[0].processNode()
+            return
+
+        tasks = []
+        localNodes = []
+        for node in nodes:
+            if not node.isValid():
+                continue
+            if node.getFunction() is None or node.bCallable:
+                # arbitrary compute sets pins and fires exec, this belongs to calling thread
+                localNodes.append(node)
+                continue
+            if node.bCacheEnabled and node.useCache():
+                continue
+            bRemote = self.isSideEffectFree(node)
+            kwargs = {}
+            for inputPin in node.orderedInputs.values():
+                if not inputPin.isExec():
+                    kwargs[inputPin.name] = inputPin.getData()
+            refNames = [p.name for p in node.orderedOutputs.values() if p.name != "out" and not p.isExec()]
+            pool = self.processPool() if bRemote else self.threadPool()
+            try:
+                future = pool.submit(callFunction, node.getFunction(), kwargs, refNames, node.isVectorized(), getattr(node, '_argNames', None))
+            except Exception as e:
+                # pool is broken or shut down
+                logger.warning("Failed to submit {0} to worker pool, evaluating locally: {1}".format(node.getName(), e))
+                node.processNode()
+                continue
+            tasks.append((node, future, bRemote))
+
+        for node in localNodes:
+            node.processNode()
+
+        # only function calls run in workers. Pin data, dirty propagation and signals
+        # are applied here, on calling thread
+        for node, future, bRemote in tasks:
+            try:
+                result, refValues = future.result()
+            except Exception as e:
+                # not picklable or failed in worker, evaluate here to report error properly
+                logger.debug("{0} was not evaluated by worker, evaluating locally: {1}".format(node.getName(), e))
+                node.processNode()
+                continue
+            if bRemote:
+                self.remoteCalls += 1
+            try:
+                if "out" in node.namePinOutputsMap:
+                    node.setData("out", result)
+                for refName, value in refValues.items():
+                    node.setData(refName, value)
+                node.clearError()
+                node.checkForErrors()
+            except Exception as e:
+                node.setError(e)
+            if node.bCacheEnabled:
+                node.afterCompute()
+
+
 @SingletonDecorator
 class EvaluationEngine(object):
     def __init__(self):
         self._impl = DefaultEvaluationEngine_Impl()
 
+    def getImpl(self):
+        """Returns current evaluation engine implementation
+
+        :rtype: :class:`~PyFlow.Core.Interfaces.IEvaluationEngine`
+        """
+        return self._impl
+
+    def setImpl(self, impl):
+        """Replaces evaluation engine implementation
+
+        Example:
+
+        >>> EvaluationEngine().setImpl(IncrementalEvaluationEngine_Impl())
+
+        :param impl: New implementation
+        :type impl: :class:`~PyFlow.Core.Interfaces.IEvaluationEngine`
+        """
+        assert(isinstance(impl, IEvaluationEngine))
+        self._impl = impl
+
     def getPinData(self, pin):
         return self._impl.getPinData(pin)
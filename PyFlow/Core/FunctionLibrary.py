@@ -99,6 +99,20 @@ Examples:
         >>> ("Category" : str)
         >>> ("Keywords" : [str])
         >>> ("CacheEnabled" : bool)
+        >>> ("SideEffectFree" : bool)
+        >>> ("Vectorizable" : str, bool or callable)
+
+        Side effect free functions can be evaluated in worker processes by
+        :class:`~PyFlow.Core.EvaluationEngine.ParallelEvaluationEngine_Impl`.
+        Arguments and return values of such functions should be picklable.
+
+        Vectorizable functions can be switched to vectorized mode, see :meth:`~PyFlow.Core.NodeBase.NodeBase.setVectorized`.
+        In this mode number pins are replaced with NumPy array pins and whole arrays are evaluated in one call.
+        Value is name of NumPy function with same arguments, for example ``"sin"`` for :func:`math.sin`,
+        callable taking same positional arguments, or True if function body works with arrays as is,
+        for example ``a + b``. Where function raises for values out of its domain, like division by zero,
+        NumPy would return inf or nan. Such calls raise :class:`FloatingPointError` instead, so node gets error
+        in both modes.
 
 """
 
@@ -151,3 +165,29 @@ class FunctionLibraryBase(object):
 
     def getFunctions(self):
         return self.__foos
+
+
+def callVectorized(foo, kwargs, argNames=None):
+    """Calls vectorizable function with array arguments
+
+    .. seealso:: :attr:`~PyFlow.Core.Common.NodeMeta.VECTORIZABLE`
+
+    :param foo: Function marked as vectorizable
+    :param kwargs: Arguments by name, arrays or numbers
+    :param argNames: Argument names of function in order. Taken from function signature if not specified
+    :type argNames: list(str) or None
+    :returns: Array result
+    :raises FloatingPointError: If arguments are out of function domain
+    """
+    import numpy
+    target = foo.__annotations__['meta'][NodeMeta.VECTORIZABLE]
+    # same values fail as in scalar mode, instead of becoming inf or nan
+    with numpy.errstate(divide='raise', invalid='raise', over='raise'):
+        if target is True:
+            return foo(**kwargs)
+        if argNames is None:
+            argNames = getargspec(foo).args
+        args = [kwargs[argName] for argName in argNames]
+        if callable(target):
+            return target(*args)
+        return getattr(numpy, target)(*args)
@@ -14,8 +14,11 @@
 
 
 import weakref
+import logging
 from blinker import Signal
 from collections import Counter
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from PyFlow.Core.Common import *
 from PyFlow.Core.NodeBase import NodeBase
@@ -26,6 +29,8 @@ from PyFlow import getPinDefaultValueByType
 from PyFlow.Core.Variable import Variable
 from PyFlow.Core.Interfaces import ISerializable
 
+logger = logging.getLogger(None)
+
 
 class GraphBase(ISerializable):
     """Data structure representing a nodes graph
@@ -42,12 +47,23 @@ class GraphBase(ISerializable):
     :var childGraphs: a set of child graphs
     :vartype childGraphs: :class:`set`
 
+    :var nodeModified: signal emitted with node of this graph, same as :attr:`~PyFlow.Core.GraphManager.GraphManager.nodeModified`
+    :vartype nodeModified: :class:`~blinker.base.Signal`
+
+    :var variablesChanged: signal emitted with variable after it was created or killed
+    :vartype variablesChanged: :class:`~blinker.base.Signal`
+
     :var nodes: nodes storage. Dictionary with :class:`uuid.UUID` as key and :class:`~PyFlow.Core.NodeBase.NodeBase` as value
     :vartype nodes: :class:`dict`
 
     :var uid: Unique identifier
     :vartype uid: :class:`uuid.UUID`
 
+    .. py:method:: topologyVersion
+        :property:
+
+        :getter: Returns counter of graph manager which is incremented every time nodes or connections are added or removed
+
     .. py:method:: parentGraph
         :property:
 
@@ -83,6 +99,9 @@ class GraphBase(ISerializable):
 
         self.nameChanged = Signal(str)
         self.categoryChanged = Signal(str)
+        self.nodeAdded = Signal(object)
+        self.nodeModified = Signal(object)
+        self.variablesChanged = Signal(object)
 
         self.__name = name
         self.__category = category
@@ -93,7 +112,13 @@ class GraphBase(ISerializable):
         self.parentGraph = parentGraph
 
         self._nodes = {}
+        self._tickNodes = OrderedDict()
         self._vars = {}
+        self._pins = {}
+        self._dirtyFrontier = set()
+        self._batchDepth = 0
+        self._batchLinks = []
+        self._batchPushPins = []
         self.uid = uuid.uuid4() if uid is None else uid
 
         manager.add(self)
@@ -115,6 +140,134 @@ class GraphBase(ISerializable):
         """
         return self._isRoot
 
+    @property
+    def topologyVersion(self):
+        return self.graphManager.topologyVersion
+
+    def bumpTopologyVersion(self):
+        """Marks topology of this graph tree as changed
+
+        Evaluation plans can cross compound boundaries, so one counter is kept by graph manager
+
+        .. seealso:: :meth:`~PyFlow.Core.GraphManager.GraphManager.bumpTopologyVersion`
+        """
+        self.graphManager.bumpTopologyVersion()
+
+    @contextmanager
+    def batch(self):
+        """Defers expensive bookkeeping while graph is being built
+
+        Inside this context connections are not checked for cycles, dirty propagation and
+        paths registration are postponed. When outermost batch exits, connections which close
+        a cycle are removed, dirty flags are propagated and paths are registered, each once.
+
+        Example:
+
+        >>> with graph.batch():
+        >>>     graph.addNode(node1)
+        >>>     graph.addNode(node2)
+        >>>     connectPins(node1["out"], node2["in"])
+
+        .. note:: Graph should not be evaluated inside batch, since data is not propagated yet
+        """
+        from PyFlow.Core.PathsRegistry import PathsRegistry
+
+        self._batchDepth += 1
+        PathsRegistry().suspend()
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._flushBatch()
+            PathsRegistry().resume()
+
+    def isBatching(self):
+        """Returns whether :meth:`~PyFlow.Core.GraphBase.GraphBase.batch` is in progress
+
+        :rtype: bool
+        """
+        return self._batchDepth > 0
+
+    def deferConnection(self, src, dst):
+        """Remembers connection made during batch to validate it later
+
+        .. warning:: Used internally
+        """
+        self._batchLinks.append((src, dst))
+
+    def deferPush(self, pin):
+        """Remembers pin to push dirty flags from when batch is finished
+
+        .. warning:: Used internally
+        """
+        self._batchPushPins.append(pin)
+
+    def _flushBatch(self):
+        links = self._batchLinks
+        pushPins = self._batchPushPins
+        self._batchLinks = []
+        self._batchPushPins = []
+
+        for src, dst in self._findCyclicLinks(links):
+            logger.warning("Connection {0} -> {1} creates a cycle and was removed".format(src.getFullName(), dst.getFullName()))
+            disconnectPins(src, dst)
+        # links which were part of cycle could not be ordered when connected
+        for src, dst in links:
+            if dst in src.affects:
+                updateTopologicalOrder(src, dst)
+
+        # same propagation as push, but pins reachable from several starts are visited once
+        visited = set()
+        stack = [pin for pin in pushPins if len(pin.affects) > 0]
+        while len(stack) > 0:
+            pin = stack.pop()
+            if pin in visited:
+                continue
+            visited.add(pin)
+            pin.invalidate()
+            stack.extend(pin.affects)
+
+    @staticmethod
+    def _findCyclicLinks(links):
+        """Depth first search over pins affection graph. For every cycle found,
+        latest of supplied links that belongs to it is returned and excluded from further search
+        """
+        candidates = dict((link, index) for index, link in enumerate(links))
+        if len(candidates) == 0:
+            return []
+        removed = set()
+        result = []
+        finished = set()
+        for start, _ in links:
+            if start in finished:
+                continue
+            path = [start]
+            onPath = {start}
+            iterators = [iter(list(start.affects))]
+            while len(iterators) > 0:
+                pin = path[-1]
+                nextPin = next(iterators[-1], None)
+                if nextPin is None:
+                    iterators.pop()
+                    onPath.discard(path.pop())
+                    finished.add(pin)
+                    continue
+                if (pin, nextPin) in removed or nextPin in finished:
+                    continue
+                if nextPin in onPath:
+                    # remove link which was made last
+                    cycle = path[path.index(nextPin):] + [nextPin]
+                    cycleLinks = [link for link in zip(cycle, cycle[1:]) if link in candidates]
+                    link = max(cycleLinks, key=lambda x: candidates[x])
+                    removed.add(link)
+                    result.append(link)
+                    continue
+                path.append(nextPin)
+                onPath.add(nextPin)
+                iterators.append(iter(list(nextPin.affects)))
+        return result
+
     def getVars(self):
         """Returns this graph's variables storage
 
@@ -189,8 +342,15 @@ class GraphBase(ISerializable):
         :param jsonData: serialized graph
         :type jsonData: dict
         """
+        from PyFlow.Core.PathsRegistry import PathsRegistry
+
+        with PathsRegistry().suspended():
+            self._populateFromJson(jsonData)
+
+    def _populateFromJson(self, jsonData):
         self.clear()
-        self.name = self.graphManager.getUniqGraphName(jsonData['name'])
+        if jsonData['name'] != self.name:
+            self.name = self.graphManager.getUniqGraphName(jsonData['name'])
         self.category = jsonData['category']
         self.setIsRoot(jsonData['isRoot'])
         if self.isRoot():
@@ -199,13 +359,16 @@ class GraphBase(ISerializable):
         for varJson in jsonData['vars']:
             var = Variable.deserialize(self, varJson)
             self._vars[var.uid] = var
+            self.graphManager.onVariableCreated(var)
         # restore nodes
         for nodeJson in jsonData['nodes']:
             # check if variable getter or setter and pass variable
             nodeArgs = ()
             nodeKwargs = {}
             if nodeJson['type'] in ('getVar', 'setVar'):
-                nodeKwargs['var'] = self._vars[uuid.UUID(nodeJson['varUid'])]
+                varUid = uuid.UUID(nodeJson['varUid'])
+                # accessors can use variables of parent graphs
+                nodeKwargs['var'] = self._vars[varUid] if varUid in self._vars else self.graphManager.findVariableByUid(varUid)
             nodeJson['owningGraphName'] = self.name
             node = getRawNodeInstance(nodeJson['type'], packageName=nodeJson['package'], libName=nodeJson['lib'], *nodeArgs, **nodeKwargs)
             self.addNode(node, nodeJson)
@@ -275,8 +438,12 @@ class GraphBase(ISerializable):
     def name(self, value):
         value = str(value)
         if self.__name != value:
+            oldName = self.__name
             self.__name = value
+            self.graphManager.onGraphRenamed(self, oldName)
             self.nameChanged.send(self.__name)
+            from PyFlow.Core.PathsRegistry import PathsRegistry
+            PathsRegistry().updateGraph(self)
 
     @property
     def category(self):
@@ -293,16 +460,86 @@ class GraphBase(ISerializable):
         :param deltaTime: Elapsed time since last tick
         :type deltaTime: float
         """
-        for node in self._nodes.values():
+        for node in list(self._tickNodes):
             node.Tick(deltaTime)
 
+    def getTickNodes(self):
+        """Returns nodes which are called by :meth:`Tick`
+
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        return list(self._tickNodes)
+
+    def onNodeTickChanged(self, node):
+        """Adds node to tick list or removes it from there
+
+        .. warning:: Used internally
+
+        :param node: Node which was added, killed or changed tick subscription
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        if node.uid in self._nodes and node.isTickEnabled():
+            self._tickNodes[node] = None
+        else:
+            self._tickNodes.pop(node, None)
+
+    def timeUntilTick(self):
+        """Time in seconds until nearest node needs tick
+
+        :returns: Smallest :meth:`~PyFlow.Core.NodeBase.NodeBase.timeUntilTick` of graph nodes or None if all nodes are idle
+        :rtype: float or None
+        """
+        result = None
+        for node in self._tickNodes:
+            nodeTime = node.timeUntilTick()
+            if nodeTime is not None and (result is None or nodeTime < result):
+                result = nodeTime
+        return result
+
     @property
     def pins(self):
-        result = {}
-        for n in self.getNodesList():
-            for pin in tuple(n.inputs.values()) + tuple(n.outputs.values()):
-                result[pin.uid] = pin
-        return result
+        return dict(self._pins)
+
+    def onPinCreated(self, pin):
+        """Registers pin in uid index
+
+        .. warning:: Used internally
+        """
+        self._pins[pin.uid] = pin
+        self.graphManager.onNodeModified(pin.owningNode())
+
+    def onPinKilled(self, pin):
+        """Removes pin from uid index
+
+        .. warning:: Used internally
+        """
+        if self._pins.get(pin.uid) is pin:
+            self._pins.pop(pin.uid)
+        self._dirtyFrontier.discard(pin)
+        self.graphManager.onNodeModified(pin.owningNode())
+
+    def getDirtyFrontier(self):
+        """Returns pins of this graph which were marked dirty by :func:`~PyFlow.Core.Common.push` and not recomputed since
+
+        Set is maintained during propagation, so it can be read without traversing the graph. It should not be modified.
+
+        :rtype: set(:class:`~PyFlow.Core.PinBase.PinBase`)
+        """
+        return self._dirtyFrontier
+
+    def onPinDirty(self, pin):
+        """Adds pin to dirty frontier
+
+        .. warning:: Used internally
+        """
+        self._dirtyFrontier.add(pin)
+
+    def onPinClean(self, pin):
+        """Removes pin from dirty frontier
+
+        .. warning:: Used internally
+        """
+        self._dirtyFrontier.discard(pin)
 
     def createVariable(self, dataType=str('AnyPin'), accessLevel=AccessLevel.public, uid=None, name=str("var")):
         """Creates variable inside this graph scope
@@ -319,6 +556,8 @@ class GraphBase(ISerializable):
         name = self.graphManager.getUniqVariableName(name)
         var = Variable(self, getPinDefaultValueByType(dataType), name, dataType, accessLevel=accessLevel, uid=uid)
         self._vars[var.uid] = var
+        self.graphManager.onVariableCreated(var)
+        self.variablesChanged.send(var)
         return var
 
     # TODO: add arguments to deal with references of this var
@@ -332,7 +571,9 @@ class GraphBase(ISerializable):
         assert(isinstance(var, Variable))
         if var.uid in self._vars:
             popped = self._vars.pop(var.uid)
+            self.graphManager.onVariableKilled(popped)
             popped.killed.send()
+            self.variablesChanged.send(popped)
 
     def getNodes(self):
         """Returns this graph's nodes storage
@@ -356,9 +597,9 @@ class GraphBase(ISerializable):
         :param name: Node name
         :type name: str or None
         """
-        for i in self._nodes.values():
-            if i.name == name:
-                return i
+        for node in self.graphManager.findNodes(name):
+            if node.graph() is self:
+                return node
         return None
 
     def getNodesByClassName(self, className):
@@ -380,10 +621,7 @@ class GraphBase(ISerializable):
         :type uid: :class:`~uuid.UUID`
         :rtype: :class:`~PyFlow.Core.PinBase.PinBase` or None
         """
-        pin = None
-        if uid in self.pins:
-            pin = self.pins[uid]
-        return pin
+        return self._pins.get(uid)
 
     def findPin(self, pinName):
         """Tries to find pin by name
@@ -392,12 +630,7 @@ class GraphBase(ISerializable):
         :type pinName: str
         :rtype: :class:`~PyFlow.Core.PinBase.PinBase` or None
         """
-        result = None
-        for pin in self.pins.values():
-            if pinName == pin.getFullName():
-                result = pin
-                break
-        return result
+        return self.graphManager.findPinByName(pinName, graph=self)
 
     def getInputNode(self):
         """Creates and adds to graph :class:`~PyFlow.Packages.PyFlowBase.Nodes.graphNodes.graphInputs` node
@@ -452,10 +685,39 @@ class GraphBase(ISerializable):
             node.setName(self.graphManager.getUniqNodeName(node.name))
 
         self._nodes[node.uid] = node
+        self.graphManager.onNodeAdded(node)
+        for pin in node.pins:
+            self.onPinCreated(pin)
         node.postCreate(jsonTemplate)
-        PathsRegistry().rebuild()
+        self.onNodeTickChanged(node)
+        self.bumpTopologyVersion()
+        PathsRegistry().insert(node)
+        self.nodeAdded.send(node)
         return True
 
+    def bulkLoad(self, nodes, links=None):
+        """Adds nodes and connects pins inside single :meth:`~PyFlow.Core.GraphBase.GraphBase.batch`
+
+        :param nodes: Nodes to add
+        :type nodes: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        :param links: Pairs of pins to connect
+        :type links: list(tuple(:class:`~PyFlow.Core.PinBase.PinBase`, :class:`~PyFlow.Core.PinBase.PinBase`))
+        :returns: Links which were not connected
+        :rtype: list(tuple(:class:`~PyFlow.Core.PinBase.PinBase`, :class:`~PyFlow.Core.PinBase.PinBase`))
+        """
+        links = list(links) if links is not None else []
+        failed = []
+        with self.batch():
+            for node in nodes:
+                self.addNode(node)
+            for src, dst in links:
+                if not connectPins(src, dst):
+                    failed.append((src, dst))
+        for src, dst in links:
+            if not arePinsConnected(src, dst) and (src, dst) not in failed:
+                failed.append((src, dst))
+        return failed
+
     def location(self):
         """Returns path to current location in graph tree
 
@@ -0,0 +1,369 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+"""
+.. sidebar:: **GraphFile.py**
+
+    Reading and writing of .pygraph files.
+
+Graph files can be stored as json or in compact binary format. Format is detected when file is read,
+so both kinds of files can be opened everywhere.
+
+Binary format starts with :data:`BINARY_MAGIC` and format version byte followed by single encoded value.
+Every value starts with tag byte. Strings are interned: first occurrence is stored inline and gets index,
+later occurrences are stored as index. Uuid strings are stored as 16 bytes.
+Small non negative integers are stored in tag byte itself. Dicts with already seen set of keys, such as pins,
+are stored as reference to that set followed by values.
+
+Binary format only makes files smaller, it holds exactly the same document as json does.
+Values which nodes and pins serialize as json strings themselves, such as pin values, stay json
+strings inside binary file.
+
+Loading is not incremental. Binary file is read in fixed size chunks while it is decoded, so raw bytes
+of whole file are not kept next to decoded data, but whole document is decoded into dict first,
+same as json loading does, and graph is deserialized from that dict afterwards.
+
+Module works with python 2 and 3. File which ends in the middle of value raises
+``ValueError("truncated graph file")``.
+"""
+
+import io
+import re
+import json
+import uuid
+import struct
+
+from nine import IS_PYTHON2, str, basestring, integer_types
+
+
+BINARY_MAGIC = b"PFGB"
+BINARY_FORMAT_VERSION = 1
+
+# longer strings are not interned, they are rarely repeated
+MAX_INTERNED_STRING_LENGTH = 256
+
+_CHUNK_SIZE = 1 << 16
+
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03
+_FLOAT = 0x04
+_STRING = 0x05
+_STRING_REF = 0x06
+_UUID = 0x07
+_LIST = 0x08
+_DICT = 0x09
+_RECORD = 0x0a
+# tags starting from this one hold small integers
+_SMALL_INT = 0x80
+
+_DOUBLE = struct.Struct("<d")
+# tag, ten bytes of varint, or tag and uuid
+_MAX_HEADER_SIZE = 17
+_UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+class _Encoder(object):
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = bytearray()
+        self.strings = {}
+        self.shapes = {}
+
+    def flush(self):
+        self.stream.write(bytes(self.buffer))
+        del self.buffer[:]
+
+    def writeVarint(self, value):
+        buffer = self.buffer
+        while value >= 0x80:
+            buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def writeString(self, value):
+        if IS_PYTHON2 and not isinstance(value, str):
+            # native str literals, such as keys, are byte strings in python 2
+            value = value.decode("utf-8")
+        index = self.strings.get(value)
+        if index is not None:
+            self.buffer.append(_STRING_REF)
+            self.writeVarint(index)
+            return
+        if len(value) == 36 and _UUID_PATTERN.match(value):
+            self.buffer.append(_UUID)
+            self.buffer.extend(uuid.UUID(value).bytes)
+            self.strings[value] = len(self.strings)
+            return
+        raw = value.encode("utf-8")
+        self.buffer.append(_STRING)
+        self.writeVarint(len(raw))
+        self.buffer.extend(raw)
+        if len(raw) <= MAX_INTERNED_STRING_LENGTH:
+            self.strings[value] = len(self.strings)
+
+    def writeValue(self, value):
+        buffer = self.buffer
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, basestring):
+            self.writeString(value)
+        elif isinstance(value, integer_types):
+            if 0 <= value < 0x100 - _SMALL_INT:
+                buffer.append(_SMALL_INT + value)
+            else:
+                buffer.append(_INT)
+                # zigzag, so negative numbers stay short
+                self.writeVarint(value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer.extend(_DOUBLE.pack(value))
+        elif isinstance(value, dict):
+            self.writeDict(value)
+        elif isinstance(value, (list, tuple)):
+            buffer.append(_LIST)
+            self.writeVarint(len(value))
+            for item in value:
+                self.writeValue(item)
+            if len(buffer) >= _CHUNK_SIZE:
+                self.flush()
+        else:
+            raise TypeError("Object of type {} can not be stored in graph file".format(type(value).__name__))
+
+    def writeDict(self, value):
+        keys = tuple(value.keys())
+        shapeIndex = self.shapes.get(keys)
+        if shapeIndex is not None:
+            # keys are known, store values only
+            self.buffer.append(_RECORD)
+            self.writeVarint(shapeIndex)
+            for item in value.values():
+                self.writeValue(item)
+        else:
+            self.buffer.append(_DICT)
+            self.writeVarint(len(value))
+            for key, item in value.items():
+                self.writeValue(key)
+                self.writeValue(item)
+            # registered after items, same as decoder does. Nested dict with same keys
+            # could already register this shape
+            if len(keys) > 0 and keys not in self.shapes and all(isinstance(key, basestring) for key in keys):
+                self.shapes[keys] = len(self.shapes)
+        if len(self.buffer) >= _CHUNK_SIZE:
+            self.flush()
+
+
+def _refill(stream, buffer, position, size):
+    """Returns buffer which has at least size bytes after position, unless stream is exhausted
+
+    Buffer is bytearray, so indexing gives integers in python 2 as well
+    """
+    rest = buffer[position:]
+    return rest + bytearray(stream.read(max(size - len(rest), _CHUNK_SIZE))), 0
+
+
+def _decode(stream, buffer):
+    # Single loop with local state instead of recursive calls, this is hot path of loading.
+    # Containers being filled are kept on stack as [items, remaining, tag, shape]
+    strings = []
+    shapes = []
+    knownShapes = set()
+    stack = []
+    position = 0
+    unpackDouble = _DOUBLE.unpack_from
+    while True:
+        if position + _MAX_HEADER_SIZE > len(buffer):
+            buffer, position = _refill(stream, buffer, position, _MAX_HEADER_SIZE)
+            if position >= len(buffer):
+                raise ValueError("truncated graph file")
+        tag = buffer[position]
+        position += 1
+
+        if tag >= _SMALL_INT:
+            value = tag - _SMALL_INT
+        elif tag == _STRING_REF or tag == _STRING or tag == _RECORD or tag == _LIST or tag == _DICT or tag == _INT:
+            # tags followed by varint. Buffer has at least _MAX_HEADER_SIZE bytes here unless
+            # stream is exhausted, so only fixed size payloads need to be checked
+            if position >= len(buffer):
+                raise ValueError("truncated graph file")
+            number = buffer[position]
+            position += 1
+            if number >= 0x80:
+                number &= 0x7f
+                shift = 7
+                while True:
+                    if position >= len(buffer):
+                        buffer, position = _refill(stream, buffer, position, 1)
+                        if position >= len(buffer):
+                            raise ValueError("truncated graph file")
+                    byte = buffer[position]
+                    position += 1
+                    number |= (byte & 0x7f) << shift
+                    if byte < 0x80:
+                        break
+                    shift += 7
+
+            if tag == _STRING_REF:
+                value = strings[number]
+            elif tag == _STRING:
+                if position + number > len(buffer):
+                    buffer, position = _refill(stream, buffer, position, number)
+                    if position + number > len(buffer):
+                        raise ValueError("truncated graph file")
+                value = buffer[position:position + number].decode("utf-8")
+                position += number
+                if number <= MAX_INTERNED_STRING_LENGTH:
+                    strings.append(value)
+            elif tag == _INT:
+                value = number >> 1 if number & 1 == 0 else -((number + 1) >> 1)
+            elif tag == _RECORD:
+                shape = shapes[number]
+                stack.append([[], len(shape), tag, shape])
+                continue
+            elif number > 0:
+                stack.append([[], number * 2 if tag == _DICT else number, tag, None])
+                continue
+            else:
+                value = {} if tag == _DICT else []
+        elif tag == _UUID:
+            if position + 16 > len(buffer):
+                raise ValueError("truncated graph file")
+            value = str(uuid.UUID(bytes=bytes(buffer[position:position + 16])))
+            position += 16
+            strings.append(value)
+        elif tag == _NONE:
+            value = None
+        elif tag == _TRUE:
+            value = True
+        elif tag == _FALSE:
+            value = False
+        elif tag == _FLOAT:
+            if position + 8 > len(buffer):
+                raise ValueError("truncated graph file")
+            value = unpackDouble(buffer, position)[0]
+            position += 8
+        else:
+            raise ValueError("Unknown tag {} in graph file".format(tag))
+
+        # pass value to containers, closing the ones which are complete
+        while True:
+            if len(stack) == 0:
+                return value
+            top = stack[-1]
+            top[0].append(value)
+            top[1] -= 1
+            if top[1] > 0:
+                break
+            stack.pop()
+            items, remaining, containerTag, shape = top
+            if containerTag == _LIST:
+                value = items
+            elif containerTag == _RECORD:
+                value = dict(zip(shape, items))
+            else:
+                keys = tuple(items[::2])
+                value = dict(zip(keys, items[1::2]))
+                if keys not in knownShapes and all(isinstance(key, str) for key in keys):
+                    knownShapes.add(keys)
+                    shapes.append(keys)
+
+
+def dumpBinary(data, stream):
+    """Writes data to binary stream in compact format
+
+    :param data: Serialized graph
+    :type data: dict
+    :param stream: Binary stream opened for writing
+    """
+    encoder = _Encoder(stream)
+    encoder.buffer.extend(BINARY_MAGIC)
+    encoder.buffer.append(BINARY_FORMAT_VERSION)
+    encoder.writeValue(data)
+    encoder.flush()
+
+
+def loadBinary(stream):
+    """Reads data written by :func:`dumpBinary`
+
+    :param stream: Binary stream opened for reading
+    :rtype: dict
+    """
+    header = bytearray(stream.read(len(BINARY_MAGIC) + 1))
+    if header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError("Not a binary graph file")
+    if len(header) <= len(BINARY_MAGIC):
+        raise ValueError("truncated graph file")
+    formatVersion = header[len(BINARY_MAGIC)]
+    if formatVersion > BINARY_FORMAT_VERSION:
+        raise ValueError("Graph file format version {} is not supported".format(formatVersion))
+    return _decode(stream, bytearray())
+
+
+def isBinaryGraphFile(filePath):
+    """Checks whether file is stored in binary format
+
+    :param filePath: Path to graph file
+    :type filePath: str
+    :rtype: bool
+    """
+    with open(filePath, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def readGraphFile(filePath):
+    """Reads graph file of any format
+
+    Whole document is decoded before it is returned, see module description
+
+    :param filePath: Path to graph file
+    :type filePath: str
+    :returns: Serialized graph
+    :rtype: dict
+    """
+    # io.open gives file object which TextIOWrapper accepts in python 2 too
+    with io.open(filePath, "rb") as f:
+        if f.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            f.seek(0)
+            return loadBinary(f)
+        f.seek(0)
+        text = io.TextIOWrapper(f)
+        try:
+            return json.load(text)
+        finally:
+            # file is closed by outer context
+            text.detach()
+
+
+def writeGraphFile(filePath, data, binary=False):
+    """Writes graph file
+
+    :param filePath: Path to graph file
+    :type filePath: str
+    :param data: Serialized graph
+    :type data: dict
+    :param binary: Whether to use compact binary format instead of json
+    :type binary: bool
+    """
+    if binary:
+        with open(filePath, "wb") as f:
+            dumpBinary(data, f)
+    else:
+        with open(filePath, "w") as f:
+            json.dump(data, f, indent=4)
@@ -15,6 +15,7 @@
 
 from nine import str
 from blinker import Signal
+from collections import OrderedDict
 
 from PyFlow.Core.GraphBase import GraphBase
 from PyFlow.Core.Common import *
@@ -33,8 +34,18 @@ class GraphManager(object):
     def __init__(self):
         super(GraphManager, self).__init__()
         self.terminationRequested = False  #: used by cli only
+        self._topologyVersion = 0
         self.graphChanged = Signal(object)
+        #: Sent with node when node was added, killed or changed in a way that affects its serialization
+        self.nodeModified = Signal(object)
         self._graphs = {}
+        # lookup indexes, kept in sync by graphs, nodes and variables
+        self._graphNames = NamesIndex()
+        self._nodeNames = NamesIndex()
+        self._variableNames = NamesIndex()
+        self._variables = {}
+        # compound node -> (node names, variable uids) of inner graph which is still serialized
+        self._unloadedCompounds = OrderedDict()
         self._activeGraph = None
         self._activeGraph = GraphBase(ROOT_GRAPH_NAME, self)
         self._activeGraph.setIsRoot(True)
@@ -45,12 +56,27 @@ class GraphManager(object):
         :rtype: :class:`~PyFlow.Core.GraphBase.GraphBase`
         """
         roots = []
-        for graph in self.getAllGraphs():
+        for graph in self.getAllGraphs(bLoadedOnly=True):
             if graph.isRoot():
                 roots.append(graph)
         assert(len(roots) == 1), "Fatal! Multiple roots!"
         return roots[0]
 
+    @property
+    def topologyVersion(self):
+        """Counter which is incremented every time nodes or connections are added or removed in any graph
+
+        :rtype: int
+        """
+        return self._topologyVersion
+
+    def bumpTopologyVersion(self):
+        """Marks topology of graphs as changed
+
+        .. seealso:: :meth:`~PyFlow.Core.EvaluationEngine.DefaultEvaluationEngine_Impl.getEvaluationPlan`
+        """
+        self._topologyVersion += 1
+
     def selectRootGraph(self):
         """Selects root graph
         """
@@ -79,6 +105,7 @@ class GraphManager(object):
         if graph is not None:
             graph.clear()
             self._graphs.pop(graph.uid)
+            self._graphNames.remove(graph.name, graph)
             if graph.parentGraph is not None:
                 if graph in graph.parentGraph.childGraphs:
                     graph.parentGraph.childGraphs.remove(graph)
@@ -93,6 +120,7 @@ class GraphManager(object):
         if graph.uid in self._graphs:
             graph.clear()
             self._graphs.pop(graph.uid)
+            self._graphNames.remove(graph.name, graph)
             if graph.parentGraph is not None:
                 if graph in graph.parentGraph.childGraphs:
                     graph.parentGraph.childGraphs.remove(graph)
@@ -125,6 +153,11 @@ class GraphManager(object):
         self.removeGraphByName(ROOT_GRAPH_NAME)
         self._graphs.clear()
         self._graphs = {}
+        self._graphNames.clear()
+        self._nodeNames.clear()
+        self._variableNames.clear()
+        self._variables.clear()
+        self._unloadedCompounds.clear()
         del self._activeGraph
         self._activeGraph = None
         if keepRoot:
@@ -141,15 +174,31 @@ class GraphManager(object):
         for graph in self._graphs.values():
             graph.Tick(deltaTime)
 
+    def timeUntilTick(self):
+        """Time in seconds until nearest node in any graph needs tick
+
+        :returns: Smallest :meth:`~PyFlow.Core.GraphBase.GraphBase.timeUntilTick` of all graphs or None if all graphs are idle
+        :rtype: float or None
+        """
+        result = None
+        for graph in self._graphs.values():
+            graphTime = graph.timeUntilTick()
+            if graphTime is not None and (result is None or graphTime < result):
+                result = graphTime
+        return result
+
     def findVariableRefs(self, variable):
         """Returns a list of variable accessors spawned across all graphs
 
+        Compounds which have accessors in serialized inner graph are loaded
+
         :param variable: Variable to search accessors for
         :type variable: :class:`~PyFlow.Core.Variable.Variable`
         :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
         """
+        self.loadCompounds(lambda nodeNames, variableUids, variableNames: str(variable.uid) in variableUids)
         result = []
-        for node in self.getAllNodes(classNameFilters=['getVar', 'setVar']):
+        for node in self.getAllNodes(classNameFilters=['getVar', 'setVar'], bLoadedOnly=True):
             if node.variableUid() == variable.uid:
                 result.append(node)
         return result
@@ -161,38 +210,64 @@ class GraphManager(object):
         :type name: str
         :rtype: :class:`~PyFlow.Core.GraphBase.GraphBase` or None
         """
-        graphs = self.getGraphsDict()
-        if name in graphs:
-            return graphs[name]
-        return None
-
-    def findPinByName(self, pinFullName):
+        graph = self._graphNames.get(name)
+        if graph is None:
+            # graph of compound node could be not loaded yet
+            node = self.findNode(name)
+            if node is not None and node.isCompoundNode and not node.isGraphLoaded():
+                graph = node.rawGraph
+        return graph
+
+    def findPinByName(self, pinFullName, graph=None):
         """Tries to find pin by name across all graphs
 
         :param pinFullName: Full name of pin including node namespace
         :type pinFullName: str
+        :param graph: If specified, only nodes of this graph will be considered
+        :type graph: :class:`~PyFlow.Core.GraphBase.GraphBase` or None
         :rtype: :class:`~PyFlow.Core.PinBase.PinBase` or None
         """
-        result = None
-        for graph in self.getAllGraphs():
-            result = graph.findPin(pinFullName)
-            if result is not None:
-                break
-        return result
+        # full name is node name and pin name joined with underscore, both can contain underscores
+        separatorIndex = pinFullName.find('_')
+        while separatorIndex != -1:
+            nodeName = pinFullName[:separatorIndex]
+            pinName = pinFullName[separatorIndex + 1:]
+            for node in self._nodeNames.getAll(nodeName):
+                if graph is not None and node.graph() is not graph:
+                    continue
+                if pinName in node.namePinInputsMap:
+                    return node.namePinInputsMap[pinName]
+                if pinName in node.namePinOutputsMap:
+                    return node.namePinOutputsMap[pinName]
+            separatorIndex = pinFullName.find('_', separatorIndex + 1)
+        return None
 
     def findNode(self, name):
         """Finds a node across all graphs
 
+        If node is not created yet, because it is part of serialized compound graph, compound is loaded
+
         :param name: Node name to search by
         :type name: str
         :rtype: :class:`~PyFlow.Core.NodeBase.NodeBase`
         """
-        result = None
-        for graph in self.getAllGraphs():
-            result = graph.findNode(name)
-            if result is not None:
-                break
-        return result
+        node = self._nodeNames.get(name)
+        if node is None and self._nodeNames.isTaken(name):
+            self.loadCompounds(lambda nodeNames, variableUids, variableNames: name in nodeNames)
+            node = self._nodeNames.get(name)
+        return node
+
+    def findNodes(self, name):
+        """Returns all nodes with given name across all graphs
+
+        Compounds which have node with this name in serialized inner graph are loaded
+
+        :param name: Node name to search by
+        :type name: str
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        self.loadCompounds(lambda nodeNames, variableUids, variableNames: name in nodeNames)
+        return self._nodeNames.getAll(name)
 
     def findVariableByUid(self, uuid):
         """Finds a variable across all graphs
@@ -201,25 +276,32 @@ class GraphManager(object):
         :type uuid: :class:`~uuid.UUID`
         :rtype: :class:`~PyFlow.Core.Variable.Variable` or None
         """
+        result = self._variables.get(uuid)
+        if result is not None and result.uid == uuid:
+            return result
+        # variable uid was changed after registration
         result = None
         for graph in self._graphs.values():
             if uuid in graph.getVars():
                 result = graph.getVars()[uuid]
+                self._variables[uuid] = result
                 break
         return result
 
     def findVariableByName(self, name):
         """Finds a variable across all graphs
 
+        If variable is not created yet, because it is part of serialized compound graph, compound is loaded
+
         :param name: Variable name
         :type name: str
         :rtype: :class:`~PyFlow.Core.Variable.Variable` or None
         """
-        for graph in self._graphs.values():
-            for var in graph.getVars().values():
-                if var.name == name:
-                    return var
-        return None
+        variable = self._variableNames.get(name)
+        if variable is None and self._variableNames.isTaken(name):
+            self.loadCompounds(lambda nodeNames, variableUids, variableNames: name in variableNames)
+            variable = self._variableNames.get(name)
+        return variable
 
     def location(self):
         """Returns location of active graph
@@ -236,8 +318,8 @@ class GraphManager(object):
         :rtype: dict(str, :class:`~PyFlow.Core.GraphBase.GraphBase`)
         """
         result = {}
-        for graph in self.getAllGraphs():
-            result[graph.name] = graph
+        for name in self._graphNames.names():
+            result[name] = self._graphNames.get(name)
         return result
 
     def add(self, graph):
@@ -248,6 +330,73 @@ class GraphManager(object):
         """
         graph.name = self.getUniqGraphName(graph.name)
         self._graphs[graph.uid] = graph
+        self._graphNames.add(graph.name, graph)
+
+    def onGraphRenamed(self, graph, oldName):
+        """Updates graphs index
+
+        .. warning:: Used internally
+        """
+        if graph.uid in self._graphs:
+            self._graphNames.rename(oldName, graph.name, graph)
+
+    def onNodeAdded(self, node):
+        """Registers node in names index
+
+        .. warning:: Used internally
+        """
+        self._nodeNames.add(node.name, node)
+        self.onNodeModified(node)
+
+    def onNodeKilled(self, node):
+        """Removes node from names index
+
+        .. warning:: Used internally
+        """
+        self._nodeNames.remove(node.name, node)
+        self.onNodeModified(node)
+
+    def onNodeRenamed(self, node, oldName):
+        """Updates names index
+
+        .. warning:: Used internally
+        """
+        self._nodeNames.rename(oldName, node.name, node)
+        self.onNodeModified(node)
+
+    def onNodeModified(self, node):
+        """Sends :attr:`nodeModified`
+
+        .. warning:: Used internally
+        """
+        if node.graph is not None and node.graph() is not None:
+            node.graph().nodeModified.send(node)
+        self.nodeModified.send(node)
+
+    def onVariableCreated(self, variable):
+        """Registers variable in uid and names indexes
+
+        .. warning:: Used internally
+        """
+        self._variables[variable.uid] = variable
+        self._variableNames.add(variable.name, variable)
+
+    def onVariableKilled(self, variable):
+        """Removes variable from uid and names indexes
+
+        .. warning:: Used internally
+        """
+        if self._variables.get(variable.uid) is variable:
+            self._variables.pop(variable.uid)
+        self._variableNames.remove(variable.name, variable)
+
+    def onVariableRenamed(self, variable, oldName):
+        """Updates variables names index
+
+        .. warning:: Used internally
+        """
+        if self._variables.get(variable.uid) is variable:
+            self._variableNames.rename(oldName, variable.name, variable)
 
     def activeGraph(self):
         """Returns active graph
@@ -262,11 +411,9 @@ class GraphManager(object):
         :param name: Name of target graph
         :type name: str
         """
-        graphs = self.getGraphsDict()
-        if name in graphs:
+        newGraph = self.findGraph(name)
+        if newGraph is not None:
             if name != self.activeGraph().name:
-                oldGraph = self.activeGraph()
-                newGraph = graphs[name]
                 self._activeGraph = newGraph
                 self.graphChanged.send(self.activeGraph())
 
@@ -276,43 +423,50 @@ class GraphManager(object):
         :param graph: Target graph
         :type graph: :class:`~PyFlow.Core.GraphBase.GraphBase`
         """
-        for newGraph in self.getAllGraphs():
-            if newGraph.name == graph.name:
-                if newGraph.name != self.activeGraph().name:
-                    oldGraph = self.activeGraph()
-                    self._activeGraph = newGraph
-                    self.graphChanged.send(self.activeGraph())
-                    break
+        newGraph = self._graphNames.get(graph.name)
+        if newGraph is not None:
+            if newGraph.name != self.activeGraph().name:
+                oldGraph = self.activeGraph()
+                self._activeGraph = newGraph
+                self.graphChanged.send(self.activeGraph())
 
-    def getAllGraphs(self):
+    def getAllGraphs(self, bLoadedOnly=True):
         """Returns all graphs
 
+        :param bLoadedOnly: If False, serialized graphs of compounds are loaded and returned too
+        :type bLoadedOnly: bool
         :rtype: list(:class:`~PyFlow.Core.GraphBase.GraphBase`)
         """
+        if not bLoadedOnly:
+            self.loadCompounds()
         return [g for g in self._graphs.values()]
 
-    def getAllNodes(self, classNameFilters=[]):
+    def getAllNodes(self, classNameFilters=[], bLoadedOnly=True):
         """Returns all nodes across all graphs
 
         :param classNameFilters: If class name filters specified, only those node classes will be considered
         :type classNameFilters: list(str)
+        :param bLoadedOnly: If False, serialized graphs of compounds are loaded and their nodes are returned too
+        :type bLoadedOnly: bool
         :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
         """
         allNodes = []
-        for graph in self.getAllGraphs():
+        for graph in self.getAllGraphs(bLoadedOnly):
             if len(classNameFilters) == 0:
                 allNodes.extend(list(graph.getNodes().values()))
             else:
                 allNodes.extend([node for node in graph.getNodes().values() if node.__class__.__name__ in classNameFilters])
         return allNodes
 
-    def getAllVariables(self):
+    def getAllVariables(self, bLoadedOnly=True):
         """Returns a list of all variables
 
+        :param bLoadedOnly: If False, serialized graphs of compounds are loaded and their variables are returned too
+        :type bLoadedOnly: bool
         :rtype: list(:class:`~PyFlow.Core.Variable.Variable`)
         """
         result = []
-        for graph in self.getAllGraphs():
+        for graph in self.getAllGraphs(bLoadedOnly):
             result.extend(list(graph.getVars().values()))
         return result
 
@@ -337,7 +491,8 @@ class GraphManager(object):
     def getAllNames(self):
         """Returns list of all registered names
 
-        Includes graphs, nodes, pins, variables names
+        Includes graphs, nodes, pins, variables names. Serialized graphs of compounds are not loaded,
+        names of their nodes and variables are taken from serialized data
 
         :rtype: list(str)
         """
@@ -346,6 +501,8 @@ class GraphManager(object):
         existingNames.extend([var.name for var in self.getAllVariables()])
         for node in self.getAllNodes():
             existingNames.extend([pin.name for pin in node.pins])
+        existingNames.extend(self._nodeNames.reservedNames())
+        existingNames.extend(self._variableNames.reservedNames())
         return existingNames
 
     def getUniqName(self, name):
@@ -365,8 +522,7 @@ class GraphManager(object):
         :type name: str
         :rtype: str
         """
-        existingNames = [g.name for g in self.getAllGraphs()]
-        return getUniqNameFromList(existingNames, name)
+        return self._graphNames.getUniqName(name)
 
     def getUniqNodeName(self, name):
         """Returns unique node name
@@ -375,8 +531,86 @@ class GraphManager(object):
         :type name: str
         :rtype: str
         """
-        existingNames = [n.name for n in self.getAllNodes()]
-        return getUniqNameFromList(existingNames, name)
+        return self._nodeNames.getUniqName(name)
+
+    def reserveNodeNames(self, names):
+        """Prevents names of nodes which are not created yet from being given to other nodes
+
+        Used by compounds which keep inner graph serialized. Every call should be paired with :meth:`releaseNodeNames`
+
+        .. warning:: Used internally
+
+        :param names: Node names
+        :type names: list(str)
+        """
+        for name in names:
+            self._nodeNames.reserve(name)
+
+    def releaseNodeNames(self, names):
+        """Releases names reserved by :meth:`reserveNodeNames`
+
+        .. warning:: Used internally
+
+        :param names: Node names
+        :type names: list(str)
+        """
+        for name in names:
+            self._nodeNames.release(name)
+
+    def addUnloadedCompound(self, node, nodeNames, variableUids, variableNames=[]):
+        """Registers compound which keeps inner graph serialized
+
+        Node and variable names are reserved. Lookups by these names or variable uids load compound,
+        see :meth:`loadCompounds`. Every call should be paired with :meth:`removeUnloadedCompound`
+
+        .. warning:: Used internally
+
+        :param node: Compound node
+        :type node: :class:`~PyFlow.Packages.PyFlowBase.Nodes.compound.compound`
+        :param nodeNames: Names of serialized nodes, including nested compounds
+        :type nodeNames: list(str)
+        :param variableUids: Uids of variables referenced by serialized nodes
+        :type variableUids: list(str)
+        :param variableNames: Names of serialized variables, including ones of nested compounds
+        :type variableNames: list(str)
+        """
+        self.reserveNodeNames(nodeNames)
+        for name in variableNames:
+            self._variableNames.reserve(name)
+        self._unloadedCompounds[node] = (set(nodeNames), set(variableUids), set(variableNames))
+
+    def removeUnloadedCompound(self, node):
+        """Unregisters compound registered with :meth:`addUnloadedCompound`
+
+        .. warning:: Used internally
+
+        :param node: Compound node
+        :type node: :class:`~PyFlow.Packages.PyFlowBase.Nodes.compound.compound`
+        """
+        entry = self._unloadedCompounds.pop(node, None)
+        if entry is not None:
+            nodeNames, variableUids, variableNames = entry
+            self.releaseNodeNames(nodeNames)
+            for name in variableNames:
+                self._variableNames.release(name)
+
+    def loadCompounds(self, predicate=None):
+        """Loads serialized graphs of compounds
+
+        Loading is repeated for nested compounds until nothing matches
+
+        :param predicate: Called with node names, referenced variable uids and variable names of serialized graph,
+            compound is loaded if it returns True. All compounds are loaded if not specified
+        :type predicate: callable or None
+        """
+        while len(self._unloadedCompounds) > 0:
+            compounds = [node for node, entry in self._unloadedCompounds.items()
+                         if predicate is None or predicate(*entry)]
+            if len(compounds) == 0:
+                break
+            for node in compounds:
+                node.loadGraph()
+                self.removeUnloadedCompound(node)
 
     def getUniqVariableName(self, name):
         """Returns unique variable name
@@ -385,8 +619,7 @@ class GraphManager(object):
         :type name: str
         :rtype: str
         """
-        existingNames = [var.name for var in self.getAllVariables()]
-        return getUniqNameFromList(existingNames, name)
+        return self._variableNames.getUniqName(name)
 
     def plot(self):
         """Prints all data to console. May be useful for debugging
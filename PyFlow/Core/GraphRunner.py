@@ -0,0 +1,114 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+"""
+.. sidebar:: **GraphRunner.py**
+
+    Main loop used to run graphs without editor.
+
+Instead of ticking graphs with fixed rate forever, :class:`GraphRunner` asks
+:meth:`~PyFlow.Core.GraphManager.GraphManager.timeUntilTick` when next node needs tick,
+sleeps until that moment and ticks graphs with real elapsed time.
+Loop exits when no node waits for tick or when :attr:`~PyFlow.Core.GraphManager.GraphManager.terminationRequested` is set.
+"""
+
+import time
+
+
+class GraphRunner(object):
+    """Runs graph manager until graphs are quiescent
+
+    :param manager: Graph manager to run
+    :type manager: :class:`~PyFlow.Core.GraphManager.GraphManager`
+    :param maxRate: Maximum number of ticks per second. None means no limit
+    :type maxRate: float or None
+    :param realTime: If False, loop does not sleep and time is simulated, ticks advance straight to next deadline.
+        Useful for batch replay
+    :type realTime: bool
+
+    :var time: Time elapsed since run started. Simulated time if not in real time mode
+    :var ticks: Number of ticks done
+    """
+    #: Smallest time step in simulated mode, so time advances even if nodes need every tick
+    minSimulatedStep = 0.001
+
+    def __init__(self, manager, maxRate=50.0, realTime=True):
+        self.manager = manager
+        self.maxRate = maxRate
+        self.realTime = realTime
+        self.time = 0.0
+        self.ticks = 0
+        self._lastTickTime = time.time()
+
+    @property
+    def minInterval(self):
+        """Minimal time between two ticks in seconds
+
+        :rtype: float
+        """
+        if self.maxRate is None or self.maxRate <= 0:
+            return 0.0
+        return 1.0 / self.maxRate
+
+    def step(self, maxWait=None):
+        """Waits until next deadline and ticks graphs once
+
+        :param maxWait: Tick not later than this number of seconds even if nothing is due yet
+        :type maxWait: float or None
+        :returns: False if graphs are quiescent or termination requested, True otherwise
+        :rtype: bool
+        """
+        if self.manager.terminationRequested:
+            return False
+        wait = self.manager.timeUntilTick()
+        if wait is None:
+            return False
+        wait = max(wait, self.minInterval)
+        if not self.realTime:
+            wait = max(wait, self.minSimulatedStep)
+        if maxWait is not None:
+            wait = min(wait, maxWait)
+
+        if self.realTime:
+            deadline = self._lastTickTime + wait
+            now = time.time()
+            if deadline > now:
+                time.sleep(deadline - now)
+                now = time.time()
+            delta = now - self._lastTickTime
+            self._lastTickTime = now
+        else:
+            delta = wait
+
+        self.time += delta
+        self.ticks += 1
+        self.manager.Tick(delta)
+        return True
+
+    def run(self, timeout=None):
+        """Ticks graphs until they are quiescent
+
+        :param timeout: Stop after this number of seconds even if graphs are still active. Simulated seconds if not in real time mode
+        :type timeout: float or None
+        :returns: True if graphs became quiescent or termination was requested, False if timeout is reached
+        :rtype: bool
+        """
+        self.time = 0.0
+        self.ticks = 0
+        self._lastTickTime = time.time()
+        while timeout is None or self.time < timeout:
+            if not self.step(None if timeout is None else timeout - self.time):
+                return True
+        return False
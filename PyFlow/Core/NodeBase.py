@@ -25,13 +25,20 @@ try:
     from inspect import getfullargspec as getargspec
 except:
     from inspect import getargspec
-from types import MethodType
-import collections
+try:
+    from types import MappingProxyType
+except ImportError:
+    # python 2 has no read only dict views
+    def MappingProxyType(mapping):
+        return mapping
 
 from PyFlow import getPinDefaultValueByType
+from PyFlow import findPinClassByType
 from PyFlow import getRawNodeInstance
 from PyFlow.Core.Common import *
 from PyFlow.Core.Interfaces import INode
+from PyFlow.Core.NodeCache import NodeCache, makeCacheKey, copyCachedValue
+from PyFlow.Core.FunctionLibrary import callVectorized
 from PyFlow import CreateRawPin
 
 
@@ -61,17 +68,104 @@ class NodePinsSuggestionsHelper(object):
         self.outputStructs.add(struct)
 
 
+# number pin types and array pin types they are replaced with in vectorized mode
+_VECTORIZED_PIN_TYPES = {
+    'FloatPin': 'FloatArrayPin',
+    'IntPin': 'IntArrayPin',
+    'AnyPin': 'FloatArrayPin',
+}
+
+
+class _FunctionPinSpec(object):
+    """Pin description parsed from function annotation
+
+    Parsed once per function and reused by all nodes of it.
+
+    .. warning:: Used internally
+
+    :param name: Argument name or 'out' for return value
+    :param pinDescriptionTuple: Annotation, (dataType, defaultValue) or (dataType, defaultValue, pinDict)
+    :param direction: Pin direction
+    :param bReference: Whether pin is reference output
+    """
+    def __init__(self, name, pinDescriptionTuple, direction, bReference=False):
+        self.name = name
+        self.direction = direction
+        self.bReference = bReference
+        self.dataType = pinDescriptionTuple[0]
+        self.defaultValue = pinDescriptionTuple[1]
+        self.pinDict = pinDescriptionTuple[2] if len(pinDescriptionTuple) == 3 else None
+        pinDict = self.pinDict if self.pinDict is not None else {}
+        self.supportedDataTypes = pinDict.get(PinSpecifires.SUPPORTED_DATA_TYPES)
+        self.constraint = pinDict.get(PinSpecifires.CONSTRAINT)
+        self.structConstraint = pinDict.get(PinSpecifires.STRUCT_CONSTRAINT)
+        self.optionsToEnable = pinDict.get(PinSpecifires.ENABLED_OPTIONS)
+        self.optionsToDisable = pinDict.get(PinSpecifires.DISABLED_OPTIONS)
+        self.inputWidgetVariant = pinDict.get(PinSpecifires.INPUT_WIDGET_VARIANT, "DefaultWidget")
+        self.description = pinDict.get("Description")
+        self.bArray = isinstance(self.defaultValue, list)
+
+
+def _createFunctionPin(node, spec):
+    """Creates value pin of function based node
+
+    .. warning:: Used internally
+
+    :param node: Node to create pin on
+    :param spec: Parsed annotation
+    :type spec: :class:`_FunctionPinSpec`
+    :rtype: :class:`~PyFlow.Core.PinBase.PinBase`
+    """
+    if spec.direction == PinDirection.Input:
+        pin = node.createInputPin(spec.name, spec.dataType, supportedPinDataTypes=spec.supportedDataTypes, constraint=spec.constraint, structConstraint=spec.structConstraint)
+    else:
+        pin = node.createOutputPin(spec.name, spec.dataType, None if spec.bReference else spec.defaultValue, supportedPinDataTypes=spec.supportedDataTypes, constraint=spec.constraint, structConstraint=spec.structConstraint)
+    pin.annotationDescriptionDict = copy(spec.pinDict) if spec.pinDict is not None else None
+    if spec.description is not None:
+        pin.description = spec.description
+    if spec.direction == PinDirection.Input:
+        pin.initAsArray(spec.bArray)
+        pin.setData(spec.defaultValue)
+        pin.setDefaultValue(spec.defaultValue)
+    elif spec.bReference:
+        pin.initAsArray(spec.bArray)
+        pin.setDefaultValue(spec.defaultValue)
+        pin.setData(spec.defaultValue)
+    else:
+        pin.setData(spec.defaultValue)
+        pin.setDefaultValue(spec.defaultValue)
+        pin.initAsArray(spec.bArray)
+    pin.setInputWidgetVariant(spec.inputWidgetVariant)
+    if spec.optionsToEnable is not None:
+        pin.enableOptions(spec.optionsToEnable)
+    if spec.optionsToDisable is not None:
+        pin.disableOptions(spec.optionsToDisable)
+    if not pin.isArray() and pin.optionEnabled(PinOptions.ArraySupported):
+        pin.structureType = StructureType.Multi
+    elif pin.isArray():
+        pin.structureType = StructureType.Array
+    return pin
+
+
+# function -> generated node class. Generated classes reference their functions,
+# so entries live as long as process does, same as function libraries
+_functionNodeClasses = {}
+
+
 class NodeBase(INode):
     _packageName = ""
+    #: Whether graph should call :meth:`Tick` on this node. None means node is ticked if it reimplements :meth:`Tick`
+    needsTick = None
 
     def __init__(self, name, uid=None):
         super(NodeBase, self).__init__()
         self.bCacheEnabled = False
-        self.cacheMaxSize = 1000
-        self.cache = {}
+        self.cache = NodeCache(maxSize=1000)
+        self._cacheKey = None
 
         self.killed = Signal()
         self.tick = Signal(float)
+        self.pinCreated = Signal(object)
         self.errorOccured = Signal(object)
         self.errorCleared = Signal()
 
@@ -80,6 +174,7 @@ class NodeBase(INode):
         self.name = name
         self.pinsCreationOrder = OrderedDict()
         self._pins = set()
+        self._pinMaps = None
         self.x = 0.0
         self.y = 0.0
         self.bCallable = False
@@ -91,10 +186,12 @@ class NodeBase(INode):
         self._lastError = None
         self.__wrapperJsonData = None
         self._nodeMetaData = None
+        self._vectorized = False
         self.headerColor = None
         self._deprecated = False
         self._deprecationMessage = "This node is deprecated"
         self._experimental = False
+        self._tickSubscribers = 0
 
     def setDeprecated(self, message):
         self._deprecated = True
@@ -198,61 +295,69 @@ class NodeBase(INode):
     def pins(self):
         return self._pins
 
+    def invalidatePinMaps(self):
+        """Drops cached pin dictionaries. Called by pins when they are created, killed, renamed or reindexed
+        """
+        self._pinMaps = None
+
+    def _getPinMaps(self):
+        if self._pinMaps is None:
+            inputs = OrderedDict()
+            outputs = OrderedDict()
+            namePinInputsMap = OrderedDict()
+            namePinOutputsMap = OrderedDict()
+            for pin in self.pins:
+                if pin.direction == PinDirection.Input:
+                    inputs[pin.uid] = pin
+                    namePinInputsMap[pin.name] = pin
+                else:
+                    outputs[pin.uid] = pin
+                    namePinOutputsMap[pin.name] = pin
+            orderedInputs = OrderedDict()
+            for inp in sorted(inputs.values(), key=lambda x: x.pinIndex):
+                orderedInputs[inp.pinIndex] = inp
+            orderedOutputs = OrderedDict()
+            for out in sorted(outputs.values(), key=lambda x: x.pinIndex):
+                orderedOutputs[out.pinIndex] = out
+            self._pinMaps = (MappingProxyType(inputs),
+                             MappingProxyType(outputs),
+                             MappingProxyType(namePinInputsMap),
+                             MappingProxyType(namePinOutputsMap),
+                             MappingProxyType(orderedInputs),
+                             MappingProxyType(orderedOutputs))
+        return self._pinMaps
+
     @property
     def inputs(self):
-        """Returns all input pins. Dictionary generated every time property called, so cache it when possible.
+        """Returns all input pins. Read only dictionary, cached until pins change
         """
-        result = OrderedDict()
-        for pin in self.pins:
-            if pin.direction == PinDirection.Input:
-                result[pin.uid] = pin
-        return result
+        return self._getPinMaps()[0]
 
     @property
     def orderedInputs(self):
-        result = {}
-        sortedInputs = sorted(self.inputs.values(), key=lambda x: x.pinIndex)
-        for inp in sortedInputs:
-            result[inp.pinIndex] = inp
-        return result
+        return self._getPinMaps()[4]
 
     @property
     def namePinInputsMap(self):
-        """Returns all input pins. Dictionary generated every time property called, so cache it when possible.
+        """Returns all input pins. Read only dictionary, cached until pins change
         """
-        result = OrderedDict()
-        for pin in self.pins:
-            if pin.direction == PinDirection.Input:
-                result[pin.name] = pin
-        return result
+        return self._getPinMaps()[2]
 
     @property
     def outputs(self):
-        """Returns all output pins. Dictionary generated every time property called, so cache it when possible.
+        """Returns all output pins. Read only dictionary, cached until pins change
         """
-        result = OrderedDict()
-        for pin in self.pins:
-            if pin.direction == PinDirection.Output:
-                result[pin.uid] = pin
-        return result
+        return self._getPinMaps()[1]
 
     @property
     def orderedOutputs(self):
-        result = {}
-        sortedOutputs = sorted(self.outputs.values(), key=lambda x: x.pinIndex)
-        for out in sortedOutputs:
-            result[out.pinIndex] = out
-        return result
+        return self._getPinMaps()[5]
 
     @property
     def namePinOutputsMap(self):
-        """Returns all output pins. Dictionary generated every time property called, so cache it when possible.
+        """Returns all output pins. Read only dictionary, cached until pins change
         """
-        result = OrderedDict()
-        for pin in self.pins:
-            if pin.direction == PinDirection.Output:
-                result[pin.name] = pin
-        return result
+        return self._getPinMaps()[3]
 
     # IItemBase interface
 
@@ -312,6 +417,8 @@ class NodeBase(INode):
         template['meta']['label'] = self.name
         template['x'] = self.x
         template['y'] = self.y
+        if self._vectorized:
+            template['vectorized'] = True
 
         # if running with ui get ui wrapper data to save
         wrapper = self.getWrapper()
@@ -329,18 +436,77 @@ class NodeBase(INode):
             return
 
         self.killed.send()
+        PathsRegistry().remove(self)
+        self.graph().graphManager.onNodeKilled(self)
 
         for pin in self.inputs.values():
             pin.kill()
         for pin in self.outputs.values():
             pin.kill()
         self.graph().getNodes().pop(self.uid)
-
-        PathsRegistry().rebuild()
+        self.graph().onNodeTickChanged(self)
+        self.graph().bumpTopologyVersion()
 
     def Tick(self, delta):
         self.tick.send(delta)
 
+    def isTickEnabled(self):
+        """Whether graph calls :meth:`Tick` on this node
+
+        .. seealso:: :attr:`needsTick`, :meth:`subscribeTick`
+
+        :rtype: bool
+        """
+        if self._tickSubscribers > 0:
+            return True
+        return self.ticksByDefault()
+
+    @classmethod
+    def ticksByDefault(cls):
+        """Whether nodes of this class are ticked without subscribers
+
+        .. seealso:: :attr:`needsTick`
+
+        :rtype: bool
+        """
+        if cls.needsTick is None:
+            foo = cls.Tick
+            return getattr(foo, "__func__", foo) is not getattr(NodeBase.Tick, "__func__", NodeBase.Tick)
+        return cls.needsTick
+
+    def subscribeTick(self):
+        """Requests :meth:`Tick` calls regardless of :attr:`needsTick`
+
+        Used by listeners of :attr:`tick` signal, for example ui wrappers.
+        Every call should be paired with :meth:`unsubscribeTick`
+        """
+        self._tickSubscribers += 1
+        if self._tickSubscribers == 1 and self.graph is not None:
+            self.graph().onNodeTickChanged(self)
+
+    def unsubscribeTick(self):
+        """Releases request made by :meth:`subscribeTick`
+        """
+        if self._tickSubscribers == 0:
+            return
+        self._tickSubscribers -= 1
+        if self._tickSubscribers == 0 and self.graph is not None:
+            self.graph().onNodeTickChanged(self)
+
+    def timeUntilTick(self):
+        """Time in seconds after which node needs next :meth:`Tick`
+
+        Used by :class:`~PyFlow.Core.GraphRunner.GraphRunner` to sleep while nothing is scheduled.
+        By default nodes which :meth:`ticksByDefault` need every tick. Nodes that wait for deadlines
+        or become idle should reimplement this.
+
+        :returns: Zero if node needs every tick, positive number if node waits for deadline, None if node is idle
+        :rtype: float or None
+        """
+        if self.ticksByDefault():
+            return 0.0
+        return None
+
     @staticmethod
     def category():
         return "Default"
@@ -357,40 +523,64 @@ class NodeBase(INode):
     def description():
         return "Default node description"
 
+    @staticmethod
+    def getFunction():
+        """Returns function this node was generated from
+
+        This will return function only for function based nodes. For class based nodes it will return None
+
+        .. seealso:: :meth:`~PyFlow.Core.NodeBase.NodeBase.initializeFromFunction`
+        """
+        return None
+
     def getName(self):
         return self.name
 
     def setName(self, name):
+        from PyFlow.Core.PathsRegistry import PathsRegistry
+
+        oldName = self.name
         self.name = str(name)
+        if self.graph is not None and self.uid in self.graph().getNodes():
+            self.graph().graphManager.onNodeRenamed(self, oldName)
+        PathsRegistry().update(self)
+
+    @property
+    def cacheMaxSize(self):
+        return self.cache.maxSize
+
+    @cacheMaxSize.setter
+    def cacheMaxSize(self, value):
+        self.cache.maxSize = value
 
     def useCache(self):
-        # if cached results exists - return them without calling compute
-        args = tuple([pin.currentData() for pin in self.inputs.values() if pin.IsValuePin()])
+        """Sets outputs from cache if node was already computed with current inputs
 
-        # not hashable types will not be cached
-        for arg in args:
-            if not isinstance(arg, collections.Hashable):
-                return False
+        Key made from inputs is remembered and reused by :meth:`~PyFlow.Core.NodeBase.NodeBase.afterCompute`
 
-        if args in self.cache:
-            for outPin, data in self.cache[args].items():
-                outPin.setData(data)
+        :returns: Whether cached results were used
+        :rtype: bool
+        """
+        self._cacheKey = makeCacheKey(tuple([pin.currentData() for pin in self.inputs.values() if pin.IsValuePin()]))
+        if self._cacheKey is None:
+            return False
+
+        cached = self.cache.get(self._cacheKey)
+        if cached is not None:
+            for outPin, data in cached:
+                outPin.setData(copyCachedValue(data))
             return True
+        return False
 
     def afterCompute(self):
-        if len(self.cache) >= self.cacheMaxSize:
-            return
-
-        # cache results
-        args = tuple([pin.currentData() for pin in self.inputs.values() if pin.IsValuePin()])
-        for arg in args:
-            if not isinstance(arg, collections.Hashable):
+        # inputs could be modified by compute, so key made before compute is used
+        key = self._cacheKey
+        self._cacheKey = None
+        if key is None:
+            key = makeCacheKey(tuple([pin.currentData() for pin in self.inputs.values() if pin.IsValuePin()]))
+            if key is None:
                 return
-
-        cache = {}
-        for pin in self.outputs.values():
-            cache[pin] = pin.currentData()
-        self.cache[args] = cache
+        self.cache.put(key, tuple([(pin, copyCachedValue(pin.currentData())) for pin in self.outputs.values()]))
 
     def processNode(self, *args, **kwargs):
         if not self.isValid():
@@ -403,7 +593,7 @@ class NodeBase(INode):
                     self.checkForErrors()
                 except Exception as e:
                     self.setError(e)
-            self.afterCompute()
+                self.afterCompute()
         else:
             try:
                 self.compute()
@@ -464,6 +654,96 @@ class NodeBase(INode):
         """
         self.x = x
         self.y = y
+        self.notifyModified()
+
+    def isVectorizable(self):
+        """Whether node can be switched to vectorized mode
+
+        True for function based nodes marked with :attr:`~PyFlow.Core.Common.NodeMeta.VECTORIZABLE`,
+        when all value pins hold numbers and NumPy array pins are available
+
+        :rtype: bool
+        """
+        meta = self.getMetaData()
+        if meta is None or not meta.get(NodeMeta.VECTORIZABLE, False):
+            return False
+        if self._vectorized:
+            return True
+        for pin in self.pins:
+            if pin.isExec():
+                continue
+            if pin.dataType not in _VECTORIZED_PIN_TYPES or pin.isArray() or pin.isDict():
+                return False
+        return all(findPinClassByType(dataType) is not None for dataType in _VECTORIZED_PIN_TYPES.values())
+
+    def isVectorized(self):
+        """Whether node evaluates arrays instead of single values
+
+        :rtype: bool
+        """
+        return self._vectorized
+
+    def setVectorized(self, bVectorized):
+        """Switches node between scalar and vectorized mode
+
+        In vectorized mode number pins are replaced with array pins of same name and uid and function is called once
+        for whole arrays, see :attr:`~PyFlow.Core.Common.NodeMeta.VECTORIZABLE`. Unconnected inputs hold single
+        element arrays, which are broadcasted, and get their first element back when switched to scalar mode.
+        Mode can not be changed while value pins are connected, because connections would not fit new pin types
+
+        :param bVectorized: Whether node should evaluate arrays
+        :type bVectorized: bool
+        :returns: Whether mode was changed
+        :rtype: bool
+        """
+        if bVectorized == self._vectorized or not self.isVectorizable():
+            return False
+        valuePins = [pin for pin in sorted(self.pins, key=lambda x: (x.direction, x.pinIndex)) if not pin.isExec()]
+        if any(pin.hasConnections() for pin in valuePins):
+            return False
+        # pins sharing constraint get one array type, float if any of them is float
+        constraintTypes = {}
+        for pin in valuePins:
+            if pin.constraint is not None and constraintTypes.get(pin.constraint) != 'FloatArrayPin':
+                constraintTypes[pin.constraint] = _VECTORIZED_PIN_TYPES[pin.dataType]
+        for pin in valuePins:
+            name = pin.name
+            direction = pin.direction
+            uid = pin.uid
+            pinIndex = pin.pinIndex
+            if bVectorized:
+                dataType = constraintTypes.get(pin.constraint, _VECTORIZED_PIN_TYPES[pin.dataType])
+                defaultValue = pin.currentData() if direction == PinDirection.Input else None
+                pin.kill()
+                if direction == PinDirection.Input:
+                    newPin = self.createInputPin(name, dataType, [defaultValue if defaultValue is not None else 0])
+                else:
+                    newPin = self.createOutputPin(name, dataType)
+            else:
+                values = pin.currentData() if direction == PinDirection.Input else None
+                pin.kill()
+                newPin = _createFunctionPin(self, self._pinSpecs[name])
+                if values is not None and len(values) > 0:
+                    value = values[0]
+                    # numpy scalar to python number
+                    newPin.setData(value.item() if hasattr(value, 'item') else value)
+            newPin.pinIndex = pinIndex
+            newPin.uid = uid
+        self._vectorized = bVectorized
+        self.autoAffectPins()
+        self.checkForErrors()
+        self.notifyModified()
+        return True
+
+    def notifyModified(self):
+        """Tells graph manager that serialized state of this node changed
+
+        .. warning:: Used internally
+
+        .. seealso:: :attr:`~PyFlow.Core.GraphManager.GraphManager.nodeModified`
+        """
+        if self.graph is not None and self.graph() is not None:
+            self.graph().graphManager.onNodeModified(self)
 
     def autoAffectPins(self):
         """All value inputs affects on all value outputs. All exec inputs affects on all exec outputs
@@ -531,6 +811,7 @@ class NodeBase(INode):
             p.updateConstraint(constraint)
         if structConstraint is not None:
             p.updateStructConstraint(structConstraint)
+        self.pinCreated.send(p)
         return p
 
     def createOutputPin(self, pinName, dataType, defaultValue=None, structure=StructureType.Single, constraint=None, structConstraint=None, supportedPinDataTypes=[], group=""):
@@ -581,6 +862,7 @@ class NodeBase(INode):
             p.updateConstraint(constraint)
         if structConstraint is not None:
             p.updateStructConstraint(structConstraint)
+        self.pinCreated.send(p)
         return p
 
     def setData(self, pinName, data, pinSelectionGroup=PinSelectionGroup.BothSides):
@@ -690,6 +972,10 @@ class NodeBase(INode):
             self.x = jsonTemplate['x']
             self.y = jsonTemplate['y']
 
+            # pins are replaced before their data is restored
+            if jsonTemplate.get('vectorized', False):
+                self.setVectorized(True)
+
             # set pins data
             sortedInputs = sorted(jsonTemplate['inputs'], key=lambda pinDict: pinDict["pinIndex"])
             for inpJson in sortedInputs:
@@ -726,47 +1012,37 @@ class NodeBase(INode):
         self.checkForErrors()
 
     @staticmethod
-    def initializeFromFunction(foo):
-        """Constructs node from annotated function
+    def getFunctionNodeClass(foo):
+        """Returns node class generated from annotated function
+
+        Class is generated and annotations are parsed only once per function, nodes only create pins
 
-        .. seealso :: :mod:`PyFlow.Core.FunctionLibrary`
+        .. seealso :: :meth:`~PyFlow.Core.NodeBase.NodeBase.initializeFromFunction`
 
         :param foo: Annotated function
         :type foo: function
-        :rtype: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: type
         """
-        retAnyOpts = None
-        retConstraint = None
-        meta = foo.__annotations__['meta']
-        returnType = returnDefaultValue = None
-        returnPinOptionsToEnable = None
-        returnPinOptionsToDisable = None
-        returnWidgetVariant = "DefaultWidget"
-        retStructConstraint = None
-        returnAnnotationDict = None
-        if foo.__annotations__['return'] is not None:
-            returnType = foo.__annotations__['return'][0]
-            returnDefaultValue = foo.__annotations__['return'][1]
-            if len(foo.__annotations__['return']) == 3:
-                returnAnnotationDict = foo.__annotations__['return'][2]
-
-                if PinSpecifires.SUPPORTED_DATA_TYPES in returnAnnotationDict:
-                    retAnyOpts = returnAnnotationDict[PinSpecifires.SUPPORTED_DATA_TYPES]
-                if PinSpecifires.CONSTRAINT in returnAnnotationDict:
-                    retConstraint = returnAnnotationDict[PinSpecifires.CONSTRAINT]
-                if PinSpecifires.STRUCT_CONSTRAINT in returnAnnotationDict:
-                    retStructConstraint = returnAnnotationDict[PinSpecifires.STRUCT_CONSTRAINT]
-                if PinSpecifires.ENABLED_OPTIONS in returnAnnotationDict:
-                    returnPinOptionsToEnable = returnAnnotationDict[PinSpecifires.ENABLED_OPTIONS]
-                if PinSpecifires.DISABLED_OPTIONS in returnAnnotationDict:
-                    returnPinOptionsToDisable = returnAnnotationDict[PinSpecifires.DISABLED_OPTIONS]
-                if PinSpecifires.INPUT_WIDGET_VARIANT in returnAnnotationDict:
-                    returnWidgetVariant = returnAnnotationDict[PinSpecifires.INPUT_WIDGET_VARIANT]
+        nodeClass = _functionNodeClasses.get(foo)
+        if nodeClass is not None:
+            return nodeClass
 
+        meta = foo.__annotations__['meta']
+        bReturns = foo.__annotations__['return'] is not None
         nodeType = foo.__annotations__['nodeType']
-        _packageName = foo.__annotations__['packageName']
         libName = foo.__annotations__['lib']
-        fooArgNames = getargspec(foo).args
+
+        argNames = tuple(getargspec(foo).args)
+        pinSpecs = OrderedDict()
+        if bReturns:
+            pinSpecs['out'] = _FunctionPinSpec('out', foo.__annotations__['return'], PinDirection.Output)
+        for argName in argNames:
+            pinDescriptionTuple = foo.__annotations__[argName]
+            # tuple means this is reference pin with default value eg - (dataType, defaultValue)
+            if str("Reference") == pinDescriptionTuple[0]:
+                pinSpecs[argName] = _FunctionPinSpec(argName, pinDescriptionTuple[1], PinDirection.Output, bReference=True)
+            else:
+                pinSpecs[argName] = _FunctionPinSpec(argName, pinDescriptionTuple, PinDirection.Input)
 
         @staticmethod
         def description():
@@ -780,156 +1056,71 @@ class NodeBase(INode):
         def keywords():
             return meta[NodeMeta.KEYWORDS]
 
+        @staticmethod
+        def getFunction():
+            return foo
+
         def constructor(self, name, **kwargs):
             NodeBase.__init__(self, name, **kwargs)
+            self.lib = libName
+            self._nodeMetaData = meta
+            if 'CacheEnabled' in meta:
+                self.bCacheEnabled = meta['CacheEnabled']
+            # this is list of 'references' outputs will be created for
+            self._refs = []
+            self._outExec = None
+
+            # create execs if callable
+            if nodeType == NodeTypes.Callable:
+                self.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, self.compute)
+                self._outExec = self.createOutputPin(DEFAULT_OUT_EXEC_NAME, 'ExecPin')
+                self.bCallable = True
+                self.bCacheEnabled = False
+
+            for spec in pinSpecs.values():
+                pin = _createFunctionPin(self, spec)
+                if spec.bReference:
+                    self._refs.append(pin)
+            self.autoAffectPins()
+
+        # arguments will be taken from inputs
+        def compute(self, *args, **kwargs):
+            kwds = {}
+            for i in list(self.inputs.values()):
+                if not i.isExec():
+                    kwds[i.name] = i.getData()
+            for ref in self._refs:
+                kwds[ref.name] = ref.setData
+            if self._vectorized:
+                result = callVectorized(foo, kwds, argNames)
+            else:
+                result = foo(**kwds)
+            if bReturns:
+                self.setData(str('out'), result)
+            if self._outExec is not None:
+                self._outExec.call(*args, **kwargs)
 
         nodeClass = type(foo.__name__, (NodeBase,), {'__init__': constructor,
+                                                     'compute': compute,
                                                      'category': category,
                                                      'keywords': keywords,
-                                                     'description': description
+                                                     'description': description,
+                                                     'getFunction': getFunction,
+                                                     '_pinSpecs': MappingProxyType(pinSpecs),
+                                                     '_argNames': argNames
                                                      })
+        nodeClass._packageName = foo.__annotations__['packageName']
+        _functionNodeClasses[foo] = nodeClass
+        return nodeClass
 
-        nodeClass._packageName = _packageName
-
-        raw_inst = nodeClass(foo.__name__)
-        raw_inst.lib = libName
+    @staticmethod
+    def initializeFromFunction(foo):
+        """Constructs node from annotated function
 
-        # this is list of 'references' outputs will be created for
-        refs = []
-        outExec = None
+        .. seealso :: :mod:`PyFlow.Core.FunctionLibrary`, :meth:`~PyFlow.Core.NodeBase.NodeBase.getFunctionNodeClass`
 
-        # generate compute method from function
-        def compute(self, *args, **kwargs):
-            # arguments will be taken from inputs
-            kwds = {}
-            for i in list(self.inputs.values()):
-                if not i.isExec():
-                    kwds[i.name] = i.getData()
-            for ref in refs:
-                if not ref.isExec():
-                    kwds[ref.name] = ref.setData
-            result = foo(**kwds)
-            if returnType is not None:
-                self.setData(str('out'), result)
-            if nodeType == NodeTypes.Callable:
-                outExec.call(*args, **kwargs)
-
-        raw_inst.compute = MethodType(compute, raw_inst)
-
-        raw_inst._nodeMetaData = meta
-        if 'CacheEnabled' in meta:
-            raw_inst.bCacheEnabled = meta['CacheEnabled']
-
-        # create execs if callable
-        if nodeType == NodeTypes.Callable:
-            inputExec = raw_inst.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, raw_inst.compute)
-            outExec = raw_inst.createOutputPin(DEFAULT_OUT_EXEC_NAME, 'ExecPin')
-            raw_inst.bCallable = True
-            raw_inst.bCacheEnabled = False
-
-        if returnType is not None:
-            p = raw_inst.createOutputPin('out', returnType, returnDefaultValue, supportedPinDataTypes=retAnyOpts, constraint=retConstraint, structConstraint=retStructConstraint)
-            p.setData(returnDefaultValue)
-            p.setDefaultValue(returnDefaultValue)
-            p.initAsArray(isinstance(returnDefaultValue, list))
-            p.setInputWidgetVariant(returnWidgetVariant)
-            p.annotationDescriptionDict = copy(returnAnnotationDict) if returnAnnotationDict is not None else None
-            if p.annotationDescriptionDict is not None and "Description" in p.annotationDescriptionDict:
-                p.description = p.annotationDescriptionDict["Description"]
-            if returnPinOptionsToEnable is not None:
-                p.enableOptions(returnPinOptionsToEnable)
-            if returnPinOptionsToDisable is not None:
-                p.disableOptions(returnPinOptionsToDisable)
-            if not p.isArray() and p.optionEnabled(PinOptions.ArraySupported):
-                p.structureType = StructureType.Multi
-            elif p.isArray():
-                p.structureType = StructureType.Array
-
-        # iterate over function arguments and create pins according to data types
-        for index in range(len(fooArgNames)):
-            argName = fooArgNames[index]
-            pinDescriptionTuple = foo.__annotations__[argName]
-            anyOpts = None
-            constraint = None
-            structConstraint = None
-            pinOptionsToEnable = None
-            pinOptionsToDisable = None
-            inputWidgetVariant = "DefaultWidget"
-            # tuple means this is reference pin with default value eg - (dataType, defaultValue)
-            if str("Reference") == pinDescriptionTuple[0]:
-                pinDataType = pinDescriptionTuple[1][0]
-                pinDefaultValue = pinDescriptionTuple[1][1]
-                pinDict = None
-                if len(pinDescriptionTuple[1]) == 3:
-                    pinDict = pinDescriptionTuple[1][2]
-
-                if pinDict is not None:
-                    if PinSpecifires.SUPPORTED_DATA_TYPES in pinDict:
-                        anyOpts = pinDict[PinSpecifires.SUPPORTED_DATA_TYPES]
-                    if PinSpecifires.CONSTRAINT in pinDict:
-                        constraint = pinDict[PinSpecifires.CONSTRAINT]
-                    if PinSpecifires.STRUCT_CONSTRAINT in pinDict:
-                        structConstraint = pinDict[PinSpecifires.STRUCT_CONSTRAINT]
-                    if PinSpecifires.ENABLED_OPTIONS in pinDict:
-                        pinOptionsToEnable = pinDict[PinSpecifires.ENABLED_OPTIONS]
-                    if PinSpecifires.DISABLED_OPTIONS in pinDict:
-                        pinOptionsToDisable = pinDict[PinSpecifires.DISABLED_OPTIONS]
-                    if PinSpecifires.INPUT_WIDGET_VARIANT in pinDict:
-                        inputWidgetVariant = pinDict[PinSpecifires.INPUT_WIDGET_VARIANT]
-
-                outRef = raw_inst.createOutputPin(argName, pinDataType, supportedPinDataTypes=anyOpts, constraint=constraint, structConstraint=structConstraint)
-                outRef.annotationDescriptionDict = copy(pinDict) if pinDict is not None else None
-                if outRef.annotationDescriptionDict is not None and "Description" in outRef.annotationDescriptionDict:
-                    outRef.description = outRef.annotationDescriptionDict["Description"]
-                outRef.initAsArray(isinstance(pinDefaultValue, list))
-                outRef.setDefaultValue(pinDefaultValue)
-                outRef.setData(pinDefaultValue)
-                outRef.setInputWidgetVariant(inputWidgetVariant)
-                if pinOptionsToEnable is not None:
-                    outRef.enableOptions(pinOptionsToEnable)
-                if pinOptionsToDisable is not None:
-                    outRef.disableOptions(pinOptionsToDisable)
-                if not outRef.isArray() and outRef.optionEnabled(PinOptions.ArraySupported):
-                    outRef.structureType = StructureType.Multi
-                elif outRef.isArray():
-                    outRef.structureType = StructureType.Array
-                refs.append(outRef)
-            else:
-                pinDataType = pinDescriptionTuple[0]
-                pinDefaultValue = pinDescriptionTuple[1]
-                pinDict = None
-                if len(pinDescriptionTuple) == 3:
-                    pinDict = pinDescriptionTuple[2]
-
-                if pinDict is not None:
-                    if PinSpecifires.SUPPORTED_DATA_TYPES in pinDict:
-                        anyOpts = pinDict[PinSpecifires.SUPPORTED_DATA_TYPES]
-                    if PinSpecifires.CONSTRAINT in pinDict:
-                        constraint = pinDict[PinSpecifires.CONSTRAINT]
-                    if PinSpecifires.STRUCT_CONSTRAINT in pinDict:
-                        structConstraint = pinDict[PinSpecifires.STRUCT_CONSTRAINT]
-                    if PinSpecifires.ENABLED_OPTIONS in pinDict:
-                        pinOptionsToEnable = pinDict[PinSpecifires.ENABLED_OPTIONS]
-                    if PinSpecifires.DISABLED_OPTIONS in pinDict:
-                        pinOptionsToDisable = pinDict[PinSpecifires.DISABLED_OPTIONS]
-                    if PinSpecifires.INPUT_WIDGET_VARIANT in pinDict:
-                        inputWidgetVariant = pinDict[PinSpecifires.INPUT_WIDGET_VARIANT]
-
-                inp = raw_inst.createInputPin(argName, pinDataType, supportedPinDataTypes=anyOpts, constraint=constraint, structConstraint=structConstraint)
-                inp.annotationDescriptionDict = copy(pinDict) if pinDict is not None else None
-                if inp.annotationDescriptionDict is not None and "Description" in inp.annotationDescriptionDict:
-                    inp.description = inp.annotationDescriptionDict["Description"]
-                inp.initAsArray(isinstance(pinDefaultValue, list))
-                inp.setData(pinDefaultValue)
-                inp.setDefaultValue(pinDefaultValue)
-                inp.setInputWidgetVariant(inputWidgetVariant)
-                if pinOptionsToEnable is not None:
-                    inp.enableOptions(pinOptionsToEnable)
-                if pinOptionsToDisable is not None:
-                    inp.disableOptions(pinOptionsToDisable)
-                if not inp.isArray() and inp.optionEnabled(PinOptions.ArraySupported):
-                    inp.structureType = StructureType.Multi
-                elif inp.isArray():
-                    inp.structureType = StructureType.Array
-        raw_inst.autoAffectPins()
-        return raw_inst
+        :param foo: Annotated function
+        :type foo: function
+        :rtype: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        return NodeBase.getFunctionNodeClass(foo)(foo.__name__)
@@ -0,0 +1,236 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+"""
+.. sidebar:: **NodeCache.py**
+
+    Results cache used by :meth:`~PyFlow.Core.NodeBase.NodeBase.processNode` when node has
+    :attr:`~PyFlow.Core.Common.NodeMeta.CACHE_ENABLED` set.
+
+Every node owns :class:`NodeCache` with least recently used eviction and optional time to live.
+All caches share :class:`CacheMemoryBudget`, when budget is exceeded oldest entries of least recently used caches are dropped.
+
+Different cache can be plugged in by assigning object with same interface to :attr:`~PyFlow.Core.NodeBase.NodeBase.cache`.
+"""
+
+import sys
+import time
+import weakref
+from collections import OrderedDict
+
+from PyFlow.Core.Common import *
+
+
+def makeCacheKey(value):
+    """Converts value to hashable key
+
+    Lists, tuples, dicts, :class:`~PyFlow.Core.Common.PFDict` and :class:`~PyFlow.Core.Common.DictElement`
+    are converted to tuples recursively, so values with equal content produce equal keys.
+
+    :param value: Value to convert
+    :returns: Hashable key or None if value can not be hashed
+    """
+    try:
+        return _makeKey(value)
+    except TypeError:
+        return None
+
+
+def _makeKey(value):
+    if isinstance(value, DictElement):
+        return (DictElement, _makeKey(value[0]), _makeKey(value[1]))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_makeKey(v) for v in value))
+    if isinstance(value, dict):
+        items = frozenset((_makeKey(k), _makeKey(v)) for k, v in value.items())
+        if isinstance(value, PFDict):
+            return (PFDict, value.keyType, value.valueType, items)
+        return (dict, items)
+    # raises TypeError if not hashable
+    hash(value)
+    return (type(value), value)
+
+
+def copyCachedValue(value):
+    """Shallow copy of mutable containers, so cached results are not modified by downstream nodes
+
+    :param value: Value to copy
+    """
+    if isinstance(value, PFDict):
+        return PFDict(value.keyType, value.valueType, value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def estimateSize(value):
+    """Approximate memory used by value in bytes
+
+    Objects referenced several times, including containers referencing themselves, are counted once
+
+    :param value: Value to measure
+    :rtype: int
+    """
+    size = 0
+    visited = set()
+    stack = [value]
+    while len(stack) > 0:
+        item = stack.pop()
+        if id(item) in visited:
+            continue
+        visited.add(id(item))
+        size += sys.getsizeof(item, 64)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+@SingletonDecorator
+class CacheMemoryBudget(object):
+    """Limits memory used by all node caches together
+
+    :var maxBytes: Memory limit in bytes. None means no limit
+    :vartype maxBytes: int or None
+    """
+    def __init__(self):
+        self.maxBytes = None
+        self.usedBytes = 0
+        # id(cache) -> [weak reference to cache, bytes used by cache], ordered by last usage
+        self._caches = OrderedDict()
+
+    def _record(self, cache):
+        key = id(cache)
+        record = self._caches.pop(key, None)
+        if record is None:
+            record = [weakref.ref(cache, lambda ref, key=key: self._forget(key)), 0]
+        self._caches[key] = record
+        return record
+
+    def _forget(self, key):
+        record = self._caches.pop(key, None)
+        if record is not None:
+            self.usedBytes -= record[1]
+
+    def touch(self, cache):
+        """Marks cache as recently used
+        """
+        self._record(cache)
+
+    def allocate(self, cache, size):
+        """Accounts memory taken by new entry and evicts entries if budget is exceeded
+        """
+        self._record(cache)[1] += size
+        self.usedBytes += size
+        if self.maxBytes is None:
+            return
+        # evict from least recently used caches first, requesting cache is last
+        for key in list(self._caches):
+            if self.usedBytes <= self.maxBytes:
+                break
+            other = self._caches[key][0]()
+            if other is None or other is cache:
+                continue
+            while len(other) > 0 and self.usedBytes > self.maxBytes:
+                other.popOldest()
+        while len(cache) > 1 and self.usedBytes > self.maxBytes:
+            cache.popOldest()
+
+    def release(self, cache, size):
+        """Accounts memory freed by removed entry
+        """
+        record = self._caches.get(id(cache))
+        if record is not None:
+            record[1] -= size
+            self.usedBytes -= size
+
+
+class NodeCache(object):
+    """Least recently used cache of node results
+
+    :param maxSize: Maximum number of entries
+    :type maxSize: int
+    :param ttl: Entries older than this number of seconds are not used. None means entries never expire
+    :type ttl: float or None
+
+    :var hits: Number of successful lookups
+    :var misses: Number of failed lookups
+    """
+    def __init__(self, maxSize=1000, ttl=None):
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (timestamp, size, values)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Returns cached values and marks entry as recently used
+
+        :param key: Key produced by :func:`makeCacheKey`
+        :returns: Cached values or None
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None and self.ttl is not None and time.time() - entry[0] > self.ttl:
+            CacheMemoryBudget().release(self, entry[1])
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries[key] = entry
+        self.hits += 1
+        CacheMemoryBudget().touch(self)
+        return entry[2]
+
+    def put(self, key, values):
+        """Stores values, evicting least recently used entries if needed
+
+        :param key: Key produced by :func:`makeCacheKey`
+        :param values: Values to store
+        """
+        if self.maxSize <= 0:
+            return
+        if key in self._entries:
+            CacheMemoryBudget().release(self, self._entries.pop(key)[1])
+        while len(self._entries) >= self.maxSize:
+            self.popOldest()
+        size = estimateSize(key) + estimateSize(values)
+        self._entries[key] = (time.time(), size, values)
+        CacheMemoryBudget().allocate(self, size)
+
+    def popOldest(self):
+        """Removes least recently used entry
+        """
+        if len(self._entries) > 0:
+            key = next(iter(self._entries))
+            CacheMemoryBudget().release(self, self._entries.pop(key)[1])
+
+    def clear(self):
+        """Removes all entries and resets counters
+        """
+        while len(self._entries) > 0:
+            self.popOldest()
+        self.hits = 0
+        self.misses = 0
@@ -1,21 +1,125 @@
+from contextlib import contextmanager
+
 from PyFlow.Core.Common import *
 from PyFlow.Core.GraphManager import GraphManagerSingleton
 
 
 @SingletonDecorator
 class PathsRegistry(object):
-    """Holds paths to nodes and pins. Can rebuild paths and return entities by paths."""
+    """Holds paths to nodes and pins. Can rebuild paths and return entities by paths.
+
+    Registry is updated incrementally when nodes are added, killed or renamed.
+    Updates can be suspended during bulk operations, single rebuild will be performed when resumed.
+
+    >>> with PathsRegistry().suspended():
+    >>>     graph.populateFromJson(data)
+    """
     def __init__(self):
         self._data = {}
+        # node uid -> [(path, entity)] of node and it's pins
+        self._nodePaths = {}
+        self._suspendCounter = 0
+        self._bDirty = False
 
     def rebuild(self):
         man = GraphManagerSingleton().get()
-        allNodes = man.getAllNodes()
+        # nodes of serialized compound graphs are inserted when compounds are loaded
+        allNodes = man.getAllNodes(bLoadedOnly=True)
         self._data.clear()
+        self._nodePaths.clear()
         for node in allNodes:
-            self._data[node.path()] = node
-            for pin in node.pins:
-                self._data[pin.path()] = pin
+            self._insertNode(node)
+        self._bDirty = False
+
+    def _insertNode(self, node):
+        nodePath = node.path()
+        self._data[nodePath] = node
+        entries = [(nodePath, node)]
+        for pin in node.pins:
+            pinPath = "{}.{}".format(nodePath, pin.getName())
+            self._data[pinPath] = pin
+            entries.append((pinPath, pin))
+        self._nodePaths[node.uid] = entries
+
+    def _removeNode(self, node):
+        for path, entity in self._nodePaths.pop(node.uid, []):
+            if self._data.get(path) is entity:
+                self._data.pop(path)
+
+    def isSuspended(self):
+        return self._suspendCounter > 0
+
+    def suspend(self):
+        """Stops incremental updates. Calls can be nested
+        """
+        self._suspendCounter += 1
+
+    def resume(self):
+        """Resumes incremental updates. Rebuilds registry if something changed while suspended
+        """
+        self._suspendCounter = max(0, self._suspendCounter - 1)
+        if not self.isSuspended() and self._bDirty:
+            self.rebuild()
+
+    @contextmanager
+    def suspended(self):
+        self.suspend()
+        try:
+            yield self
+        finally:
+            self.resume()
+
+    def insert(self, node):
+        """Registers node and it's pins. Existing entries of this node are replaced
+
+        :param node: Node to register
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        if node.graph().graphManager is not GraphManagerSingleton().get():
+            return
+        if self.isSuspended():
+            self._bDirty = True
+            return
+        self._removeNode(node)
+        self._insertNode(node)
+
+    def update(self, node):
+        """Refreshes paths of node and it's pins if node is registered
+
+        :param node: Node which name or pins changed
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        if self.isSuspended():
+            self._bDirty = True
+            return
+        if node.uid in self._nodePaths:
+            self._removeNode(node)
+            self._insertNode(node)
+
+    def remove(self, node):
+        """Unregisters node and it's pins
+
+        :param node: Node to unregister
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        if self.isSuspended():
+            self._bDirty = True
+            return
+        self._removeNode(node)
+
+    def updateGraph(self, graph):
+        """Refreshes paths of all nodes in graph and it's child graphs
+
+        :param graph: Graph which location changed
+        :type graph: :class:`~PyFlow.Core.GraphBase.GraphBase`
+        """
+        if self.isSuspended():
+            self._bDirty = True
+            return
+        for node in graph.getNodes().values():
+            self.update(node)
+        for childGraph in graph.childGraphs:
+            self.updateGraph(childGraph)
 
     def getAllPaths(self):
         return list(self._data)
@@ -28,6 +132,12 @@ class PathsRegistry(object):
     #     res = "/".join(temp.split(os.sep))
 
     def getEntity(self, path):
+        if not self.contains(path):
+            # entity could be inside compounds which are not loaded yet
+            man = GraphManagerSingleton().get()
+            for graphName in path.split("/")[1:-1]:
+                if man.findGraph(graphName) is None:
+                    break
         if self.contains(path):
             return self._data[path]
         return None
@@ -96,8 +96,10 @@ class PinBase(IPin):
         self.dirty = True
         self.affects = set()
         self.affected_by = set()
+        self.topologicalIndex = newTopologicalIndex()
+        self._bInDirtyFrontier = False
 
-        self.name = name
+        self._name = name
         self._group = ""
         self.direction = direction
 
@@ -135,9 +137,13 @@ class PinBase(IPin):
         # registration
         self.owningNode().pins.add(self)
         self.owningNode().pinsCreationOrder[self.uid] = self
+        self.owningNode().invalidatePinMaps()
+        if self.owningNode().graph is not None:
+            self.owningNode().graph().onPinCreated(self)
+        PathsRegistry().update(self.owningNode())
 
         # This is for to be able to connect pins by location on node
-        self.pinIndex = 0
+        self._pinIndex = 0
         if direction == PinDirection.Input:
             self.pinIndex = len(self.owningNode().orderedInputs)
         if direction == PinDirection.Output:
@@ -163,6 +169,26 @@ class PinBase(IPin):
         owningNodePath = self.owningNode().path()
         return "{}.{}".format(owningNodePath, self.getName())
 
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self.owningNode().invalidatePinMaps()
+
+    @property
+    def pinIndex(self):
+        """Index of pin on owning node. Used to connect pins by location
+        """
+        return self._pinIndex
+
+    @pinIndex.setter
+    def pinIndex(self, value):
+        self._pinIndex = value
+        self.owningNode().invalidatePinMaps()
+
     @property
     def group(self):
         """Pin group
@@ -200,7 +226,8 @@ class PinBase(IPin):
         """Same as :meth:`~PyFlow.Core.PinBase.PinBase.enableOptions` but inverse
         """
         for option in options:
-            self._flags = self._flags & ~option
+            # same as & ~option, but inverting flag enum is very slow
+            self._flags = (self._flags | option) ^ option
         self._origFlags = self._flags
 
     def optionEnabled(self, option):
@@ -457,7 +484,13 @@ class PinBase(IPin):
     @uid.setter
     def uid(self, value):
         if not value == self._uid:
+            graph = self.owningNode().graph
+            if graph is not None and graph() is not None:
+                graph().onPinKilled(self)
             self._uid = value
+            self.owningNode().invalidatePinMaps()
+            if graph is not None and graph() is not None:
+                graph().onPinCreated(self)
 
     def setName(self, name, force=False):
         """Sets pin name and fires events
@@ -475,6 +508,8 @@ class PinBase(IPin):
         if name == self.name:
             return False
         self.name = self.owningNode().getUniqPinName(name)
+        PathsRegistry().update(self.owningNode())
+        self.owningNode().notifyModified()
         self.nameChanged.send(self.name)
         return True
 
@@ -634,10 +669,17 @@ class PinBase(IPin):
         """Deletes this pin
         """
         self.disconnectAll()
+        graph = self.owningNode().graph
+        if graph is not None and graph() is not None:
+            graph().bumpTopologyVersion()
         if self in self.owningNode().pins:
             self.owningNode().pins.remove(self)
+            self.owningNode().invalidatePinMaps()
+            if graph is not None and graph() is not None:
+                graph().onPinKilled(self)
         if self.uid in self.owningNode().pinsCreationOrder:
             self.owningNode().pinsCreationOrder.pop(self.uid)
+        PathsRegistry().update(self.owningNode())
 
         # Fix pin indexes on owning node
         if self.optionEnabled(PinOptions.Dynamic):
@@ -991,9 +1033,33 @@ class PinBase(IPin):
         """Sets dirty flag to True
         """
         self.dirty = False
+        if self._bInDirtyFrontier:
+            self._leaveDirtyFrontier()
         if self.direction == PinDirection.Output:
             for i in self.affects:
                 i.dirty = False
+                if i._bInDirtyFrontier:
+                    i._leaveDirtyFrontier()
+
+    def invalidate(self):
+        """Sets dirty flag and adds pin to dirty frontier of owning graph
+
+        Used by :func:`~PyFlow.Core.Common.push`
+        """
+        if self.isExec():
+            return
+        self.dirty = True
+        if not self._bInDirtyFrontier:
+            graph = self.owningNode().graph
+            if graph is not None and graph() is not None:
+                graph().onPinDirty(self)
+                self._bInDirtyFrontier = True
+
+    def _leaveDirtyFrontier(self):
+        self._bInDirtyFrontier = False
+        graph = self.owningNode().graph
+        if graph is not None and graph() is not None:
+            graph().onPinClean(self)
 
     def setDirty(self):
         """Sets dirty flag to True
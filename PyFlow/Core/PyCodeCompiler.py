@@ -63,3 +63,183 @@ class Py3CodeCompiler(ICodeCompiler):
         codeObject = compile(code, moduleName, "exec")
         exec(codeObject, scope)
         return scope
+
+
+class GraphNotCompilable(Exception):
+    """Raised by :meth:`Py3GraphCompiler.compile` when graph contains nodes which can not be compiled
+    """
+    pass
+
+
+class CompiledGraph(object):
+    """Result of :class:`~PyFlow.Core.PyCodeCompiler.Py3GraphCompiler`
+
+    :var function: Generated function. Takes values of graph inputs pins as positional arguments and returns tuple of graph outputs values
+    :var source: Generated python code
+    :var inputPins: graphInputs output pins in arguments order
+    :var outputPins: graphOutputs input pins in results order
+    :var constantPins: Not connected pins which values were baked into function
+    """
+    def __init__(self, function, source, inputPins, outputPins, constantPins):
+        super(CompiledGraph, self).__init__()
+        self.function = function
+        self.source = source
+        self.inputPins = inputPins
+        self.outputPins = outputPins
+        self.constantPins = constantPins
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+
+class Py3GraphCompiler(ICodeCompiler):
+    """Compiles pure graph made of function library nodes to single python function
+
+    Generated function calls library functions directly, values are passed using local variables.
+    No pins, data validation or signals are involved during evaluation.
+
+    Graph is expected to contain only pure nodes created from :mod:`~PyFlow.Core.FunctionLibrary` functions,
+    :class:`~PyFlow.Packages.PyFlowBase.Nodes.graphNodes.graphInputs` and
+    :class:`~PyFlow.Packages.PyFlowBase.Nodes.graphNodes.graphOutputs` nodes.
+    """
+    def __init__(self, fooName="compiledGraph", *args, **kwargs):
+        super(Py3GraphCompiler, self).__init__(*args, **kwargs)
+        self._fooName = fooName
+
+    @staticmethod
+    def getEvaluationOrder(graph):
+        """Returns nodes of graph required by graphOutputs nodes. Dependencies go first
+
+        :param graph: Graph to walk
+        :type graph: :class:`~PyFlow.Core.GraphBase.GraphBase`
+        :rtype: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
+        order = []
+        visited = set()
+        for outputsNode in graph.getNodesList(classNameFilters=['graphOutputs']):
+            if outputsNode in visited:
+                continue
+            visited.add(outputsNode)
+            stack = [(outputsNode, iter(Py3GraphCompiler._upstreamNodes(outputsNode)))]
+            while len(stack):
+                current, lhsNodes = stack[-1]
+                for lhsNode in lhsNodes:
+                    if lhsNode not in visited:
+                        visited.add(lhsNode)
+                        stack.append((lhsNode, iter(Py3GraphCompiler._upstreamNodes(lhsNode))))
+                        break
+                else:
+                    stack.pop()
+                    order.append(current)
+        return order
+
+    @staticmethod
+    def _upstreamNodes(node):
+        if node.__class__.__name__ == "graphInputs":
+            return []
+        result = []
+        for inputPin in node.orderedInputs.values():
+            for lhsPin in inputPin.affected_by:
+                result.append(lhsPin.owningNode())
+        return result
+
+    @staticmethod
+    def isCompilable(node):
+        """Whether node can be part of compiled graph
+
+        :param node: Node to check
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        :rtype: bool
+        """
+        for pin in node.pins:
+            if pin.isExec():
+                return False
+        if node.__class__.__name__ in ("graphInputs", "graphOutputs"):
+            return True
+        # vectorized nodes pass arrays through numpy, generated code calls function directly
+        return node.getFunction() is not None and not node.isVectorized()
+
+    def compile(self, graph):
+        """Generates function from graph
+
+        :param graph: Graph to compile
+        :type graph: :class:`~PyFlow.Core.GraphBase.GraphBase`
+        :returns: Compiled graph
+        :rtype: :class:`~PyFlow.Core.PyCodeCompiler.CompiledGraph`
+        :raises GraphNotCompilable: If graph contains nodes which can not be compiled
+        """
+        order = self.getEvaluationOrder(graph)
+        for node in order:
+            if not self.isCompilable(node):
+                raise GraphNotCompilable("Node {0} can not be compiled".format(node.getName()))
+
+        scope = {}
+        variables = {}
+        inputPins = []
+        outputPins = []
+        constantPins = []
+        body = []
+
+        def constant(pin):
+            name = "c{}".format(len(constantPins))
+            constantPins.append(pin)
+            scope[name] = pin.currentData()
+            return name
+
+        def expression(inputPin):
+            if len(inputPin.affected_by) == 0:
+                return constant(inputPin)
+            lhsPin = list(inputPin.affected_by)[0]
+            return variables[lhsPin]
+
+        for nodeIndex, node in enumerate(order):
+            nodeClassName = node.__class__.__name__
+            if nodeClassName == "graphInputs":
+                for outPin in node.orderedOutputs.values():
+                    variables[outPin] = "a{}".format(len(inputPins))
+                    inputPins.append(outPin)
+                continue
+
+            if nodeClassName == "graphOutputs":
+                for inPin in node.orderedInputs.values():
+                    outputPins.append((inPin, expression(inPin)))
+                continue
+
+            fooName = "f{}".format(nodeIndex)
+            scope[fooName] = node.getFunction()
+            kwargs = []
+            refs = []
+            for inPin in node.orderedInputs.values():
+                kwargs.append("{0}={1}".format(inPin.name, expression(inPin)))
+            for outPin in node.orderedOutputs.values():
+                if outPin.name == "out":
+                    continue
+                refName = "r{0}_{1}".format(nodeIndex, outPin.pinIndex)
+                body.append("{0} = []".format(refName))
+                kwargs.append("{0}={1}.append".format(outPin.name, refName))
+                refs.append((outPin, refName))
+
+            call = "{0}({1})".format(fooName, ", ".join(kwargs))
+            if "out" in node.namePinOutputsMap:
+                resultName = "v{0}_{1}".format(nodeIndex, node.namePinOutputsMap["out"].pinIndex)
+                variables[node.namePinOutputsMap["out"]] = resultName
+                body.append("{0} = {1}".format(resultName, call))
+            else:
+                body.append(call)
+
+            for outPin, refName in refs:
+                resultName = "v{0}_{1}".format(nodeIndex, outPin.pinIndex)
+                defaultName = "d{0}_{1}".format(nodeIndex, outPin.pinIndex)
+                scope[defaultName] = outPin.defaultValue()
+                variables[outPin] = resultName
+                body.append("{0} = {1}[-1] if {1} else {2}".format(resultName, refName, defaultName))
+
+        results = [expr for pin, expr in outputPins]
+        body.append("return ({0})".format("".join(["{}, ".format(r) for r in results])))
+
+        source = "def {0}({1}):\n".format(self._fooName, ", ".join(variables[p] for p in inputPins))
+        for line in body:
+            source += "    {}\n".format(line)
+
+        Py3CodeCompiler().compile(source, moduleName="PyFlowGraphCompiler", scope=scope)
+        return CompiledGraph(scope[self._fooName], source, inputPins, [pin for pin, expr in outputPins], constantPins)
@@ -15,14 +15,38 @@
 
 from nine import str
 from blinker import Signal
+from copy import copy
 import json
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from PyFlow import findPinClassByType
 from PyFlow import getPinDefaultValueByType
 from PyFlow.Core.Common import *
 from PyFlow.Core.Interfaces import IItemBase
 
 
+def _isSameValue(lhs, rhs):
+    """Whether assigned value is equal to current one, so version is kept
+
+    Arrays are compared as whole, values which can not be compared count as different
+    """
+    if lhs is rhs:
+        return True
+    if type(lhs) != type(rhs):
+        return False
+    if numpy is not None and isinstance(lhs, numpy.ndarray):
+        return lhs.dtype == rhs.dtype and numpy.array_equal(lhs, rhs)
+    try:
+        return bool(lhs == rhs)
+    except (TypeError, ValueError):
+        # containers of arrays
+        return False
+
+
 class Variable(IItemBase):
     """Variable representation
 
@@ -75,6 +99,9 @@ class Variable(IItemBase):
         self._structure = structure
         self._accessLevel = accessLevel
         self._packageName = None
+        self._pinClass = None
+        # incremented every time value changes
+        self._version = 0
         self._uid = uuid.uuid4() if uid is None else uid
         assert(isinstance(self._uid, uuid.UUID))
         self.updatePackageName()
@@ -102,7 +129,24 @@ class Variable(IItemBase):
         return self.graph.graphManager.findVariableRefs(self)
 
     def updatePackageName(self):
-        self._packageName = findPinClassByType(self._dataType)._packageName
+        self._pinClass = findPinClassByType(self._dataType)
+        self._packageName = self._pinClass._packageName
+
+    @property
+    def pinClass(self):
+        """Pin class of variable data type. Looked up once per data type change
+
+        :rtype: :class:`~PyFlow.Core.PinBase.PinBase`
+        """
+        return self._pinClass
+
+    @property
+    def version(self):
+        """Counter incremented every time value changes. Readers can compare it to skip work when variable was not changed
+
+        :rtype: int
+        """
+        return self._version
 
     @property
     def packageName(self):
@@ -139,13 +183,20 @@ class Variable(IItemBase):
     @name.setter
     def name(self, value):
         assert(isinstance(value, str))
+        oldName = self._name
         self._name = value
+        self.graph.graphManager.onVariableRenamed(self, oldName)
         self.nameChanged.send(value)
 
     @property
     def value(self):
         """Variable value
 
+        Value is copied when assigned and is never changed in place after that, so readers share it
+        without copying. It should not be changed in place by readers either, new value should be assigned instead
+
+        .. seealso:: :attr:`version`
+
         :rtype: object
         """
         return self._value
@@ -154,16 +205,12 @@ class Variable(IItemBase):
     def value(self, value):
         # type checking if variable is not of any type
         if not self.dataType == 'AnyPin':
-            supportedDataTypes = findPinClassByType(self.dataType).supportedDataTypes()
-            if self.dataType not in supportedDataTypes:
+            if self.dataType not in self._pinClass.supportedDataTypes():
                 return
 
-        try:
-            if self._value != value or type(self._value) != type(value):
-                self._value = value
-                self.valueChanged.send(value)
-        except:
-            self._value = value
+        if not _isSameValue(self._value, value):
+            self._value = copy(value)
+            self._version += 1
             self.valueChanged.send(value)
 
     @property
@@ -213,7 +260,7 @@ class Variable(IItemBase):
         self._uid = value
 
     def serialize(self):
-        pinClass = findPinClassByType(self.dataType)
+        pinClass = self._pinClass
 
         template = Variable.jsonTemplate()
 
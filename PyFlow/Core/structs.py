@@ -13,12 +13,22 @@
 ## limitations under the License.
 
 
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
 class Tick(object):
     """ Element For Ramp Widget Basic U and V Attribute holder """
     def __init__(self):
         self._u = 0
         self._v = 0
         self._selected = False
+        # ramp which keeps this tick, notified when tick is moved
+        self._ramp = None
 
     def getU(self):
         return self._u
@@ -28,9 +38,13 @@ class Tick(object):
 
     def setU(self, u):
         self._u = u
+        if self._ramp is not None:
+            self._ramp.invalidate()
 
     def setV(self, v):
         self._v = v
+        if self._ramp is not None:
+            self._ramp.invalidate()
 
     def setSelected(self, selected):
         self._selected = selected
@@ -43,95 +57,175 @@ class splineRamp(object):
     """ Ramp/Curve Editor with evaluateAt support , clamped to 0-1 in both x and y"""
     def __init__(self):
         self.items = []
+        # items sorted by u with their positions and values, rebuilt on first evaluation after change
+        self._sortedItems = None
+        self._uList = None
+        self._vList = None
+        self._vArray = None
 
     def __getitem__(self, index):
         if len(self.items) and index in range(0, len(self.items)):
-            return self.sortedItems()[index]
+            return self._sorted()[index]
         else:
             return None
 
     @property
     def uValues(self):
-        return [x.getU() for x in self.sortedItems()]
+        self._sorted()
+        return list(self._uList)
 
     @property
     def yValues(self):
-        return [x.getV() for x in self.sortedItems()]
+        self._sorted()
+        return list(self._vList)
+
+    def invalidate(self):
+        """Drops sorted keys. Called when ticks are added, removed or moved
+        """
+        self._sortedItems = None
+
+    def _sorted(self):
+        if self._sortedItems is None:
+            itms = sorted(self.items, key=lambda x: x.getU())
+            self._uList = [x.getU() for x in itms]
+            self._vList = [x.getV() for x in itms]
+            self._vArray = None
+            self._sortedItems = itms
+        return self._sortedItems
+
+    def _valuesArray(self):
+        # values as float array of shape (keys,) or (keys, components), None if values can't be stored so
+        if self._vArray is None:
+            try:
+                array = numpy.asarray(self._vList, dtype=float)
+            except (TypeError, ValueError):
+                array = False
+            if array is not False and array.ndim not in (1, 2):
+                array = False
+            self._vArray = array
+        return self._vArray if self._vArray is not False else None
 
     def sortedItems(self):
-        itms = list(self.items)
-        itms.sort(key=lambda x: x.getU())
-        return itms
+        return list(self._sorted())
 
     def clear(self):
+        for item in self.items:
+            item._ramp = None
         self.items = []
+        self.invalidate()
 
     def addItem(self, u, v):
         item = Tick()
         item.setU(u)
         item.setV(v)
+        item._ramp = self
         self.items.append(item)
+        self.invalidate()
         return(item)
 
     def removeItem(self, item=None, index=-1):
         if item:
             if item in self.items:
                 self.items.remove(item)
+                item._ramp = None
         elif index in range(0, len(self.items) - 1):
-            self.items.remove(self.items[index])
+            self.items.pop(index)._ramp = None
+        self.invalidate()
 
     def setU(self, u, index=-1):
         if index in range(0, len(self.items) - 1):
-            self.sortedItems()[index].setU(u)
+            self._sorted()[index].setU(u)
 
     def setV(self, v, index=-1):
         if index in range(0, len(self.items) - 1):
-            self.sortedItems()[index].setV(v)
+            self._sorted()[index].setV(v)
 
     def evaluateAt(self, value, bezier=False):
-        items = self.sortedItems()
+        items = self._sorted()
         if len(items) > 1:
-            if value >= items[-1].getU():
-                return items[-1].getV()
-            elif value <= items[0].getU():
-                return items[0].getV()
+            uList = self._uList
+            vList = self._vList
+            if value >= uList[-1]:
+                return vList[-1]
+            elif value <= uList[0]:
+                return vList[0]
 
             if bezier:
-                if isinstance(items[0].getV(), list):
-                    v = []
-                    for i in range(len(items[0].getV())):
-                        v.append(self.interpolateBezier([p.getV()[i] for p in items], 0, len(items) - 1, value))
-                else:
-                    v = self.interpolateBezier([p.getV() for p in items], 0, len(items) - 1, value)
-            else:
-                interval = len(items) - 1
-                for i, x in enumerate(items):
-                    if value <= x.getU():
-                        interval = i
-                        break
-
-                u = max(0, min(1, (((value - items[interval - 1].getU()) * (1.0 - 0.0)) / (
-                    items[interval].getU() - items[interval - 1].getU())) + 0.0))
-
-                start = items[interval].getV()
-                end = items[interval - 1].getV()
-                if isinstance(start, list) and isinstance(end, list) and len(start) == len(end):
-                    v = []
-                    for i, element in enumerate(start):
-                        v.append(self.interpolateLinear(start[i], end[i], u))
-                elif not isinstance(start, list) or not isinstance(end, list):
-                    v = self.interpolateLinear(start, end, u)
-
-            return v
+                if isinstance(vList[0], list):
+                    return [self.interpolateBezier([p[i] for p in vList], 0, len(vList) - 1, value) for i in range(len(vList[0]))]
+                return self.interpolateBezier(vList, 0, len(vList) - 1, value)
+
+            # first key which is not less than value, keys before it are less
+            interval = bisect_left(uList, value)
+            u = max(0, min(1, (value - uList[interval - 1]) / float(uList[interval] - uList[interval - 1])))
+
+            start = vList[interval]
+            end = vList[interval - 1]
+            if isinstance(start, list) and isinstance(end, list):
+                if len(start) != len(end):
+                    raise ValueError("Ramp values have different sizes")
+                return [self.interpolateLinear(s, e, u) for s, e in zip(start, end)]
+            return self.interpolateLinear(start, end, u)
         elif len(items) == 1:
             return items[0].getV()
         else:
             return 0.0
 
+    def evaluateMany(self, values, bezier=False):
+        """Evaluates ramp at every value of array
+
+        Same as calling :meth:`evaluateAt` for every value, but whole array is evaluated at once
+        with NumPy when it is available
+
+        :param values: Positions to evaluate ramp at
+        :type values: list(float) or :class:`numpy.ndarray`
+        :param bezier: Whether to use bezier interpolation instead of linear
+        :type bezier: bool
+        :returns: Ramp values. NumPy array if values are given as NumPy array, list otherwise
+        :rtype: list or :class:`numpy.ndarray`
+        """
+        items = self._sorted()
+        vArray = self._valuesArray() if numpy is not None and len(items) > 1 else None
+        if vArray is None:
+            result = [self.evaluateAt(value, bezier) for value in values]
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                return numpy.asarray(result)
+            return result
+
+        t = numpy.asarray(values, dtype=float)
+        uArray = numpy.asarray(self._uList, dtype=float)
+        # extra axis for components, so positions broadcast over color channels
+        tColumn = t.reshape(t.shape + (1,) * (vArray.ndim - 1))
+
+        if bezier:
+            # de Casteljau for all positions at once, one level per step
+            points = [vArray[i] for i in range(len(vArray))]
+            for level in range(len(points) - 1, 0, -1):
+                points = [points[k] * (1 - tColumn) + points[k + 1] * tColumn for k in range(level)]
+            result = numpy.broadcast_to(points[0], t.shape + vArray.shape[1:]).copy()
+        else:
+            interval = numpy.clip(numpy.searchsorted(uArray, t, side="left"), 1, len(uArray) - 1)
+            lower = uArray[interval - 1]
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                ratio = numpy.clip((t - lower) / (uArray[interval] - lower), 0, 1)
+            ratio = ratio.reshape(tColumn.shape)
+            result = ratio * vArray[interval] + (1 - ratio) * vArray[interval - 1]
+
+        result = numpy.where(tColumn <= uArray[0], vArray[0], result)
+        result = numpy.where(tColumn >= uArray[-1], vArray[-1], result)
+        if isinstance(values, numpy.ndarray):
+            return result
+        return result.tolist()
+
     def interpolateBezier(self, coorArr, i, j, t):
-        if j == 0:
-            return coorArr[i]
-        return self.interpolateBezier(coorArr, i, j - 1, t) * (1 - t) + self.interpolateBezier(coorArr, i + 1, j - 1, t) * t
+        """Evaluates bezier curve with control points coorArr[i:i + j + 1] at t
+
+        Uses de Casteljau algorithm, levels are computed one after another instead of recursion
+        """
+        points = list(coorArr[i:i + j + 1])
+        for level in range(j, 0, -1):
+            points = [points[k] * (1 - t) + points[k + 1] * t for k in range(level)]
+        return points[0]
 
     def interpolateLinear(self, start, end, ratio):
         return (ratio * start + (1 - ratio) * end)
@@ -42,7 +42,7 @@ class FloatLib(FunctionLibraryBase):
         return abs(a - b) < abs_tol
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('FloatPin', 0.0), meta={NodeMeta.CATEGORY: 'Math|Float', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('FloatPin', 0.0), meta={NodeMeta.CATEGORY: 'Math|Float', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def multByPi(a=('FloatPin', 0.0)):
         '''
         Multiplies the input value by pi.
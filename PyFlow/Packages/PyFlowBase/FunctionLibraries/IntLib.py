@@ -26,37 +26,37 @@ class IntLib(FunctionLibraryBase):
         super(IntLib, self).__init__(packageName)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def bitwiseAnd(a=('IntPin', 0), b=('IntPin', 0)):
         """Bitwise AND ``(A & B)``"""
         return a & b
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def bitwiseNot(a=('IntPin', 0)):
         """Bitwise NOT ``(~A)``"""
         return ~a
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def bitwiseOr(a=('IntPin', 0), b=('IntPin', 0)):
         """Bitwise OR ``(A | B)``"""
         return a | b
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def bitwiseXor(a=('IntPin', 0), b=('IntPin', 0)):
         """Bitwise XOR ``(A ^ B)``"""
         return a ^ b
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def binaryLeftShift(a=('IntPin', 0), b=('IntPin', 0)):
         """Binary left shift ``a << b``"""
         return a << b
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: []})
+    @IMPLEMENT_NODE(returns=('IntPin', 0), meta={NodeMeta.CATEGORY: 'Math|Bits manipulation', NodeMeta.KEYWORDS: [], NodeMeta.VECTORIZABLE: True})
     def binaryRightShift(a=('IntPin', 0), b=('IntPin', 0)):
         """Binary right shift ``a << b``"""
         return a >> b
@@ -0,0 +1,60 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+import numpy
+
+from PyFlow.Core import(
+    FunctionLibraryBase,
+    IMPLEMENT_NODE
+)
+from PyFlow.Core.Common import *
+
+
+class NdArrayLib(FunctionLibraryBase):
+    """Conversions between lists and NumPy array pins
+    """
+
+    def __init__(self, packageName):
+        super(NdArrayLib, self).__init__(packageName)
+
+    @staticmethod
+    @IMPLEMENT_NODE(returns=('FloatArrayPin', numpy.zeros(0)), meta={NodeMeta.CATEGORY: 'Array|NumPy', NodeMeta.KEYWORDS: ['range']})
+    def linspace(start=('FloatPin', 0.0), stop=('FloatPin', 1.0), num=('IntPin', 50)):
+        '''Returns `num` evenly spaced values from `start` to `stop` inclusive.'''
+        return numpy.linspace(start, stop, max(num, 0))
+
+    @staticmethod
+    @IMPLEMENT_NODE(returns=('FloatArrayPin', numpy.zeros(0)), meta={NodeMeta.CATEGORY: 'Array|NumPy', NodeMeta.KEYWORDS: ['convert']})
+    def toFloatArray(values=('FloatPin', [])):
+        '''Converts list of floats to float array.'''
+        return values
+
+    @staticmethod
+    @IMPLEMENT_NODE(returns=('IntArrayPin', numpy.zeros(0, dtype=numpy.int64)), meta={NodeMeta.CATEGORY: 'Array|NumPy', NodeMeta.KEYWORDS: ['convert']})
+    def toIntArray(values=('IntPin', [])):
+        '''Converts list of integers to integer array.'''
+        return values
+
+    @staticmethod
+    @IMPLEMENT_NODE(returns=('FloatPin', []), meta={NodeMeta.CATEGORY: 'Array|NumPy', NodeMeta.KEYWORDS: ['convert']})
+    def floatArrayToList(array=('FloatArrayPin', numpy.zeros(0))):
+        '''Converts float array to list of floats.'''
+        return array.tolist()
+
+    @staticmethod
+    @IMPLEMENT_NODE(returns=('IntPin', []), meta={NodeMeta.CATEGORY: 'Array|NumPy', NodeMeta.KEYWORDS: ['convert']})
+    def intArrayToList(array=('IntArrayPin', numpy.zeros(0, dtype=numpy.int64))):
+        '''Converts integer array to list of integers.'''
+        return array.tolist()
@@ -38,19 +38,19 @@ class PathLib(FunctionLibraryBase):
         return osPath.abspath(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def basename(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"})):
         '''Return the base name of pathname path. This is the second element of the pair returned by passing path to the function split(). Note that the result of this function is different from the Unix basename program; where basename for '/foo/bar/' returns 'bar', the basename() function returns an empty string ('')'''
         return osPath.basename(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def commonprefix(path=("StringPin", [])):
         '''Return the longest path prefix (taken character-by-character) that is a prefix of all paths in list. If list is empty, return the empty string (''). Note that this may return invalid paths because it works a character at a time'''
         return osPath.commonprefix(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Extract', NodeMeta.KEYWORDS: ["file", "folder", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def dirname(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"})):
         '''Return the directory name of pathname path. This is the first element of the pair returned by passing path to the function split().'''
         return osPath.dirname(path)
@@ -108,7 +108,7 @@ class PathLib(FunctionLibraryBase):
         return osPath.getctime(path, path2)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("BoolPin", False), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Test', NodeMeta.KEYWORDS: ["test", "file", "path"]})
+    @IMPLEMENT_NODE(returns=("BoolPin", False), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Test', NodeMeta.KEYWORDS: ["test", "file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def isabs(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"})):
         '''Return True if path is an absolute pathname. On Unix, that means it begins with a slash, on Windows that it begins with a (back)slash after chopping off a potential drive letter.'''
         return osPath.isabs(path)
@@ -138,20 +138,20 @@ class PathLib(FunctionLibraryBase):
         return osPath.ismount(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["test", "file", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["test", "file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def join(base=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"}), paths=("StringPin", [])):
         '''Join one or more path components intelligently. The return value is the concatenation of path and any members of *paths with exactly one directory separator (os.sep) following each non-empty part except the last, meaning that the result will only end in a separator if the last part is empty. If a component is an absolute path, all previous components are thrown away and joining continues from the absolute path component.
         On Windows, the drive letter is not reset when an absolute path component (e.g., r'\foo') is encountered. If a component contains a drive letter, all previous components are thrown away and the drive letter is reset. Note that since there is a current directory for each drive, os.path.join("c:", "foo") represents a path relative to the current directory on drive C: (c:foo), not c:\foo.'''
         return osPath.join(base, paths)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["file", "folder", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["file", "folder", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def normcase(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"})):
         '''Normalize the case of a pathname. On Unix and Mac OS X, this returns the path unchanged; on case-insensitive filesystems, it converts the path to lowercase. On Windows, it also converts forward slashes to backward slashes.'''
         return osPath.normcase(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["file", "folder", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", ""), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Convert', NodeMeta.KEYWORDS: ["file", "folder", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def normpath(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"})):
         '''Normalize a pathname by collapsing redundant separators and up-level references so that A//B, A/B/, A/./B and A/foo/../B all become A/B. This string manipulation may change the meaning of a path that contains symbolic links. On Windows, it converts forward slashes to backward slashes. To normalize case, use normcase().'''
         return osPath.normpath(path)
@@ -171,7 +171,7 @@ class PathLib(FunctionLibraryBase):
         return osPath.relpath(path)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def split(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"}), head=(REF, ("StringPin", "")), tail=(REF, ("StringPin", ""))):
         '''Split the pathname path into a pair, (head, tail) where tail is the last pathname component and head is everything leading up to that. The tail part will never contain a slash; if path ends in a slash, tail will be empty. If there is no slash in path, head will be empty. If path is empty, both head and tail are empty. Trailing slashes are stripped from head unless it is the root (one or more slashes only). In all cases, join(head, tail) returns a path to the same location as path (but the strings may differ). Also see the functions dirname() and basename().'''
         splited = osPath.split(path)
@@ -184,7 +184,7 @@ class PathLib(FunctionLibraryBase):
         return list(splited)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def splitdrive(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"}), drive=(REF, ("StringPin", "")), tail=(REF, ("StringPin", ""))):
         '''Split the pathname path into a pair (drive, tail) where drive is either a drive specification or the empty string. On systems which do not use drive specifications, drive will always be the empty string. In all cases, drive + tail will be the same as path.'''
         splited = osPath.splitdrive(path)
@@ -197,7 +197,7 @@ class PathLib(FunctionLibraryBase):
         return list(splited)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def splitext(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"}), root=(REF, ("StringPin", "")), ext=(REF, ("StringPin", ""))):
         '''Split the pathname path into a pair (root, ext) such that root + ext == path, and ext is empty or begins with a period and contains at most one period. Leading periods on the basename are ignored; splitext('.cshrc') returns ('.cshrc', '').'''
         splited = osPath.splitext(path)
@@ -210,7 +210,7 @@ class PathLib(FunctionLibraryBase):
         return list(splited)
 
     @staticmethod
-    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"]})
+    @IMPLEMENT_NODE(returns=("StringPin", []), meta={NodeMeta.CATEGORY: 'Python|OS|Path|Split', NodeMeta.KEYWORDS: ["file", "path"], NodeMeta.SIDE_EFFECT_FREE: True})
     def splitunc(path=("StringPin", "", {PinSpecifires.INPUT_WIDGET_VARIANT: "PathWidget"}), unc=(REF, ("StringPin", "")), rest=(REF, ("StringPin", ""))):
         '''Split the pathname path into a pair (unc, rest) so that unc is the UNC mount point (such as r'\\host\mount'), if present, and rest the rest of the path (such as r'\path\file.ext'). For paths containing drive letters, unc will always be the empty string.'''
         splited = osPath.splitunc(path)
@@ -70,8 +70,5 @@ class colorRamp(NodeBase):
         if not self.input.isArray():
             self.output.setData(self.ramp.evaluateAt(self.input.getData(),bezier))
         else:
-            result = []
-            for i in self.input.getData():
-                result.append(self.ramp.evaluateAt(i,bezier))
-            self.output.setData(result)
+            self.output.setData(self.ramp.evaluateMany(self.input.getData(), bezier))
         push(self.output)
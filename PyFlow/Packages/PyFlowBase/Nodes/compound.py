@@ -15,47 +15,342 @@
 
 import os
 import json
+import logging
 import weakref
 from copy import deepcopy
+from functools import partial
 
 from blinker import Signal
 
 from PyFlow.Core import NodeBase
 from PyFlow.Core import GraphBase
 from PyFlow.Core.Common import *
+from PyFlow.Core.PyCodeCompiler import Py3GraphCompiler, GraphNotCompilable
+
+
+logger = logging.getLogger(None)
+
+
+def _containsTickingNodes(graphData):
+    """Whether serialized graph or its subgraphs have nodes which should be ticked even if nobody uses them
+    """
+    from PyFlow import GET_PACKAGES
+    packages = GET_PACKAGES()
+    graphs = [graphData]
+    while len(graphs) > 0:
+        for nodeJson in graphs.pop()['nodes']:
+            if 'graphData' in nodeJson:
+                graphs.append(nodeJson['graphData'])
+            if nodeJson['package'] not in packages:
+                continue
+            nodeClass = packages[nodeJson['package']].GetNodeClasses().get(nodeJson['type'])
+            if nodeClass is not None and nodeClass.ticksByDefault():
+                return True
+    return False
+
+
+def _collectNodeNames(graphData):
+    """Returns names of nodes of serialized graph and its subgraphs
+    """
+    names = []
+    graphs = [graphData]
+    while len(graphs) > 0:
+        for nodeJson in graphs.pop()['nodes']:
+            names.append(nodeJson['name'])
+            if 'graphData' in nodeJson:
+                graphs.append(nodeJson['graphData'])
+    return names
+
+
+def _collectVariableUids(graphData):
+    """Returns uids of variables referenced by nodes of serialized graph and its subgraphs
+    """
+    uids = []
+    graphs = [graphData]
+    while len(graphs) > 0:
+        for nodeJson in graphs.pop()['nodes']:
+            if 'varUid' in nodeJson:
+                uids.append(nodeJson['varUid'])
+            if 'graphData' in nodeJson:
+                graphs.append(nodeJson['graphData'])
+    return uids
+
+
+def _collectVariableNames(graphData):
+    """Returns names of variables of serialized graph and its subgraphs
+    """
+    names = []
+    graphs = [graphData]
+    while len(graphs) > 0:
+        data = graphs.pop()
+        for varJson in data['vars']:
+            names.append(varJson['name'])
+        for nodeJson in data['nodes']:
+            if 'graphData' in nodeJson:
+                graphs.append(nodeJson['graphData'])
+    return names
 
 
 class compound(NodeBase):
     """This node encapsulates a graph, like compound in xsi
 
     pins can be edited only from inside the compound
+
+    If compilation is enabled and inner graph consists of pure function library nodes only,
+    inner graph is evaluated as single generated python function.
+
+    When created from serialized data, inner graph is kept serialized and companion pins are created
+    from serialized graphInputs and graphOutputs nodes. Graph is created on first access to
+    :attr:`rawGraph`, for example when compound is evaluated or user steps into it.
+    Names of serialized nodes and variables are reserved meanwhile, so inner nodes keep their names when loaded
+    and new variables do not get names of serialized ones.
+    Graph manager loads such compounds when they are searched for inner nodes, graphs, variables or variable accessors,
+    see :meth:`~PyFlow.Core.GraphManager.GraphManager.loadCompounds`.
+    Graphs with nodes that need ticks, like timers, are loaded at once.
+
+    Compounds created from :class:`~PyFlow.Core.CompoundRegistry.CompoundDefinition` share definition data and
+    are serialized as reference to it. While own graph is not created, they are evaluated by graph compiled once
+    for definition, see :meth:`~PyFlow.Core.CompoundRegistry.CompoundDefinition.getCompiledGraph`. Own graph is
+    created from copy of definition data when compound is opened, or evaluated if definition graph can not be compiled.
+    When nodes, connections, values of not connected pins or variables of inner graph are changed,
+    compound becomes independent and is serialized with graph data.
+
+    .. seealso:: :class:`~PyFlow.Core.PyCodeCompiler.Py3GraphCompiler`
+
+    :var lazyGraphLoading: Whether to postpone creation of inner graph loaded from serialized data
+    :vartype lazyGraphLoading: bool
+    :var storeDefinitionGraphData: Whether to store graph data next to definition reference,
+        so compound can be loaded where definition is not available
+    :vartype storeDefinitionGraphData: bool
     """
+
+    lazyGraphLoading = True
+    storeDefinitionGraphData = False
+
     def __init__(self, name):
         super(compound, self).__init__(name)
         self.isCompoundNode = True
         self.pinExposed = Signal(object)
+        self.graphLoaded = Signal(object)
         self._rawGraph = None
-        self._rawGraphJson = None
+        # inner graph data waiting to be loaded
+        self._serializedGraph = None
+        # whether serialized graph is registered in graph manager
+        self._bRegisteredUnloaded = False
+        # exported compound this node is instance of
+        self._definition = None
+        # signals which detach compound from definition, (signal, receiver) pairs
+        self._definitionWatches = []
         self.__inputsMap = {}
         self.__outputsMap = {}
         self.bCacheEnabled = False
+        self._bCompileEnabled = False
+        self._compiledGraph = None
+        self._compiledGraphVersion = None
 
     @property
     def inputsMap(self):
+        self.loadGraph()
         return self.__inputsMap
 
     @property
     def outputsMap(self):
+        self.loadGraph()
         return self.__outputsMap
 
     @property
     def rawGraph(self):
+        self.loadGraph()
         return self._rawGraph
 
     @rawGraph.setter
     def rawGraph(self, newGraph):
         assert(newGraph is not None)
+        if self._rawGraph is not None:
+            self._rawGraph.nodeAdded.disconnect(self.onInnerNodeAdded)
+            self._rawGraph.nodeModified.disconnect(self.onInnerNodeModified)
+            self._rawGraph.variablesChanged.disconnect(self.onInnerValueChanged)
         self._rawGraph = newGraph
+        # companion pins follow graphInputs and graphOutputs nodes
+        newGraph.nodeAdded.connect(self.onInnerNodeAdded)
+        newGraph.nodeModified.connect(self.onInnerNodeModified)
+        newGraph.variablesChanged.connect(self.onInnerValueChanged)
+        for node in newGraph.getNodesList(classNameFilters=['graphInputs', 'graphOutputs']):
+            self.onInnerNodeAdded(node)
+
+    def onInnerNodeModified(self, node):
+        """Reaction when node of inner graph was changed
+
+        Compound stops being instance of definition and reports itself as modified, so changes inside
+        nested compounds reach outer ones
+
+        :param node: Changed node of inner graph
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        self._detachFromDefinition()
+        self.notifyModified()
+
+    def onInnerValueChanged(self, *args, **kwargs):
+        """Reaction when value of not connected inner pin or inner variable was changed, or variable was created or killed
+
+        Values are not watched after compound stops being instance of definition
+        """
+        self._detachFromDefinition()
+        self.notifyModified()
+
+    def _watchDefinitionValues(self, graph):
+        """Watches values stored in graph data, so compound which is instance of definition is detached when they change
+
+        Connections and nodes changes are reported by :attr:`~PyFlow.Core.GraphBase.GraphBase.nodeModified`.
+        Nested compounds are watched when they load their graphs
+        """
+        if self._definition is None:
+            return
+        watches = []
+        for node in graph.getNodesList():
+            for pin in node.inputs.values():
+                if not pin.isExec() and not pin.hasConnections():
+                    watches.append((pin.dataBeenSet, self.onInnerValueChanged))
+            if node.isCompoundNode:
+                if node.isGraphLoaded():
+                    self._watchDefinitionValues(node.rawGraph)
+                else:
+                    watches.append((node.graphLoaded, self._watchDefinitionValues))
+        for variable in graph.getVars().values():
+            watches.append((variable.valueChanged, self.onInnerValueChanged))
+        for signal, receiver in watches:
+            signal.connect(receiver)
+        self._definitionWatches.extend(watches)
+
+    def _detachFromDefinition(self):
+        if self._definition is None:
+            return
+        self._definition = None
+        for signal, receiver in self._definitionWatches:
+            signal.disconnect(receiver)
+        self._definitionWatches = []
+
+    def getDefinition(self):
+        """Returns definition this compound is instance of
+
+        :rtype: :class:`~PyFlow.Core.CompoundRegistry.CompoundDefinition` or None
+        """
+        return self._definition
+
+    def isGraphLoaded(self):
+        """Whether inner graph is created or still kept serialized
+
+        :rtype: bool
+        """
+        return self._serializedGraph is None
+
+    def loadGraph(self):
+        """Creates inner graph from serialized data, if it was not created yet
+
+        Companion pins created from serialized data are bound to pins of graphInputs and graphOutputs nodes.
+        :attr:`graphLoaded` is sent when done
+        """
+        if self._serializedGraph is None:
+            return
+        if self._definition is not None:
+            # definition data is shared
+            graphData = self._definition.instanceData()
+        else:
+            graphData = self._serializedGraph
+        self._serializedGraph = None
+        self._unregisterUnloaded()
+        graph = GraphBase(self.name, self.graph().graphManager, self.graph())
+        graphData['name'] = self.getName()
+        # companion pins are bound after inner connections are restored, same order as when loaded at once
+        self._rawGraph = graph
+        graph.populateFromJson(graphData)
+        self._rawGraph = None
+        self.rawGraph = graph
+        self._watchDefinitionValues(graph)
+        self.invalidateCompiledGraph()
+        self.graphLoaded.send(self._rawGraph)
+
+    def onInnerNodeAdded(self, node):
+        """Reaction when node added to inner graph
+
+        Companion pins are created for graphInputs and graphOutputs nodes now and every time they get new pin
+
+        :param node: Node added to inner graph
+        :type node: :class:`~PyFlow.Core.NodeBase.NodeBase`
+        """
+        nodeClassName = node.__class__.__name__
+        if nodeClassName == 'graphInputs':
+            node.pinCreated.connect(self.onGraphInputPinCreated)
+        elif nodeClassName == 'graphOutputs':
+            node.pinCreated.connect(self.onGraphOutputPinCreated)
+        else:
+            return
+        self.syncPins()
+
+    def isCompileEnabled(self):
+        return self._bCompileEnabled
+
+    def setCompileEnabled(self, bEnabled):
+        """Turns inner graph compilation on or off
+
+        :param bEnabled: Whether to evaluate inner graph as generated function
+        :type bEnabled: bool
+        """
+        bEnabled = bool(bEnabled)
+        if bEnabled != self._bCompileEnabled:
+            self._bCompileEnabled = bEnabled
+            self.invalidateCompiledGraph()
+            if self.graph is not None:
+                self.graph().bumpTopologyVersion()
+
+    def invalidateCompiledGraph(self, *args, **kwargs):
+        if self._compiledGraph is not None:
+            for pin in self._compiledGraph.constantPins:
+                pin.dataBeenSet.disconnect(self.invalidateCompiledGraph)
+        self._compiledGraph = None
+        self._compiledGraphVersion = None
+
+    def getCompiledGraph(self):
+        """Returns compiled inner graph. Compiles it if graph was changed since last compilation
+
+        :rtype: :class:`~PyFlow.Core.PyCodeCompiler.CompiledGraph` or None
+        """
+        if not self._bCompileEnabled:
+            return None
+        if self._compiledGraphVersion == self.rawGraph.topologyVersion:
+            return self._compiledGraph
+        self.invalidateCompiledGraph()
+        try:
+            self._compiledGraph = Py3GraphCompiler().compile(self.rawGraph)
+        except GraphNotCompilable:
+            self._compiledGraph = None
+        except Exception:
+            logger.exception("Failed to compile {0}, graph will be evaluated node by node".format(self.getName()))
+            self._compiledGraph = None
+        self._compiledGraphVersion = self.rawGraph.topologyVersion
+        if self._compiledGraph is not None:
+            # values of not connected pins are baked into generated code
+            for pin in self._compiledGraph.constantPins:
+                pin.dataBeenSet.connect(self.invalidateCompiledGraph)
+        return self._compiledGraph
+
+    def getSharedCompiledGraph(self):
+        """Returns graph compiled for definition, if compound is evaluated by it
+
+        It is used while compound is instance of definition and own graph is not created
+
+        :rtype: :class:`~PyFlow.Core.PyCodeCompiler.CompiledGraph` or None
+        """
+        if self._serializedGraph is None or self._definition is None:
+            return None
+        return self._definition.getCompiledGraph()
+
+    def isCompiled(self):
+        """Whether inner graph is evaluated as generated function, own or shared with other instances of definition
+
+        :rtype: bool
+        """
+        return self.getSharedCompiledGraph() is not None or self.getCompiledGraph() is not None
 
     def syncPins(self):
         # look for graph nodes pins was added
@@ -70,6 +365,8 @@ class compound(NodeBase):
                 # create companion pin if needed
                 if outPin.name not in nodeInputPins:
                     self.onGraphInputPinCreated(outPin)
+                elif nodeInputPins[outPin.name] not in self.__inputsMap:
+                    self._bindInputCompanion(nodeInputPins[outPin.name], outPin)
 
         graphOutputNodes = self.rawGraph.getNodesList(classNameFilters=['graphOutputs'])
         graphOutputPins = {}
@@ -79,6 +376,8 @@ class compound(NodeBase):
                 # create companion pin if needed
                 if inPin.name not in nodeOutputPins:
                     self.onGraphOutputPinCreated(inPin)
+                elif nodeOutputPins[inPin.name] not in self.__outputsMap:
+                    self._bindOutputCompanion(nodeOutputPins[inPin.name], inPin)
 
         for nodeInputPinName, nodeInputPin in nodeInputPins.items():
             if nodeInputPinName not in graphInputPins:
@@ -94,15 +393,10 @@ class compound(NodeBase):
                     clearSignal(nodeOutputPin.killed)
                     self.__outputsMap.pop(nodeOutputPin)
 
-    def Tick(self, delta):
-        self.syncPins()
-        self.rawGraph.Tick(delta)
-        super(compound, self).Tick(delta)
-
     def setName(self, name):
         super(compound, self).setName(name)
-        if self.rawGraph is not None:
-            self.rawGraph.name = self.getName()
+        if self._rawGraph is not None:
+            self._rawGraph.name = self.getName()
 
     @staticmethod
     def category():
@@ -118,7 +412,20 @@ class compound(NodeBase):
 
     def serialize(self):
         default = NodeBase.serialize(self)
-        default['graphData'] = self.rawGraph.serialize()
+        if self._definition is not None:
+            default['compoundDefinition'] = self._definition.name
+            default['compoundPackage'] = self._definition.packageName
+            if self.storeDefinitionGraphData:
+                # used if definition is not found when loaded
+                default['graphData'] = self._definition.instanceData()
+                default['graphData']['name'] = self.getName()
+        elif self._serializedGraph is not None:
+            # saving does not require graph to be loaded
+            default['graphData'] = deepcopy(self._serializedGraph)
+            default['graphData']['name'] = self.getName()
+        else:
+            default['graphData'] = self.rawGraph.serialize()
+        default['compileEnabled'] = self._bCompileEnabled
         return default
 
     def onGraphInputPinCreated(self, outPin):
@@ -141,6 +448,12 @@ class compound(NodeBase):
             subgraphInputPin.supportedDataTypes = outPin.supportedDataTypes
             subgraphInputPin.enableOptions(PinOptions.AllowAny | PinOptions.DictElementSupported)
 
+        self._bindInputCompanion(subgraphInputPin, outPin)
+
+        # broadcast for UI wrapper class
+        self.pinExposed.send(subgraphInputPin)
+
+    def _bindInputCompanion(self, subgraphInputPin, outPin):
         outPin.owningNode().constraints[outPin.constraint].append(subgraphInputPin)
         self.constraints[outPin.constraint].append(outPin)
 
@@ -149,14 +462,19 @@ class compound(NodeBase):
 
         self.__inputsMap[subgraphInputPin] = outPin
         pinAffects(subgraphInputPin, outPin)
+        self.graph().bumpTopologyVersion()
         # connect
 
         def forceRename(name):
             subgraphInputPin.setName(name, force=True)
         outPin.nameChanged.connect(forceRename, weak=False)
 
-        # broadcast for UI wrapper class
-        self.pinExposed.send(subgraphInputPin)
+        def removeCompanion(*args, **kwargs):
+            if subgraphInputPin in self.__inputsMap:
+                subgraphInputPin.kill()
+                clearSignal(subgraphInputPin.killed)
+                self.__inputsMap.pop(subgraphInputPin)
+        outPin.killed.connect(removeCompanion, weak=False)
 
     def onGraphOutputPinCreated(self, inPin):
         """Reaction when pin added to graphOutputs node
@@ -177,6 +495,12 @@ class compound(NodeBase):
             subgraphOutputPin.supportedDataTypes = inPin.supportedDataTypes
             subgraphOutputPin.enableOptions(PinOptions.AllowAny | PinOptions.DictElementSupported)
 
+        self._bindOutputCompanion(subgraphOutputPin, inPin)
+
+        # broadcast for UI wrapper class
+        self.pinExposed.send(subgraphOutputPin)
+
+    def _bindOutputCompanion(self, subgraphOutputPin, inPin):
         if subgraphOutputPin.isExec():
             inPin.onExecute.connect(subgraphOutputPin.call)
 
@@ -188,23 +512,66 @@ class compound(NodeBase):
 
         self.__outputsMap[subgraphOutputPin] = inPin
         pinAffects(inPin, subgraphOutputPin)
+        self.graph().bumpTopologyVersion()
 
         # connect
         def forceRename(name):
             subgraphOutputPin.setName(name, force=True)
         inPin.nameChanged.connect(forceRename, weak=False)
 
-        # broadcast for UI wrapper class
-        self.pinExposed.send(subgraphOutputPin)
+        def removeCompanion(*args, **kwargs):
+            if subgraphOutputPin in self.__outputsMap:
+                subgraphOutputPin.kill()
+                clearSignal(subgraphOutputPin.killed)
+                self.__outputsMap.pop(subgraphOutputPin)
+        inPin.killed.connect(removeCompanion, weak=False)
+
+    def _registerUnloaded(self, nodeNames):
+        self.graph().graphManager.addUnloadedCompound(self, nodeNames,
+                                                      _collectVariableUids(self._serializedGraph),
+                                                      _collectVariableNames(self._serializedGraph))
+        self._bRegisteredUnloaded = True
+
+    def _unregisterUnloaded(self):
+        if self._bRegisteredUnloaded:
+            self.graph().graphManager.removeUnloadedCompound(self)
+            self._bRegisteredUnloaded = False
 
     def kill(self, *args, **kwargs):
-        self.rawGraph.remove()
+        if self._rawGraph is not None:
+            self._rawGraph.remove()
+        elif self.graph is not None and self.graph() is not None:
+            self._unregisterUnloaded()
         super(compound, self).kill(*args, **kwargs)
 
     def postCreate(self, jsonTemplate=None):
         super(compound, self).postCreate(jsonTemplate=jsonTemplate)
 
-        if jsonTemplate is not None and 'graphData' in jsonTemplate:
+        if jsonTemplate is not None and 'compoundDefinition' in jsonTemplate:
+            from PyFlow.Core.CompoundRegistry import CompoundRegistry
+            self._definition = CompoundRegistry().findDefinition(jsonTemplate['compoundPackage'], jsonTemplate['compoundDefinition'])
+            if self._definition is None and 'graphData' in jsonTemplate:
+                logger.warning("Compound definition {0} not found in package {1}, stored graph is used".format(jsonTemplate['compoundDefinition'], jsonTemplate['compoundPackage']))
+            elif self._definition is None:
+                logger.error("Compound definition {0} not found in package {1}, compound is empty".format(jsonTemplate['compoundDefinition'], jsonTemplate['compoundPackage']))
+
+        if self._definition is not None:
+            self._serializedGraph = self._definition.graphData
+            # instances get unique node names when loaded, so names are not reserved
+            self._registerUnloaded([])
+            self._createCompanionsFromData(self._serializedGraph)
+            if jsonTemplate is not None:
+                self._restoreCompanionUids(jsonTemplate)
+                self.setCompileEnabled(jsonTemplate.get('compileEnabled', False))
+            if not self.lazyGraphLoading or _containsTickingNodes(self._serializedGraph):
+                self.loadGraph()
+        elif jsonTemplate is not None and 'graphData' in jsonTemplate and self.lazyGraphLoading and not _containsTickingNodes(jsonTemplate['graphData']):
+            self._serializedGraph = jsonTemplate['graphData']
+            self._registerUnloaded(_collectNodeNames(self._serializedGraph))
+            self._createCompanionsFromData(self._serializedGraph)
+            self._restoreCompanionUids(jsonTemplate)
+            self.setCompileEnabled(jsonTemplate.get('compileEnabled', False))
+        elif jsonTemplate is not None and 'graphData' in jsonTemplate:
             parentGraph = self.graph().graphManager.findGraph(jsonTemplate['owningGraphName'])
             self.rawGraph = GraphBase(self.name, self.graph().graphManager, parentGraph)
             # recreate graph contents
@@ -220,9 +587,59 @@ class compound(NodeBase):
             outputsMap = self.namePinOutputsMap
             for outJson in jsonTemplate['outputs']:
                 outputsMap[outJson['name']].uid = uuid.UUID(outJson['uuid'])
+
+            self.setCompileEnabled(jsonTemplate.get('compileEnabled', False))
         else:
             self.rawGraph = GraphBase(self.name, self.graph().graphManager, self.graph().graphManager.activeGraph())
 
+    def _createCompanionsFromData(self, graphData):
+        """Creates companion pins described by serialized graphInputs and graphOutputs nodes
+
+        Pins are bound to inner pins when graph is loaded
+        """
+        for nodeJson in graphData['nodes']:
+            if nodeJson['type'] == 'graphInputs':
+                for pinJson in sorted(nodeJson['outputs'], key=lambda x: x['pinIndex']):
+                    pin = self.createInputPin(pinJson['name'],
+                                              pinJson['dataType'],
+                                              None,
+                                              partial(self._callInnerPin, pinJson['name']),
+                                              StructureType.Multi,
+                                              pinJson['name'],
+                                              pinJson['name'],
+                                              group=nodeJson['name'])
+                    if pin.isAny():
+                        pin.enableOptions(PinOptions.AllowAny | PinOptions.DictElementSupported)
+            elif nodeJson['type'] == 'graphOutputs':
+                for pinJson in sorted(nodeJson['inputs'], key=lambda x: x['pinIndex']):
+                    pin = self.createOutputPin(pinJson['name'],
+                                               pinJson['dataType'],
+                                               None,
+                                               StructureType.Multi,
+                                               pinJson['name'],
+                                               pinJson['name'],
+                                               group=nodeJson['name'])
+                    if pin.isAny():
+                        pin.enableOptions(PinOptions.AllowAny | PinOptions.DictElementSupported)
+
+    def _restoreCompanionUids(self, jsonTemplate):
+        inputsMap = self.namePinInputsMap
+        for inpJson in jsonTemplate['inputs']:
+            if inpJson['name'] in inputsMap:
+                inputsMap[inpJson['name']].uid = uuid.UUID(inpJson['uuid'])
+
+        outputsMap = self.namePinOutputsMap
+        for outJson in jsonTemplate['outputs']:
+            if outJson['name'] in outputsMap:
+                outputsMap[outJson['name']].uid = uuid.UUID(outJson['uuid'])
+
+    def _callInnerPin(self, pinName, *args, **kwargs):
+        # exec companion created before graph was loaded
+        for outerPin, innerPin in self.inputsMap.items():
+            if outerPin.name == pinName:
+                innerPin.call(*args, **kwargs)
+                return
+
     def addNode(self, node):
         self.rawGraph.addNode(node)
 
@@ -230,6 +647,32 @@ class compound(NodeBase):
         pass
 
     def compute(self, *args, **kwargs):
+        sharedGraph = self.getSharedCompiledGraph()
+        if sharedGraph is not None:
+            # pins of definition graph are matched by name
+            inputs = self.namePinInputsMap
+            outputs = self.namePinOutputsMap
+            results = sharedGraph(*[inputs[pin.name].getData() for pin in sharedGraph.inputPins])
+            for innerPin, value in zip(sharedGraph.outputPins, results):
+                outputs[innerPin.name].setData(value)
+            return
+        self.loadGraph()
+        compiledGraph = self.getCompiledGraph()
+        if compiledGraph is not None:
+            innerToOuterInputs = dict((innerPin, outerPin) for outerPin, innerPin in self.__inputsMap.items())
+            innerToOuterOutputs = dict((innerPin, outerPin) for outerPin, innerPin in self.__outputsMap.items())
+            args = []
+            for innerPin in compiledGraph.inputPins:
+                if innerPin in innerToOuterInputs:
+                    args.append(innerToOuterInputs[innerPin].getData())
+                else:
+                    args.append(innerPin.currentData())
+            results = compiledGraph(*args)
+            for innerPin, value in zip(compiledGraph.outputPins, results):
+                if innerPin in innerToOuterOutputs:
+                    innerToOuterOutputs[innerPin].setData(value)
+            return
+
         # put data from inner graph pins to outer compound node output companions
         for outputPin, innerPin in self.__outputsMap.items():
             outputPin.setData(innerPin.getData())
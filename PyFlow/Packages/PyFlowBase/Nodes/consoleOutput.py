@@ -18,7 +18,6 @@ import logging
 
 from PyFlow.Core import NodeBase
 from PyFlow.Core.NodeBase import NodePinsSuggestionsHelper
-from PyFlow.ConfigManager import ConfigManager
 from PyFlow.Core.Common import *
 
 
@@ -53,9 +52,14 @@ class consoleOutput(NodeBase):
     def description():
         return "Python's 'print' function wrapper"
 
+    @staticmethod
+    def shouldRedirectOutput():
+        # config manager uses QSettings, so it is imported only when node has ui wrapper
+        from PyFlow.ConfigManager import ConfigManager
+        return ConfigManager().shouldRedirectOutput()
+
     def compute(self, *args, **kwargs):
-        redirectionEnabled = ConfigManager().shouldRedirectOutput()
-        if self.getWrapper() is not None and redirectionEnabled:
+        if self.getWrapper() is not None and self.shouldRedirectOutput():
             data = str(self.entity.getData())
             if self.entity.dataType != "StringPin":
                 data = data.encode('unicode-escape')
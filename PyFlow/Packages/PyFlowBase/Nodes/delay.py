@@ -20,6 +20,8 @@ from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 
 class delay(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(delay, self).__init__(name)
         self.inp0 = self.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, self.compute)
@@ -64,6 +66,11 @@ class delay(NodeBase):
             if self._total >= self._currentDelay:
                 self.callAndReset()
 
+    def timeUntilTick(self):
+        if not self.process:
+            return None
+        return max(self._currentDelay - self._total, 0.0)
+
     def compute(self, *args, **kwargs):
         self._currentDelay = self.delay.getData()
         if not self.process:
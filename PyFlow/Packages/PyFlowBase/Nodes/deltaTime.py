@@ -19,6 +19,8 @@ from PyFlow.Core.Common import *
 
 
 class deltaTime(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(deltaTime, self).__init__(name)
         self._deltaTime = 0.0
@@ -46,6 +48,10 @@ class deltaTime(NodeBase):
     def Tick(self, deltaTime):
         self._deltaTime = deltaTime
 
+    def timeUntilTick(self):
+        # only samples elapsed time, does not schedule any work
+        return None
+
     def compute(self, *args, **kwargs):
         self._out0.setData(self._deltaTime)
         push(self._out0)
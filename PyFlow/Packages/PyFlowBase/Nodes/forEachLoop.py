@@ -16,6 +16,7 @@
 from PyFlow.Core import NodeBase
 from PyFlow.Core.NodeBase import NodePinsSuggestionsHelper
 from PyFlow.Core.Common import *
+from PyFlow.Core.EvaluationEngine import DefaultEvaluationEngine_Impl
 from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 
@@ -25,10 +26,14 @@ class forEachLoop(NodeBase):
         self.inExec = self.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, self.compute)
         self.array = self.createInputPin('array', 'AnyPin', structure=StructureType.Array, constraint="1")
         self.array.enableOptions(PinOptions.AllowAny)
+        self.result = self.createInputPin('Result', 'AnyPin', constraint="2")
+        self.result.enableOptions(PinOptions.AllowAny)
 
         self.loopBody = self.createOutputPin('LoopBody', 'ExecPin')
         self.elem = self.createOutputPin('element', 'AnyPin', constraint="1")
         self.elem.enableOptions(PinOptions.AllowAny)
+        self.results = self.createOutputPin('Results', 'AnyPin', structure=StructureType.Array, constraint="2")
+        self.results.enableOptions(PinOptions.AllowAny)
         self.completed = self.createOutputPin('Completed', 'ExecPin')
         self.headerColor = FLOW_CONTROL_COLOR
 
@@ -42,6 +47,7 @@ class forEachLoop(NodeBase):
         helper.addInputStruct(StructureType.Single)
         helper.addInputStruct(StructureType.Array)
         helper.addOutputStruct(StructureType.Single)
+        helper.addOutputStruct(StructureType.Array)
         return helper
 
     @staticmethod
@@ -54,15 +60,31 @@ class forEachLoop(NodeBase):
 
     @staticmethod
     def description():
-        return 'For each loop'
+        return """For each loop. Value of **Result** is collected to **Results** after every iteration.
+If **LoopBody** is not connected, only nodes depending on **element** are evaluated for every element"""
+
+    def autoAffectPins(self):
+        # Result is collected for every element, so it does not affect element. Otherwise loop body could not be connected
+        for i in self.inputs.values():
+            for o in self.outputs.values():
+                if i.IsValuePin() != o.IsValuePin() or (i is self.result and o is self.elem):
+                    continue
+                pinAffects(i, o)
 
     def compute(self, *args, **kwargs):
         ls = self.array.getData()
-        if len(ls) == 0:
-            self.completed.call(*args, **kwargs)
-        else:
-            for i in ls:
-                self.elem.setData(i)
-                push(self.elem)
-                self.loopBody.call(*args, **kwargs)
-            self.completed.call(*args, **kwargs)
+        results = []
+        if len(ls) != 0:
+            if self.loopBody.hasConnections():
+                bCollect = self.result.hasConnections()
+                for i in ls:
+                    self.elem.setData(i)
+                    push(self.elem)
+                    self.loopBody.call(*args, **kwargs)
+                    if bCollect:
+                        results.append(self.result.getData())
+            else:
+                # nothing to fire, loop body is pure
+                results = DefaultEvaluationEngine_Impl.evaluateBatch(self.elem, ls, self.result)
+        self.results.setData(results)
+        self.completed.call(*args, **kwargs)
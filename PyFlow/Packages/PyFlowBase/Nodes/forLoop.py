@@ -16,6 +16,7 @@
 from PyFlow.Core import NodeBase
 from PyFlow.Core.NodeBase import NodePinsSuggestionsHelper
 from PyFlow.Core.Common import *
+from PyFlow.Core.EvaluationEngine import DefaultEvaluationEngine_Impl
 from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 
@@ -27,9 +28,13 @@ class forLoop(NodeBase):
         self.lastIndex = self.createInputPin('Stop', 'IntPin')
         self.step = self.createInputPin('Step', 'IntPin')
         self.step.setData(1)
+        self.result = self.createInputPin('Result', 'AnyPin', constraint="1")
+        self.result.enableOptions(PinOptions.AllowAny)
 
         self.loopBody = self.createOutputPin('LoopBody', 'ExecPin')
         self.index = self.createOutputPin('Index', 'IntPin')
+        self.results = self.createOutputPin('Results', 'AnyPin', structure=StructureType.Array, constraint="1")
+        self.results.enableOptions(PinOptions.AllowAny)
         self.completed = self.createOutputPin('Completed', 'ExecPin')
         self.headerColor = FLOW_CONTROL_COLOR
 
@@ -38,10 +43,13 @@ class forLoop(NodeBase):
         helper = NodePinsSuggestionsHelper()
         helper.addInputDataType('ExecPin')
         helper.addInputDataType('IntPin')
+        helper.addInputDataType('AnyPin')
         helper.addOutputDataType('ExecPin')
         helper.addOutputDataType('IntPin')
+        helper.addOutputDataType('AnyPin')
         helper.addInputStruct(StructureType.Single)
         helper.addOutputStruct(StructureType.Single)
+        helper.addOutputStruct(StructureType.Array)
         return helper
 
     @staticmethod
@@ -54,17 +62,33 @@ class forLoop(NodeBase):
 
     @staticmethod
     def description():
-        return 'For loop'
+        return """For loop. Value of **Result** is collected to **Results** after every iteration.
+If **LoopBody** is not connected, only nodes depending on **Index** are evaluated for every index"""
+
+    def autoAffectPins(self):
+        # Result is collected for every Index, so it does not affect Index. Otherwise loop body could not be connected
+        for i in self.inputs.values():
+            for o in self.outputs.values():
+                if i.IsValuePin() != o.IsValuePin() or (i is self.result and o is self.index):
+                    continue
+                pinAffects(i, o)
 
     def compute(self, *args, **kwargs):
         indexFrom = self.firstIndex.getData()
         indexTo = self.lastIndex.getData()
         step = self.step.getData()
-        if step == 0:
-            self.completed.call(*args, **kwargs)
-        else:
-            for i in range(indexFrom, indexTo, step):
-                self.index.setData(i)
-                push(self.index)
-                self.loopBody.call(*args, **kwargs)
-            self.completed.call(*args, **kwargs)
+        results = []
+        if step != 0:
+            if self.loopBody.hasConnections():
+                bCollect = self.result.hasConnections()
+                for i in range(indexFrom, indexTo, step):
+                    self.index.setData(i)
+                    push(self.index)
+                    self.loopBody.call(*args, **kwargs)
+                    if bCollect:
+                        results.append(self.result.getData())
+            else:
+                # nothing to fire, loop body is pure
+                results = DefaultEvaluationEngine_Impl.evaluateBatch(self.index, range(indexFrom, indexTo, step), self.result)
+        self.results.setData(results)
+        self.completed.call(*args, **kwargs)
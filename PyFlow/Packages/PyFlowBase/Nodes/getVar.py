@@ -13,7 +13,6 @@
 ## limitations under the License.
 
 
-from copy import copy
 import uuid
 
 from PyFlow.Packages.PyFlowBase import PACKAGE_NAME
@@ -38,6 +37,8 @@ class getVar(NodeBase):
         self._var.structureChanged.connect(self.onVarStructureChanged)
         self._var.dataTypeChanged.connect(self.onDataTypeChanged)
         self.bCacheEnabled = False
+        # variable version output holds
+        self._outVersion = None
 
     def checkForErrors(self):
         super(getVar, self).checkForErrors()
@@ -71,6 +72,7 @@ class getVar(NodeBase):
         self.out = None
         self.out = CreateRawPin('out', self, dataType, PinDirection.Output)
         self.out.disableOptions(PinOptions.RenamingEnabled)
+        self._outVersion = None
         self.updateStructure()
         return self.out
 
@@ -85,6 +87,7 @@ class getVar(NodeBase):
             self._var.structureChanged.disconnect(self.onVarStructureChanged)
             self._var.valueChanged.disconnect(self.onVarValueChanged)
         self._var = newVar
+        self._outVersion = None
         if newVar is not None:
             self._var.valueChanged.connect(self.onVarValueChanged)
             self._var.structureChanged.connect(self.onVarStructureChanged)
@@ -129,4 +132,9 @@ class getVar(NodeBase):
         return 'Access variable value'
 
     def compute(self, *args, **kwargs):
-        self.out.setData(copy(self.var.value))
+        if self._outVersion == self.var.version:
+            self.out.setClean()
+            return
+        # variable value is copied when assigned and never changed in place, so it is shared
+        self.out.setData(self.var.value)
+        self._outVersion = self.var.version
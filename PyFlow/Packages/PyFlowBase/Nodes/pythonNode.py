@@ -32,7 +32,7 @@ class pythonNode(NodeBase):
         return self._nodeData
 
     def ensureNameUnique(self):
-        existingNames = [n.name for n in self.graph().graphManager.getAllNodes()]
+        existingNames = [n.name for n in self.graph().graphManager.getAllNodes(bLoadedOnly=True)]
         nodeName = self.getName()
         if nodeName in existingNames:
             existingNames.remove(nodeName)
@@ -19,6 +19,8 @@ from PyFlow.Core.NodeBase import NodePinsSuggestionsHelper
 
 
 class retriggerableDelay(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(retriggerableDelay, self).__init__(name)
         self.inp0 = self.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, self.compute)
@@ -57,6 +59,11 @@ class retriggerableDelay(NodeBase):
             if self._total >= self._currentDelay:
                 self.callAndReset()
 
+    def timeUntilTick(self):
+        if not self.process:
+            return None
+        return max(self._currentDelay - self._total, 0.0)
+
     def callAndReset(self):
         self.out0.call()
         self.process = False
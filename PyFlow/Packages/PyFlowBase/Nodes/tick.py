@@ -20,6 +20,8 @@ from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 
 class tick(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(tick, self).__init__(name)
         self.enabled = self.createInputPin("enabled", 'BoolPin')
@@ -41,6 +43,11 @@ class tick(NodeBase):
     def category():
         return 'FlowControl'
 
+    def timeUntilTick(self):
+        if self.enabled.getData():
+            return 0.0
+        return None
+
     def Tick(self, delta):
         super(tick, self).Tick(delta)
         bEnabled = self.enabled.getData()
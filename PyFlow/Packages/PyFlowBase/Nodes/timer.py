@@ -21,6 +21,8 @@ from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 ## Timer node
 class timer(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(timer, self).__init__(name)
         self.out = self.createOutputPin("OUT", 'ExecPin')
@@ -43,6 +45,11 @@ class timer(NodeBase):
                 self.out.call()
                 self.accum = 0.0
 
+    def timeUntilTick(self):
+        if not self.bWorking:
+            return None
+        return max(max(self.interval.getData(), 0.02) - self.accum, 0.0)
+
     @staticmethod
     def pinTypeHints():
         helper = NodePinsSuggestionsHelper()
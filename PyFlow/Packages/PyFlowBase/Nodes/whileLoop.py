@@ -20,6 +20,8 @@ from PyFlow.Packages.PyFlowBase.Nodes import FLOW_CONTROL_COLOR
 
 
 class whileLoop(NodeBase):
+    needsTick = True
+
     def __init__(self, name):
         super(whileLoop, self).__init__(name)
         self.inExec = self.createInputPin(DEFAULT_IN_EXEC_NAME, 'ExecPin', None, self.begin)
@@ -68,6 +70,11 @@ class whileLoop(NodeBase):
             self.completed.call()
             self._dirty = False
 
+    def timeUntilTick(self):
+        if self.bProcess or self._dirty:
+            return 0.0
+        return None
+
     @staticmethod
     def description():
         return 'The WhileLoop node will output a result so long as a specific condition is true. During each iteration of the loop, it checks to see the current status of its input boolean value. As soon as it reads false, the loop breaks.\nAs with While loops in programming languages, extra care must be taken to prevent infinite loops from occurring.'
@@ -15,7 +15,6 @@
 
 from blinker import Signal
 import json
-from Qt import QtGui
 from nine import str
 
 from PyFlow.Core import PinBase
@@ -0,0 +1,46 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+import numpy
+
+from PyFlow.Packages.PyFlowBase.Pins.NdArrayPin import NdArrayPin, TypedArray, readOnlyArray
+
+
+class IntArray(TypedArray):
+    arrayDtype = numpy.int64
+
+
+class IntArrayPin(NdArrayPin):
+    """Contiguous array of 64 bit integers"""
+
+    def __init__(self, name, parent, direction, **kwargs):
+        super(IntArrayPin, self).__init__(name, parent, direction, **kwargs)
+
+    @staticmethod
+    def pinDataTypeHint():
+        '''data type index and default value'''
+        return 'IntArrayPin', IntArray()
+
+    @staticmethod
+    def color():
+        return (33, 200, 160, 255)
+
+    @staticmethod
+    def internalDataStructure():
+        return IntArray
+
+    @staticmethod
+    def processData(data):
+        return readOnlyArray(data, IntArray)
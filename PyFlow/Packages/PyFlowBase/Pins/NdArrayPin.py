@@ -0,0 +1,106 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+import json
+
+import numpy
+
+from PyFlow.Core import PinBase
+
+
+class TypedArray(numpy.ndarray):
+    """Array held by array pins. Every pin type has own subclass with fixed dtype
+
+    Separate classes let pin type be found from data, same as for other pins
+    """
+    arrayDtype = None
+
+    def __new__(cls, data=()):
+        return readOnlyArray(data, cls)
+
+
+def readOnlyArray(data, arrayClass):
+    """Converts data to contiguous read only array of given class
+
+    Read only arrays of right class are returned as is, other arrays of right dtype are shared through read only view.
+    Data is copied only when it is not an array or has different dtype. Owner of array
+    must not change it after it was set to pin
+
+    :param data: Array or sequence of numbers
+    :param arrayClass: Subclass of :class:`TypedArray`
+    :rtype: :class:`TypedArray`
+    """
+    if type(data) is arrayClass and not data.flags.writeable and data.flags.c_contiguous and data.dtype == arrayClass.arrayDtype:
+        return data
+    array = numpy.ascontiguousarray(data, dtype=arrayClass.arrayDtype).view(arrayClass)
+    array.flags.writeable = False
+    return array
+
+
+def writableArray(array):
+    """Returns array which can be modified in place
+
+    Arrays held by pins are shared by all connected pins and are read only. Functions which modify
+    arrays in place use this to get own copy
+
+    :param array: Array from pin
+    :type array: :class:`numpy.ndarray`
+    :rtype: :class:`numpy.ndarray`
+    """
+    if array.flags.writeable:
+        return array
+    return array.copy()
+
+
+class NdArrayEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, numpy.ndarray):
+            return o.tolist()
+        return json.JSONEncoder.default(self, o)
+
+
+class NdArrayPin(PinBase):
+    """Base for pins holding contiguous NumPy arrays of fixed dtype
+
+    Data is validated once, when it is set. Output passes same read only buffer to all connected inputs,
+    so arrays are not copied or validated again on the way downstream.
+    Node which needs to change array should do it on copy, see :func:`writableArray`
+    """
+
+    def __init__(self, name, parent, direction, **kwargs):
+        super(NdArrayPin, self).__init__(name, parent, direction, **kwargs)
+        self.setDefaultValue(self.pinDataTypeHint()[1])
+
+    def setDefaultValue(self, val):
+        # arrays are read only, no copy is needed
+        self._defaultValue = self.processData(val)
+
+    def setData(self, data):
+        # base class stores lists as is
+        if isinstance(data, list):
+            data = self.processData(data)
+        super(NdArrayPin, self).setData(data)
+
+    @staticmethod
+    def IsValuePin():
+        return True
+
+    @staticmethod
+    def supportedDataTypes():
+        return ('FloatArrayPin', 'IntArrayPin',)
+
+    @staticmethod
+    def jsonEncoderClass():
+        return NdArrayEncoder
@@ -54,6 +54,10 @@ class GeneralPreferences(CategoryWidgetBase):
         self.redirectOutput = QCheckBox(self)
         commonCategory.addWidget("Redirect output", self.redirectOutput)
 
+        self.binaryGraphFiles = QCheckBox(self)
+        self.binaryGraphFiles.setToolTip("Save graphs in compact binary format. Both formats can be opened")
+        commonCategory.addWidget("Binary graph files", self.binaryGraphFiles)
+
         spacerItem = QSpacerItem(10, 10, QSizePolicy.Minimum, QSizePolicy.Expanding)
         self.layout.addItem(spacerItem)
 
@@ -62,6 +66,7 @@ class GeneralPreferences(CategoryWidgetBase):
         settings.setValue("TempFilesDir", os.path.expanduser('~/PyFlowTemp'))
         settings.setValue("HistoryDepth", 50)
         settings.setValue("RedirectOutput", True)
+        settings.setValue("BinaryGraphFiles", False)
 
     def serialize(self, settings):
         settings.setValue("EditorCmd", self.lePythonEditor.text())
@@ -69,6 +74,7 @@ class GeneralPreferences(CategoryWidgetBase):
         settings.setValue("ExtraPackageDirs", self.additionalPackagePaths.text())
         settings.setValue("HistoryDepth", self.historyDepth.value())
         settings.setValue("RedirectOutput", self.redirectOutput.checkState() == QtCore.Qt.Checked)
+        settings.setValue("BinaryGraphFiles", self.binaryGraphFiles.checkState() == QtCore.Qt.Checked)
 
     def onShow(self, settings):
         self.lePythonEditor.setText(settings.value("EditorCmd"))
@@ -86,3 +92,8 @@ class GeneralPreferences(CategoryWidgetBase):
             self.redirectOutput.setChecked(settings.value("RedirectOutput") == "true")
         except:
             pass
+
+        try:
+            self.binaryGraphFiles.setChecked(settings.value("BinaryGraphFiles") == "true")
+        except:
+            pass
@@ -43,5 +43,6 @@ class CompileTool(ShelfTool):
         return str("CompileTool")
 
     def do(self):
+        # compounds which keep inner graph serialized are not loaded for that
         for node in self.pyFlowInstance.graphManager.get().getAllNodes():
             node.checkForErrors()
@@ -256,6 +256,7 @@ class UICommentNode(UINodeBase):
         res = QtGui.QColor(color[0], color[1], color[2], color[3])
         if res.isValid():
             self.color = res
+            self.notifyModified()
             self.update()
 
     def createPropertiesWidget(self, propertiesWidget):
@@ -52,10 +52,19 @@ class UICompoundNode(UINodeBase):
         self.actionExport.triggered.connect(self.onExportToPackage)
         self.actionImport = self._menu.addAction("Import")
         self.actionImport.triggered.connect(self.onImport)
+        self.actionCompile = self._menu.addAction("Compile")
+        self.actionCompile.setCheckable(True)
+        self.actionCompile.setChecked(self._rawNode.isCompileEnabled())
+        self.actionCompile.toggled.connect(self.onCompileToggled)
+
+    def onCompileToggled(self, bEnabled):
+        self._rawNode.setCompileEnabled(bEnabled)
+        if bEnabled and not self._rawNode.isCompiled():
+            logger.warning("{0} can not be compiled. Only pure function library nodes are supported".format(self.getName()))
 
     def rebuild(self):
-        if self._rawNode._rawGraphJson is not None:
-            self.assignData(self._rawNode._rawGraphJson)
+        # compounds exported to packages are created from shared definition, graph is loaded on demand
+        pass
 
     def onExport(self, root=None):
         try:
@@ -69,7 +78,7 @@ class UICompoundNode(UINodeBase):
 
     def onExportToPackage(self):
         # check if category is not empty
-        if self._rawNode._rawGraph.category == '':
+        if self._rawNode.rawGraph.category == '':
             QMessageBox.information(None, "Warning", "Category is not set! Please step into compound and type category name.")
             return
 
@@ -125,8 +134,15 @@ class UICompoundNode(UINodeBase):
 
     def postCreate(self, jsonTemplate=None):
         super(UICompoundNode, self).postCreate(jsonTemplate)
-        self.canvasRef().createWrappersForGraph(self._rawNode.rawGraph)
-        self._rawNode.rawGraph.nameChanged.connect(self.onGraphNameChanged)
+        self.actionCompile.setChecked(self._rawNode.isCompileEnabled())
+        # wrappers for inner nodes are created when graph is loaded
+        self._rawNode.graphLoaded.connect(self.onGraphLoaded)
+        if self._rawNode.isGraphLoaded():
+            self.onGraphLoaded(self._rawNode.rawGraph)
+
+    def onGraphLoaded(self, rawGraph):
+        self.canvasRef().createWrappersForGraph(rawGraph)
+        rawGraph.nameChanged.connect(self.onGraphNameChanged)
 
     def createInputWidgets(self, inputsCategory, inGroup=None, pins=True):
         if pins:
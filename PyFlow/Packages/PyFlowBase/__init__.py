@@ -5,6 +5,12 @@ from collections import OrderedDict
 
 from PyFlow.UI.UIInterfaces import IPackage
 
+# NumPy is optional, array pins and functions using them are registered only when it is installed
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Pins
 from PyFlow.Packages.PyFlowBase.Pins.AnyPin import AnyPin
 from PyFlow.Packages.PyFlowBase.Pins.BoolPin import BoolPin
@@ -73,32 +79,6 @@ from PyFlow.Packages.PyFlowBase.Nodes.imageDisplay import imageDisplay
 from PyFlow.Packages.PyFlowBase.Nodes.commentNode import commentNode
 from PyFlow.Packages.PyFlowBase.Nodes.stickyNote import stickyNote
 
-from PyFlow.Packages.PyFlowBase.Tools.ScreenshotTool import ScreenshotTool
-from PyFlow.Packages.PyFlowBase.Tools.NodeBoxTool import NodeBoxTool
-from PyFlow.Packages.PyFlowBase.Tools.SearchResultsTool import SearchResultsTool
-from PyFlow.Packages.PyFlowBase.Tools.AlignLeftTool import AlignLeftTool
-from PyFlow.Packages.PyFlowBase.Tools.AlignRightTool import AlignRightTool
-from PyFlow.Packages.PyFlowBase.Tools.AlignTopTool import AlignTopTool
-from PyFlow.Packages.PyFlowBase.Tools.AlignBottomTool import AlignBottomTool
-from PyFlow.Packages.PyFlowBase.Tools.HistoryTool import HistoryTool
-from PyFlow.Packages.PyFlowBase.Tools.PropertiesTool import PropertiesTool
-from PyFlow.Packages.PyFlowBase.Tools.VariablesTool import VariablesTool
-from PyFlow.Packages.PyFlowBase.Tools.CompileTool import CompileTool
-from PyFlow.Packages.PyFlowBase.Tools.LoggerTool import LoggerTool
-
-from PyFlow.Packages.PyFlowBase.Exporters.PythonScriptExporter import PythonScriptExporter
-
-# Factories
-from PyFlow.Packages.PyFlowBase.Factories.UIPinFactory import createUIPin
-from PyFlow.Packages.PyFlowBase.Factories.PinInputWidgetFactory import getInputWidget
-from PyFlow.Packages.PyFlowBase.Factories.UINodeFactory import createUINode
-
-# Prefs widgets
-from PyFlow.Packages.PyFlowBase.PrefsWidgets.General import GeneralPreferences
-from PyFlow.Packages.PyFlowBase.PrefsWidgets.InputPrefs import InputPreferences
-from PyFlow.Packages.PyFlowBase.PrefsWidgets.ThemePrefs import ThemePreferences
-
-
 _FOO_LIBS = {
     ArrayLib.__name__: ArrayLib(PACKAGE_NAME),
     BoolLib.__name__: BoolLib(PACKAGE_NAME),
@@ -168,29 +148,64 @@ _PINS = {
     StringPin.__name__: StringPin,
 }
 
-# Toolbar will be created in following order
-_TOOLS = OrderedDict()
-_TOOLS[CompileTool.__name__] = CompileTool
-_TOOLS[ScreenshotTool.__name__] = ScreenshotTool
-_TOOLS[AlignLeftTool.__name__] = AlignLeftTool
-_TOOLS[AlignRightTool.__name__] = AlignRightTool
-_TOOLS[AlignTopTool.__name__] = AlignTopTool
-_TOOLS[AlignBottomTool.__name__] = AlignBottomTool
-_TOOLS[HistoryTool.__name__] = HistoryTool
-_TOOLS[PropertiesTool.__name__] = PropertiesTool
-_TOOLS[VariablesTool.__name__] = VariablesTool
-_TOOLS[NodeBoxTool.__name__] = NodeBoxTool
-_TOOLS[SearchResultsTool.__name__] = SearchResultsTool
-_TOOLS[LoggerTool.__name__] = LoggerTool
+if numpy is not None:
+    from PyFlow.Packages.PyFlowBase.Pins.FloatArrayPin import FloatArrayPin
+    from PyFlow.Packages.PyFlowBase.Pins.IntArrayPin import IntArrayPin
+    from PyFlow.Packages.PyFlowBase.FunctionLibraries.NdArrayLib import NdArrayLib
+
+    _PINS[FloatArrayPin.__name__] = FloatArrayPin
+    _PINS[IntArrayPin.__name__] = IntArrayPin
+    _FOO_LIBS[NdArrayLib.__name__] = NdArrayLib(PACKAGE_NAME)
 
+# Editor classes import Qt, they are loaded on first request so package can be used without UI
+_TOOLS = OrderedDict()
 _EXPORTERS = OrderedDict()
-_EXPORTERS[PythonScriptExporter.__name__] = PythonScriptExporter
+_PREFS_WIDGETS = OrderedDict()
 
 
-_PREFS_WIDGETS = OrderedDict()
-_PREFS_WIDGETS["General"] = GeneralPreferences
-_PREFS_WIDGETS["Input"] = InputPreferences
-_PREFS_WIDGETS["Theme"] = ThemePreferences
+def _loadUIClasses():
+    if len(_TOOLS) > 0:
+        return
+
+    from PyFlow.Packages.PyFlowBase.Tools.ScreenshotTool import ScreenshotTool
+    from PyFlow.Packages.PyFlowBase.Tools.NodeBoxTool import NodeBoxTool
+    from PyFlow.Packages.PyFlowBase.Tools.SearchResultsTool import SearchResultsTool
+    from PyFlow.Packages.PyFlowBase.Tools.AlignLeftTool import AlignLeftTool
+    from PyFlow.Packages.PyFlowBase.Tools.AlignRightTool import AlignRightTool
+    from PyFlow.Packages.PyFlowBase.Tools.AlignTopTool import AlignTopTool
+    from PyFlow.Packages.PyFlowBase.Tools.AlignBottomTool import AlignBottomTool
+    from PyFlow.Packages.PyFlowBase.Tools.HistoryTool import HistoryTool
+    from PyFlow.Packages.PyFlowBase.Tools.PropertiesTool import PropertiesTool
+    from PyFlow.Packages.PyFlowBase.Tools.VariablesTool import VariablesTool
+    from PyFlow.Packages.PyFlowBase.Tools.CompileTool import CompileTool
+    from PyFlow.Packages.PyFlowBase.Tools.LoggerTool import LoggerTool
+
+    from PyFlow.Packages.PyFlowBase.Exporters.PythonScriptExporter import PythonScriptExporter
+
+    # Prefs widgets
+    from PyFlow.Packages.PyFlowBase.PrefsWidgets.General import GeneralPreferences
+    from PyFlow.Packages.PyFlowBase.PrefsWidgets.InputPrefs import InputPreferences
+    from PyFlow.Packages.PyFlowBase.PrefsWidgets.ThemePrefs import ThemePreferences
+
+    # Toolbar will be created in following order
+    _TOOLS[CompileTool.__name__] = CompileTool
+    _TOOLS[ScreenshotTool.__name__] = ScreenshotTool
+    _TOOLS[AlignLeftTool.__name__] = AlignLeftTool
+    _TOOLS[AlignRightTool.__name__] = AlignRightTool
+    _TOOLS[AlignTopTool.__name__] = AlignTopTool
+    _TOOLS[AlignBottomTool.__name__] = AlignBottomTool
+    _TOOLS[HistoryTool.__name__] = HistoryTool
+    _TOOLS[PropertiesTool.__name__] = PropertiesTool
+    _TOOLS[VariablesTool.__name__] = VariablesTool
+    _TOOLS[NodeBoxTool.__name__] = NodeBoxTool
+    _TOOLS[SearchResultsTool.__name__] = SearchResultsTool
+    _TOOLS[LoggerTool.__name__] = LoggerTool
+
+    _EXPORTERS[PythonScriptExporter.__name__] = PythonScriptExporter
+
+    _PREFS_WIDGETS["General"] = GeneralPreferences
+    _PREFS_WIDGETS["Input"] = InputPreferences
+    _PREFS_WIDGETS["Theme"] = ThemePreferences
 
 
 class PyFlowBase(IPackage):
@@ -201,6 +216,7 @@ class PyFlowBase(IPackage):
 
     @staticmethod
     def GetExporters():
+        _loadUIClasses()
         return _EXPORTERS
 
     @staticmethod
@@ -217,20 +233,25 @@ class PyFlowBase(IPackage):
 
     @staticmethod
     def GetToolClasses():
+        _loadUIClasses()
         return _TOOLS
 
     @staticmethod
     def UIPinsFactory():
+        from PyFlow.Packages.PyFlowBase.Factories.UIPinFactory import createUIPin
         return createUIPin
 
     @staticmethod
     def UINodesFactory():
+        from PyFlow.Packages.PyFlowBase.Factories.UINodeFactory import createUINode
         return createUINode
 
     @staticmethod
     def PinsInputWidgetFactory():
+        from PyFlow.Packages.PyFlowBase.Factories.PinInputWidgetFactory import getInputWidget
         return getInputWidget
 
     @staticmethod
     def PrefsWidgets():
+        _loadUIClasses()
         return _PREFS_WIDGETS
@@ -16,17 +16,13 @@
 import argparse
 import sys
 import os
-import json
-import threading
-import time
 
-from PyFlow.App import PyFlow
-from PyFlow import graphUiParser
-from Qt.QtWidgets import QApplication
 from PyFlow import INITIALIZE
 from PyFlow.Core.Common import *
 from PyFlow.Core.version import currentVersion
 from PyFlow.Core.GraphManager import GraphManagerSingleton
+from PyFlow.Core.GraphFile import readGraphFile
+from PyFlow.Core.GraphRunner import GraphRunner
 
 
 def getGraphArguments(data, parser):
@@ -61,6 +57,8 @@ def main():
     parser.add_argument("-m", "--mode", type=str, default="edit", choices=["edit", "run", "runui"])
     parser.add_argument("-f", "--filePath", type=str, default="untitled.pygraph")
     parser.add_argument("--version", action="version", version=str(currentVersion()))
+    parser.add_argument("--maxRate", type=float, default=50.0, help="Maximum ticks per second in run mode. Zero means no limit")
+    parser.add_argument("--simulate", action="store_true", help="Run mode does not wait for timers, simulated time is used instead")
     parsedArguments, unknown = parser.parse_known_args(sys.argv[1:])
 
     filePath = parsedArguments.filePath
@@ -69,6 +67,9 @@ def main():
         filePath += ".pygraph"
 
     if parsedArguments.mode == "edit":
+        from Qt.QtWidgets import QApplication
+        from PyFlow.App import PyFlow
+
         app = QApplication(sys.argv)
 
         instance = PyFlow.instance(software="standalone")
@@ -76,10 +77,9 @@ def main():
             app.setActiveWindow(instance)
             instance.show()
             if os.path.exists(filePath):
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-                    instance.loadFromData(data)
-                    instance.currentFileName = filePath
+                data = readGraphFile(filePath)
+                instance.loadFromData(data)
+                instance.currentFileName = filePath
 
             try:
                 sys.exit(app.exec_())
@@ -91,24 +91,15 @@ def main():
         if not os.path.exists(filePath):
             print("No such file. {}".format(filePath))
             return
-        with open(filePath, 'r') as f:
-            data = json.load(f)
+        data = readGraphFile(filePath)
         getGraphArguments(data, parser)
         parsedArguments = parser.parse_args()
 
         # load updated data
-        INITIALIZE()
+        INITIALIZE(headless=True)
         GM = GraphManagerSingleton().get()
         GM.deserialize(data)
 
-        # fake main loop
-        def programLoop():
-            while True:
-                GM.Tick(deltaTime=0.02)
-                time.sleep(0.02)
-                if GM.terminationRequested:
-                    break
-
         # call graph inputs nodes
         root = GM.findRootGraph()
         graphInputNodes = root.getNodesList(classNameFilters=["graphInputs"])
@@ -126,9 +117,9 @@ def main():
         for foo in evalFunctions:
             foo()
 
-        loopThread = threading.Thread(target=programLoop)
-        loopThread.start()
-        loopThread.join()
+        # tick graphs while timers and loops are pending
+        GraphRunner(GM, maxRate=parsedArguments.maxRate, realTime=not parsedArguments.simulate).run()
 
     if parsedArguments.mode == "runui":
+        from PyFlow import graphUiParser
         graphUiParser.run(filePath)
@@ -18,13 +18,7 @@ from PyFlow.Core.Common import *
 from collections import Counter
 
 
-class TestArrays(unittest.TestCase):
-
-    def setUp(self):
-        print('\t[BEGIN TEST]', self._testMethodName)
-
-    def tearDown(self):
-        print('--------------------------------\n')
+class TestArrays(PyFlowTestCase):
 
     def test_makeList_Node(self):
         packages = GET_PACKAGES()
@@ -17,13 +17,7 @@ from PyFlow.Tests.TestsBase import *
 from PyFlow.Core.Common import *
 
 
-class TestBasePackage(unittest.TestCase):
-
-    def setUp(self):
-        print('\t[BEGIN TEST]', self._testMethodName)
-
-    def tearDown(self):
-        print('--------------------------------\n')
+class TestBasePackage(PyFlowTestCase):
 
     def test_branch_node(self):
         packages = GET_PACKAGES()
@@ -0,0 +1,359 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+from PyFlow.Tests.TestsBase import *
+from PyFlow.Core.Common import *
+
+
+class TestCompounds(PyFlowTestCase):
+
+    def test_lazy_compound_loading(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"].getFunctions()
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        outerCompound = classNodes['compound'](str('outer'))
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (outerCompound, makeIntNode, printNode):
+            man.activeGraph().addNode(node)
+
+        # outer compound contains inner compound, which computes in & 6
+        man.selectGraph(outerCompound)
+        outerIn = man.activeGraph().getInputNode().addOutPin()
+        outerOut = man.activeGraph().getOutputNode().addInPin()
+        innerCompound = classNodes['compound'](str('inner'))
+        man.activeGraph().addNode(innerCompound)
+        man.selectGraph(innerCompound)
+        innerIn = man.activeGraph().getInputNode().addOutPin()
+        innerOut = man.activeGraph().getOutputNode().addInPin()
+        andNode = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        man.activeGraph().addNode(andNode)
+        andNode.setData('b', 6)
+        self.assertTrue(connectPins(innerIn, andNode[str('a')]))
+        self.assertTrue(connectPins(andNode[str('out')], innerOut))
+        man.selectGraph(outerCompound)
+        self.assertTrue(connectPins(outerIn, innerCompound[innerIn.name]))
+        self.assertTrue(connectPins(innerCompound[innerOut.name], outerOut))
+        man.selectRootGraph()
+        self.assertTrue(connectPins(makeIntNode[str('out')], outerCompound[outerIn.name]))
+        self.assertTrue(connectPins(outerCompound[outerOut.name], printNode[str("entity")]))
+        makeIntNode.setData('i', 7)
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 6)
+
+        saved = man.serialize()
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+
+        # only root graph is created, pins are exposed from serialized data
+        self.assertEqual(len(man.getAllGraphs(bLoadedOnly=True)), 1)
+        restoredOuter = man.findNode(str('outer'))
+        self.assertFalse(restoredOuter.isGraphLoaded())
+        self.assertEqual(list(restoredOuter.namePinInputsMap), [outerIn.name])
+        self.assertTrue(restoredOuter[outerIn.name].hasConnections())
+        self.assertTrue(restoredOuter[outerOut.name].hasConnections())
+
+        # serialization does not need graph
+        savedOuter = [nodeJson for nodeJson in saved['nodes'] if nodeJson['name'] == 'outer'][0]
+        self.assertEqual(restoredOuter.serialize()['graphData'], savedOuter['graphData'])
+        self.assertFalse(restoredOuter.isGraphLoaded())
+
+        # evaluation loads graphs on the way
+        man.findNode(str('makeInt')).setData('i', 13)
+        printNode = man.findNode(str('print'))
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 4)
+        self.assertTrue(restoredOuter.isGraphLoaded())
+        self.assertEqual(len(man.getAllGraphs()), 3)
+
+        # names of serialized inner nodes are not given to new nodes
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        newNode = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        newNode.setName(andNode.name)
+        man.activeGraph().addNode(newNode)
+        self.assertNotEqual(newNode.name, andNode.name)
+        man.findNode(str('outer')).loadGraph()
+        man.findNode(str('inner')).loadGraph()
+        self.assertEqual(man.findNode(andNode.name).graph().name, str('inner'))
+        # killed compound releases names
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        man.findNode(str('outer')).kill()
+        newNode = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        newNode.setName(str('inner'))
+        man.activeGraph().addNode(newNode)
+        self.assertEqual(newNode.name, str('inner'))
+
+        # stepping into not loaded compound loads it
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        man.selectGraphByName(str('outer'))
+        self.assertEqual(man.activeGraph().name, str('outer'))
+        self.assertFalse(man.findNode(str('inner')).isGraphLoaded())
+
+        # lookups see nodes of serialized graphs
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        self.assertEqual(man.findNode(andNode.name).graph().name, str('inner'))
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        self.assertEqual(len(man.getAllNodes(classNameFilters=['bitwiseAnd'])), 0)
+        self.assertEqual(len(man.getAllGraphs()), 1)
+        self.assertIn(andNode.name, man.getAllNames())
+        self.assertEqual(len(man.getAllGraphs()), 1)
+        self.assertEqual(len(man.getAllNodes(classNameFilters=['bitwiseAnd'], bLoadedOnly=False)), 1)
+        self.assertEqual(len(man.getAllGraphs()), 3)
+
+        # names of serialized variables are not given to new variables
+        man.findGraph(str('inner')).createVariable(str('IntPin'), name=str('innerVar'))
+        saved = man.serialize()
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        self.assertNotEqual(man.activeGraph().createVariable(str('IntPin'), name=str('innerVar')).name, str('innerVar'))
+        self.assertFalse(man.findNode(str('outer')).isGraphLoaded())
+        self.assertEqual(man.findVariableByName(str('innerVar')).graph.name, str('inner'))
+        self.assertTrue(man.findNode(str('outer')).isGraphLoaded())
+
+        # variable accessors inside serialized graphs are found
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        var = man.activeGraph().createVariable(str('IntPin'))
+        man.selectGraphByName(str('inner'))
+        getter = packages["PyFlowBase"].GetNodeClasses()['getVar'](str('gv'), var)
+        man.activeGraph().addNode(getter)
+        man.selectRootGraph()
+        self.assertEqual(var.findRefs(), [getter])
+        saved = man.serialize()
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        self.assertEqual(len(man.getAllGraphs(bLoadedOnly=True)), 1)
+        var = man.findRootGraph().getVars()[var.uid]
+        refs = var.findRefs()
+        self.assertEqual([node.name for node in refs], [str('gv')])
+        self.assertIs(man.findNode(str('gv')), refs[0])
+
+        # compounds with ticking nodes are loaded at once
+        man.selectGraphByName(str('inner'))
+        man.activeGraph().addNode(classNodes["tick"]("tick"))
+        saved = man.serialize()
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        self.assertTrue(man.findNode(str('outer')).isGraphLoaded())
+        self.assertEqual(len(man.activeGraph().getTickNodes()), 0)
+        self.assertEqual(len(man.findGraph(str('inner')).getTickNodes()), 1)
+
+    def test_compound_definitions(self):
+        import os
+        import json
+        import shutil
+        from PyFlow import GET_PACKAGE_PATH, getRawNodeInstance
+        from PyFlow.Core.CompoundRegistry import CompoundRegistry
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"].getFunctions()
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        # export compound which computes in & 6
+        sourceCompound = classNodes['compound'](str('sharedAnd'))
+        man.activeGraph().addNode(sourceCompound)
+        man.selectGraph(sourceCompound)
+        inPin = man.activeGraph().getInputNode().addOutPin()
+        outPin = man.activeGraph().getOutputNode().addInPin()
+        andNode = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        man.activeGraph().addNode(andNode)
+        andNode.setData('b', 6)
+        connectPins(inPin, andNode[str('a')])
+        connectPins(andNode[str('out')], outPin)
+        definitionData = sourceCompound.rawGraph.serialize()
+        man.selectRootGraph()
+        sourceCompound.kill()
+
+        compoundsFolder = os.path.join(GET_PACKAGE_PATH('PyFlowBase'), "Compounds")
+        bFolderCreated = not os.path.exists(compoundsFolder)
+        if bFolderCreated:
+            os.makedirs(compoundsFolder)
+        compoundPath = os.path.join(compoundsFolder, "sharedAnd.compound")
+        try:
+            with open(compoundPath, 'w') as f:
+                json.dump(definitionData, f)
+
+            # parsed once, nodes share definition
+            first = getRawNodeInstance('sharedAnd', 'PyFlowBase')
+            second = getRawNodeInstance('sharedAnd', 'PyFlowBase')
+            self.assertIs(first.getDefinition(), second.getDefinition())
+            self.assertIs(first.getDefinition().graphData, CompoundRegistry().findDefinition('PyFlowBase', 'sharedAnd').graphData)
+            man.activeGraph().addNode(first)
+            man.activeGraph().addNode(second)
+            self.assertFalse(first.isGraphLoaded())
+            self.assertEqual(list(first.namePinInputsMap), [inPin.name])
+
+            makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+            printNode = classNodes["consoleOutput"]("print")
+            man.activeGraph().addNode(makeIntNode)
+            man.activeGraph().addNode(printNode)
+            connectPins(makeIntNode[str('out')], first[inPin.name])
+            connectPins(first[outPin.name], second[inPin.name])
+            connectPins(second[outPin.name], printNode[str("entity")])
+            makeIntNode.setData('i', 7)
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 6)
+
+            # evaluated by graph compiled once for definition
+            self.assertFalse(first.isGraphLoaded())
+            self.assertFalse(second.isGraphLoaded())
+            self.assertIsNotNone(first.getDefinition().getCompiledGraph())
+            makeIntNode.setData('i', 5)
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 4)
+
+            # loaded instances have own nodes
+            firstUids = set(node.uid for node in first.rawGraph.getNodesList())
+            secondUids = set(node.uid for node in second.rawGraph.getNodesList())
+            self.assertEqual(len(firstUids & secondUids), 0)
+
+            # stored as reference, graph is kept only if asked, in case definition is missing
+            saved = man.serialize()
+            compoundsJson = [nodeJson for nodeJson in saved['nodes'] if nodeJson['type'] == 'compound']
+            self.assertEqual(len(compoundsJson), 2)
+            for nodeJson in compoundsJson:
+                self.assertNotIn('graphData', nodeJson)
+                self.assertEqual(nodeJson['compoundDefinition'], 'sharedAnd')
+            classNodes['compound'].storeDefinitionGraphData = True
+            try:
+                savedWithGraphs = man.serialize()
+            finally:
+                classNodes['compound'].storeDefinitionGraphData = False
+            for nodeJson in savedWithGraphs['nodes']:
+                if nodeJson['type'] == 'compound':
+                    self.assertIn('graphData', nodeJson)
+            definition = first.getDefinition()
+            man.clear(keepRoot=False)
+            man.deserialize(saved)
+            restored = man.findNode(first.name)
+            self.assertIs(restored.getDefinition(), definition)
+            self.assertTrue(restored[inPin.name].hasConnections())
+
+            # editing inner graph makes compound independent
+            restored.rawGraph.getNodesList(classNameFilters=['graphInputs'])[0].setPosition(10, 10)
+            self.assertIsNone(restored.getDefinition())
+            self.assertIn('graphData', restored.serialize())
+            self.assertNotIn('compoundDefinition', restored.serialize())
+
+            # including values of not connected inner pins, evaluation does not count as edit
+            restoredSecond = man.findNode(second.name)
+            innerAndNode = restoredSecond.rawGraph.getNodesList(classNameFilters=['bitwiseAnd'])[0]
+            man.findNode(makeIntNode.name).setData('i', 7)
+            man.findNode(printNode.name)[DEFAULT_IN_EXEC_NAME].call()
+            self.assertIs(restoredSecond.getDefinition(), definition)
+            innerAndNode.setData('b', 3)
+            self.assertIsNone(restoredSecond.getDefinition())
+            self.assertNotIn('compoundDefinition', restoredSecond.serialize())
+            # and inner variables
+            third = getRawNodeInstance('sharedAnd', 'PyFlowBase')
+            man.activeGraph().addNode(third)
+            innerVar = third.rawGraph.createVariable(str('IntPin'))
+            self.assertIsNone(third.getDefinition())
+            self.assertEqual(third.serialize()['graphData']['vars'][0]['uuid'], str(innerVar.uid))
+            third.kill()
+            edited = man.serialize()
+            man.clear(keepRoot=False)
+            man.deserialize(edited)
+            man.findNode(makeIntNode.name).setData('i', 7)
+            man.findNode(printNode.name)[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(man.findNode(printNode.name)[str("entity")].currentData(), 2)
+
+            # changed file is parsed again
+            stat = os.stat(compoundPath)
+            os.utime(compoundPath, (stat.st_atime, stat.st_mtime + 10))
+            self.assertIsNot(CompoundRegistry().findDefinition('PyFlowBase', 'sharedAnd'), definition)
+        finally:
+            os.remove(compoundPath)
+            if bFolderCreated:
+                shutil.rmtree(compoundsFolder)
+        self.assertIsNone(CompoundRegistry().findDefinition('PyFlowBase', 'sharedAnd'))
+
+        # stored graph is used when definition is missing
+        man.clear(keepRoot=False)
+        man.deserialize(savedWithGraphs)
+        restored = man.findNode(first.name)
+        self.assertIsNone(restored.getDefinition())
+        self.assertEqual(len(restored.rawGraph.getNodesList(classNameFilters=['bitwiseAnd'])), 1)
+        man.findNode(makeIntNode.name).setData('i', 7)
+        man.findNode(printNode.name)[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(man.findNode(printNode.name)[str("entity")].currentData(), 6)
+
+    def test_compiled_compound(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"].getFunctions()
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        compoundNode = classNodes['compound'](str('compound'))
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (compoundNode, makeIntNode, printNode):
+            man.activeGraph().addNode(node)
+
+        # (in + b) * b
+        man.selectGraph(compoundNode)
+        inputs = man.activeGraph().getInputNode()
+        outputs = man.activeGraph().getOutputNode()
+        inPin = inputs.addOutPin()
+        outPin = outputs.addInPin()
+        addNode = NodeBase.initializeFromFunction(foos["add"])
+        mulNode = NodeBase.initializeFromFunction(foos["multiply"])
+        man.activeGraph().addNode(addNode)
+        man.activeGraph().addNode(mulNode)
+        man.Tick(0.02)
+        self.assertEqual(connectPins(inPin, addNode[str('a')]), True)
+        self.assertEqual(connectPins(addNode[str('out')], mulNode[str('a')]), True)
+        self.assertEqual(connectPins(mulNode[str('out')], outPin), True)
+        man.selectRootGraph()
+
+        self.assertEqual(connectPins(makeIntNode[str('out')], compoundNode[inPin.name]), True)
+        self.assertEqual(connectPins(compoundNode[outPin.name], printNode[str("entity")]), True)
+        makeIntNode.setData('i', 4)
+        addNode.setData('b', 2)
+        mulNode.setData('b', 3)
+
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 18)
+
+        compoundNode.setCompileEnabled(True)
+        self.assertEqual(compoundNode.isCompiled(), True)
+        makeIntNode.setData('i', 5)
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 21)
+
+        # baked constants are refreshed
+        mulNode.setData('b', 10)
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 70)
+
+        # switch is serialized
+        saved = man.serialize()
+        man.clear(keepRoot=False)
+        man.deserialize(saved)
+        restoredCompound = man.getAllNodes(classNameFilters=['compound'])[0]
+        self.assertEqual(restoredCompound.isCompiled(), True)
+        printNode = man.activeGraph().findNode(str('print'))
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 70)
@@ -0,0 +1,523 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+from PyFlow.Tests.TestsBase import *
+from PyFlow.Core.Common import *
+
+
+class TestEvaluation(PyFlowTestCase):
+
+    def test_incremental_evaluation(self):
+        from PyFlow.Core.EvaluationEngine import EvaluationEngine, IncrementalEvaluationEngine_Impl
+
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        mathLib = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"]
+        defaultLib = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"]
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+        foos = mathLib.getFunctions()
+        defaultLibFoos = defaultLib.getFunctions()
+
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        addNode1 = NodeBase.initializeFromFunction(foos["add"])
+        addNode2 = NodeBase.initializeFromFunction(foos["add"])
+        printNode = classNodes["consoleOutput"]("print")
+
+        for node in (makeIntNode, addNode1, addNode2, printNode):
+            man.activeGraph().addNode(node)
+
+        self.assertEqual(connectPins(makeIntNode[str('out')], addNode1[str('a')]), True)
+        self.assertEqual(connectPins(addNode1[str('out')], addNode2[str('a')]), True)
+        self.assertEqual(connectPins(addNode2[str('out')], printNode[str("entity")]), True)
+        makeIntNode.setData('i', 5)
+        addNode1.setData('b', 1)
+        addNode2.setData('b', 2)
+
+        computed = []
+
+        def countComputes(node):
+            compute = node.compute
+
+            def wrapper(*args, **kwargs):
+                computed.append(node)
+                return compute(*args, **kwargs)
+            node.compute = wrapper
+
+        for node in (makeIntNode, addNode1, addNode2):
+            countComputes(node)
+
+        engine = EvaluationEngine()
+        defaultImpl = engine.getImpl()
+        engine.setImpl(IncrementalEvaluationEngine_Impl())
+        try:
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 8)
+            self.assertEqual(len(computed), 3)
+
+            # nothing changed, everything upstream is clean
+            clearList(computed)
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 8)
+            self.assertEqual(len(computed), 0)
+
+            # only second add node is affected
+            addNode2.setData('b', 10)
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 16)
+            self.assertEqual(computed, [addNode2])
+        finally:
+            engine.setImpl(defaultImpl)
+
+    def test_parallel_evaluation(self):
+        from PyFlow.Core.EvaluationEngine import EvaluationEngine, ParallelEvaluationEngine_Impl
+
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        mathLib = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"]
+        defaultLib = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"]
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+        foos = mathLib.getFunctions()
+        defaultLibFoos = defaultLib.getFunctions()
+
+        makeIntNode1 = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        makeIntNode2 = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        addNode1 = NodeBase.initializeFromFunction(foos["add"])
+        addNode2 = NodeBase.initializeFromFunction(foos["add"])
+        addNode3 = NodeBase.initializeFromFunction(foos["add"])
+        printNode = classNodes["consoleOutput"]("print")
+
+        for node in (makeIntNode1, makeIntNode2, addNode1, addNode2, addNode3, printNode):
+            man.activeGraph().addNode(node)
+
+        self.assertEqual(connectPins(makeIntNode1[str('out')], addNode1[str('a')]), True)
+        self.assertEqual(connectPins(makeIntNode2[str('out')], addNode2[str('a')]), True)
+        self.assertEqual(connectPins(addNode1[str('out')], addNode3[str('a')]), True)
+        self.assertEqual(connectPins(addNode2[str('out')], addNode3[str('b')]), True)
+        self.assertEqual(connectPins(addNode3[str('out')], printNode[str("entity")]), True)
+        makeIntNode1.setData('i', 5)
+        makeIntNode2.setData('i', 7)
+        addNode1.setData('b', 1)
+        addNode2.setData('b', 2)
+
+        engine = EvaluationEngine()
+        defaultImpl = engine.getImpl()
+        parallelImpl = ParallelEvaluationEngine_Impl(maxThreads=2, maxProcesses=1)
+        engine.setImpl(parallelImpl)
+        try:
+            levels = parallelImpl.getEvaluationLevels(printNode)
+            self.assertEqual([set(level) for level in levels], [{makeIntNode1, makeIntNode2}, {addNode1, addNode2}, {addNode3}])
+            import threading
+            setThreads = set()
+
+            def onDataSet(pin):
+                setThreads.add(threading.current_thread())
+            for node in (addNode1, addNode2):
+                node[str('out')].dataBeenSet.connect(onDataSet)
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 15)
+            # pin data is set on calling thread only
+            self.assertEqual(setThreads, {threading.current_thread()})
+
+            self.assertEqual(parallelImpl.remoteCalls, 0)
+
+            # side effect free math functions are evaluated in worker process
+            mathFoos = packages['PyFlowBase'].GetFunctionLibraries()["MathLib"].getFunctions()
+            powNode = NodeBase.initializeFromFunction(mathFoos["power"])
+            hypotNode = NodeBase.initializeFromFunction(mathFoos["hypot"])
+            sumNode = NodeBase.initializeFromFunction(foos["add"])
+            for node in (powNode, hypotNode, sumNode):
+                man.activeGraph().addNode(node)
+            self.assertTrue(parallelImpl.isSideEffectFree(powNode))
+            self.assertFalse(parallelImpl.isSideEffectFree(addNode1))
+            powNode.setData('x', 2.0)
+            powNode.setData('y', 3.0)
+            hypotNode.setData('x', 3.0)
+            hypotNode.setData('y', 4.0)
+            self.assertTrue(connectPins(powNode[str('out')], sumNode[str('a')]))
+            self.assertTrue(connectPins(hypotNode[str('out')], sumNode[str('b')]))
+            self.assertTrue(connectPins(sumNode[str('out')], printNode[str("entity")]))
+            printNode[DEFAULT_IN_EXEC_NAME].call()
+            self.assertEqual(printNode[str("entity")].currentData(), 13.0)
+            self.assertEqual(parallelImpl.remoteCalls, 2)
+            # reference outputs are passed back from worker
+            self.assertEqual(powNode.getData('result'), True)
+        finally:
+            engine.setImpl(defaultImpl)
+            parallelImpl.shutdown()
+
+    def test_cycle_check_diamonds(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+        foos = intLib.getFunctions()
+
+        # every layer depends on both nodes of previous layer, number of paths grows exponentially
+        layers = []
+        for i in range(30):
+            layer = [NodeBase.initializeFromFunction(foos["bitwiseAnd"]) for j in range(2)]
+            for node in layer:
+                man.activeGraph().addNode(node)
+            if len(layers) > 0:
+                for node in layer:
+                    self.assertTrue(connectPins(layers[-1][0][str('out')], node[str('a')]))
+                    self.assertTrue(connectPins(layers[-1][1][str('out')], node[str('b')]))
+            layers.append(layer)
+
+        first = layers[0][0]
+        last = layers[-1][0]
+        self.assertTrue(cycleCheck(last[str('out')], first[str('a')]))
+        self.assertFalse(connectPins(last[str('out')], first[str('a')]))
+
+        for node in man.activeGraph().getNodesList():
+            for pin in node.pins:
+                for affected in pin.affects:
+                    self.assertLess(pin.topologicalIndex, affected.topologicalIndex)
+
+    def test_push_dirty_frontier(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+        foos = intLib.getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        layers = []
+        for i in range(30):
+            layer = [NodeBase.initializeFromFunction(foos["bitwiseOr"]) for j in range(2)]
+            for node in layer:
+                man.activeGraph().addNode(node)
+            if len(layers) > 0:
+                for node in layer:
+                    connectPins(layers[-1][0][str('out')], node[str('a')])
+                    connectPins(layers[-1][1][str('out')], node[str('b')])
+            layers.append(layer)
+        printNode = classNodes["consoleOutput"]("print")
+        man.activeGraph().addNode(printNode)
+        connectPins(layers[-1][0][str('out')], printNode[str("entity")])
+
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        frontier = man.activeGraph().getDirtyFrontier()
+        lastOut = layers[-1][0][str('out')]
+        self.assertNotIn(lastOut, frontier)
+        self.assertFalse(lastOut.dirty)
+
+        # without deduplication this visits 2 ** 30 paths
+        layers[0][0].setData('a', 1)
+        self.assertIn(lastOut, frontier)
+        self.assertTrue(lastOut.dirty)
+        self.assertTrue(printNode[str("entity")].dirty)
+
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 1)
+        self.assertNotIn(lastOut, frontier)
+
+    def test_node_cache(self):
+        from PyFlow.Core.NodeCache import NodeCache, CacheMemoryBudget, makeCacheKey, estimateSize
+        cache = NodeCache(maxSize=2)
+        cache.put(1, "a")
+        cache.put(2, "b")
+        self.assertEqual(cache.get(1), "a")
+        cache.put(3, "c")
+        # 2 was least recently used
+        self.assertNotIn(2, cache)
+        self.assertIn(1, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+        expiring = NodeCache(ttl=0.0)
+        expiring.put(1, "a")
+        time.sleep(0.01)
+        self.assertIsNone(expiring.get(1))
+        self.assertEqual(len(expiring), 0)
+
+        # unhashable values with equal content produce equal keys
+        self.assertEqual(makeCacheKey([1, [2, 3], {"a": 1}]), makeCacheKey([1, [2, 3], {"a": 1}]))
+        self.assertNotEqual(makeCacheKey([1, 2]), makeCacheKey((1, 2)))
+        self.assertIsNone(makeCacheKey([set()]))
+
+        # self referencing containers are measured once
+        selfReferencing = [1, 2]
+        selfReferencing.append(selfReferencing)
+        selfReferencing.append({"self": selfReferencing})
+        self.assertGreater(estimateSize(selfReferencing), estimateSize([1, 2]))
+
+        budget = CacheMemoryBudget()
+        oldMax = budget.maxBytes
+        try:
+            first = NodeCache()
+            second = NodeCache()
+            first.put(1, list(range(100)))
+            budget.maxBytes = budget.usedBytes + 100
+            second.put(1, list(range(100)))
+            # entries of least recently used cache are evicted first
+            self.assertEqual(len(first), 0)
+            self.assertEqual(len(second), 1)
+        finally:
+            budget.maxBytes = oldMax
+
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+        foos = intLib.getFunctions()
+        node = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        man.activeGraph().addNode(node)
+        node.bCacheEnabled = True
+        node.setData('a', 6)
+        node.setData('b', 3)
+        node.processNode()
+        self.assertEqual(node.getData('out'), 2)
+        self.assertEqual((node.cache.hits, node.cache.misses), (0, 1))
+        node.setData('a', 7)
+        node.processNode()
+        self.assertEqual(node.getData('out'), 3)
+        node.setData('a', 6)
+        node.processNode()
+        self.assertEqual(node.getData('out'), 2)
+        self.assertEqual((node.cache.hits, node.cache.misses), (1, 2))
+
+    def test_evaluation_plan_cache(self):
+        from PyFlow.Core.EvaluationEngine import DefaultEvaluationEngine_Impl
+
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"].getFunctions()
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        addNode = NodeBase.initializeFromFunction(foos["add"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (makeIntNode, addNode, printNode):
+            man.activeGraph().addNode(node)
+
+        self.assertEqual(connectPins(addNode[str('out')], printNode[str("entity")]), True)
+        plan = DefaultEvaluationEngine_Impl.getEvaluationPlan(printNode)
+        self.assertEqual(plan, [addNode])
+        self.assertIs(DefaultEvaluationEngine_Impl.getEvaluationPlan(printNode), plan)
+
+        # new connection changes topology version, plan is rebuilt
+        versionBefore = man.activeGraph().topologyVersion
+        self.assertEqual(connectPins(makeIntNode[str('out')], addNode[str('a')]), True)
+        self.assertGreater(man.activeGraph().topologyVersion, versionBefore)
+        self.assertEqual(DefaultEvaluationEngine_Impl.getEvaluationPlan(printNode), [makeIntNode, addNode])
+
+        makeIntNode.setData('i', 3)
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 3)
+
+    def test_graph_runner(self):
+        from PyFlow.Core.GraphRunner import GraphRunner
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        runner = GraphRunner(man, realTime=False)
+        # nothing to tick
+        self.assertTrue(runner.run())
+        self.assertEqual(runner.ticks, 0)
+
+        delayNode = classNodes["delay"]("delay")
+        man.activeGraph().addNode(delayNode)
+        delayNode.setData("Delay(s)", 5.0)
+        delayNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(man.timeUntilTick(), 5.0)
+        self.assertTrue(runner.run())
+        self.assertFalse(delayNode.process)
+        self.assertAlmostEqual(runner.time, 5.0)
+        # simulated time jumps straight to deadline
+        self.assertEqual(runner.ticks, 1)
+
+        fired = []
+        timerNode = classNodes["timer"]("timer")
+        man.activeGraph().addNode(timerNode)
+        timerNode.setData("Delta(s)", 1.0)
+        timerNode.out.call = lambda *args, **kwargs: fired.append(runner.time)
+        timerNode["Begin"].call()
+        self.assertFalse(runner.run(timeout=3.5))
+        self.assertEqual(len(fired), 3)
+        timerNode["Stop"].call()
+        self.assertIsNone(man.timeUntilTick())
+
+        delayNode.setData("Delay(s)", 0.1)
+        delayNode[DEFAULT_IN_EXEC_NAME].call()
+        start = time.time()
+        self.assertTrue(GraphRunner(man).run())
+        self.assertGreaterEqual(time.time() - start, 0.09)
+
+        # node which reimplements Tick needs every tick, simulated time still advances
+        class TickingNode(NodeBase):
+            def __init__(self, name):
+                super(TickingNode, self).__init__(name)
+                self.ticks = 0
+
+            def Tick(self, delta):
+                self.ticks += 1
+
+        tickingNode = TickingNode("ticking")
+        man.activeGraph().addNode(tickingNode)
+        self.assertEqual(man.timeUntilTick(), 0.0)
+        runner = GraphRunner(man, maxRate=0, realTime=False)
+        self.assertFalse(runner.run(timeout=0.1))
+        self.assertGreater(tickingNode.ticks, 0)
+        self.assertLessEqual(runner.ticks, int(round(0.1 / GraphRunner.minSimulatedStep)))
+
+    def test_tick_subscription(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+        foos = intLib.getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+        graph = man.activeGraph()
+
+        for i in range(100):
+            graph.addNode(NodeBase.initializeFromFunction(foos["bitwiseAnd"]))
+        timerNode = classNodes["timer"]("timer")
+        graph.addNode(timerNode)
+        self.assertEqual(graph.getTickNodes(), [timerNode])
+
+        # idle nodes are ticked only when somebody listens
+        idleNode = graph.getNodesList()[0]
+        ticks = []
+        idleNode.tick.connect(lambda delta: ticks.append(delta), weak=False)
+        idleNode.subscribeTick()
+        man.Tick(0.5)
+        self.assertEqual(ticks, [0.5])
+        idleNode.unsubscribeTick()
+        man.Tick(0.5)
+        self.assertEqual(ticks, [0.5])
+
+        timerNode.kill()
+        self.assertEqual(graph.getTickNodes(), [])
+
+        # compound pins are synced without ticking
+        compoundNode = classNodes["compound"]("compound")
+        graph.addNode(compoundNode)
+        self.assertNotIn(compoundNode, graph.getTickNodes())
+        man.selectGraphByName(compoundNode.name)
+        inputs = man.activeGraph().getInputNode()
+        outputs = man.activeGraph().getOutputNode()
+        outPin = inputs.addOutPin()
+        inPin = outputs.addInPin()
+        self.assertEqual(list(compoundNode.namePinInputsMap), [outPin.name])
+        self.assertEqual(list(compoundNode.namePinOutputsMap), [inPin.name])
+        outPin.kill()
+        self.assertEqual(len(compoundNode.namePinInputsMap), 0)
+        outputs.kill()
+        self.assertEqual(len(compoundNode.namePinOutputsMap), 0)
+
+    def test_get_var_snapshot(self):
+        packages = GET_PACKAGES()
+        man = GraphManager()
+
+        v1 = man.activeGraph().createVariable(str('IntPin'))
+        v1.structure = StructureType.Array
+        v1.value = [1, 2, 3]
+        version = v1.version
+
+        getter = packages["PyFlowBase"].GetNodeClasses()['getVar'](str('v1Getter'), v1)
+        man.activeGraph().addNode(getter)
+        printer = packages["PyFlowBase"].GetNodeClasses()['consoleOutput']("print")
+        man.activeGraph().addNode(printer)
+        self.assertTrue(connectPins(getter.out, printer[str('entity')]))
+
+        printer[DEFAULT_IN_EXEC_NAME].call()
+        snapshot = getter.out.currentData()
+        self.assertEqual(snapshot, [1, 2, 3])
+        # readers share value, it is not copied per read
+        self.assertIs(snapshot, v1.value)
+        printer[DEFAULT_IN_EXEC_NAME].call()
+        self.assertIs(getter.out.currentData(), snapshot)
+
+        # value is copied when assigned, so assigned object can be changed later
+        source = [5]
+        v1.value = source
+        source.append(6)
+        self.assertEqual(v1.value, [5])
+        self.assertEqual(v1.version, version + 1)
+        printer[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printer[str('entity')].currentData(), [5])
+
+        # values which can not be compared to bool are read by version only
+        if 'FloatArrayPin' in packages['PyFlowBase'].GetPinClasses():
+            import numpy
+            v2 = man.activeGraph().createVariable(str('FloatArrayPin'))
+            v2.value = numpy.arange(3.0)
+            arrayGetter = packages["PyFlowBase"].GetNodeClasses()['getVar'](str('v2Getter'), v2)
+            man.activeGraph().addNode(arrayGetter)
+            for i in range(2):
+                arrayGetter.processNode()
+                self.assertTrue(arrayGetter.isValid())
+                self.assertEqual(list(arrayGetter.out.currentData()), [0.0, 1.0, 2.0])
+
+    def test_batched_loops(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"].getFunctions()
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        loopNode = classNodes["forLoop"]("loop")
+        multNode = NodeBase.initializeFromFunction(foos["multiply"])
+        intNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (loopNode, multNode, intNode, printNode):
+            man.activeGraph().addNode(node)
+        loopNode.setData("Stop", 5)
+        intNode.setData("i", 3)
+        self.assertTrue(connectPins(loopNode["Index"], multNode["a"]))
+        self.assertTrue(connectPins(intNode["out"], multNode["b"]))
+        self.assertTrue(connectPins(multNode["out"], loopNode["Result"]))
+        self.assertTrue(connectPins(loopNode["Results"], printNode["entity"]))
+        self.assertTrue(connectPins(loopNode["Completed"], printNode[DEFAULT_IN_EXEC_NAME]))
+
+        computed = []
+        addCompute = intNode.compute
+
+        def countedCompute(*args, **kwargs):
+            computed.append(intNode)
+            addCompute(*args, **kwargs)
+        intNode.compute = countedCompute
+
+        # pure body, loop invariant node is evaluated once
+        loopNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode["entity"].currentData(), [0, 3, 6, 9, 12])
+        self.assertEqual(len(computed), 1)
+
+        # connected loop body falls back to iterations
+        bodyNode = classNodes["consoleOutput"]("body")
+        man.activeGraph().addNode(bodyNode)
+        self.assertTrue(connectPins(loopNode["LoopBody"], bodyNode[DEFAULT_IN_EXEC_NAME]))
+        self.assertTrue(connectPins(loopNode["Index"], bodyNode["entity"]))
+        del computed[:]
+        loopNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode["entity"].currentData(), [0, 3, 6, 9, 12])
+        self.assertEqual(len(computed), 5)
+
+        eachNode = classNodes["forEachLoop"]("each")
+        makeArrayNode = classNodes["makeArray"]("array")
+        man.activeGraph().addNode(eachNode)
+        man.activeGraph().addNode(makeArrayNode)
+        for value in (2, 4):
+            valueNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+            man.activeGraph().addNode(valueNode)
+            valueNode.setData("i", value)
+            self.assertTrue(connectPins(valueNode["out"], makeArrayNode["data"]))
+        self.assertTrue(connectPins(makeArrayNode["out"], eachNode["array"]))
+        # same body moved to forEachLoop
+        multNode["a"].disconnectAll()
+        multNode["out"].disconnectAll()
+        self.assertTrue(connectPins(eachNode["element"], multNode["a"]))
+        self.assertTrue(connectPins(multNode["out"], eachNode["Result"]))
+        self.assertTrue(connectPins(eachNode["Results"], printNode["entity"]))
+        eachNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(sorted(printNode["entity"].currentData()), [6, 12])
@@ -20,13 +20,7 @@ from PyFlow.Input import *
 import time
 
 
-class TestGeneral(unittest.TestCase):
-
-    def setUp(self):
-        print('\t[BEGIN TEST]', self._testMethodName)
-
-    def tearDown(self):
-        print('--------------------------------\n')
+class TestGeneral(PyFlowTestCase):
 
     def test_connect_pins_by_indexes(self):
         man = GraphManager()
@@ -508,9 +502,254 @@ class TestGeneral(unittest.TestCase):
         self.assertIsNotNone(man.activeGraph())
         nameAfter = man.getAllNodes(classNameFilters="compound")[0].name
         self.assertEqual(nameBefore, nameAfter, "names are incorrect {0} - {1}".format(nameBefore, nameAfter))
-        depthsAfter = [g.depth() for g in man.getAllGraphs()]
+        depthsAfter = [g.depth() for g in man.getAllGraphs(bLoadedOnly=False)]
         self.assertEqual(Counter(depthsBefore), Counter(depthsAfter), "failed to restore graphs depths")
 
+    def test_paths_registry(self):
+        from PyFlow.Core.GraphManager import GraphManagerSingleton
+        from PyFlow.Core.PathsRegistry import PathsRegistry
+
+        man = GraphManagerSingleton().get()
+        packages = GET_PACKAGES()
+        mathLib = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"]
+        foos = mathLib.getFunctions()
+        registry = PathsRegistry()
+
+        addNode = NodeBase.initializeFromFunction(foos["add"])
+        man.activeGraph().addNode(addNode)
+        try:
+            nodePath = addNode.path()
+            self.assertIs(registry.getEntity(nodePath), addNode)
+            self.assertIs(registry.getEntity(addNode[str('a')].path()), addNode[str('a')])
+
+            addNode.setName("renamedAdd")
+            self.assertFalse(registry.contains(nodePath))
+            self.assertIs(registry.getEntity(addNode.path()), addNode)
+            self.assertIs(registry.getEntity(addNode[str('b')].path()), addNode[str('b')])
+
+            with registry.suspended():
+                addNode.setName("suspendedAdd")
+                self.assertFalse(registry.contains(addNode.path()))
+            self.assertIs(registry.getEntity(addNode.path()), addNode)
+            pinPath = addNode[str('a')].path()
+        finally:
+            addNode.kill()
+        self.assertFalse(registry.contains(addNode.path()))
+        self.assertFalse(registry.contains(pinPath))
+
+    def test_pin_maps_cache(self):
+        packages = GET_PACKAGES()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+        seqNode = classNodes["sequence"]("seq")
+
+        outputs = seqNode.outputs
+        self.assertIs(seqNode.outputs, outputs)
+
+        pin = seqNode.createOutputPin("first", "ExecPin")
+        pin.pinIndex = 100
+        self.assertIn(pin.uid, seqNode.outputs)
+        self.assertIs(list(seqNode.orderedOutputs.values())[-1], pin)
+
+        pin.setName("renamed", force=True)
+        self.assertIs(seqNode.namePinOutputsMap["renamed"], pin)
+        self.assertNotIn("first", seqNode.namePinOutputsMap)
+
+        pin.kill()
+        self.assertNotIn(pin.uid, seqNode.outputs)
+        self.assertNotIn("renamed", seqNode.namePinOutputsMap)
+
+    def test_manager_indexes(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        mathLib = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"]
+        foos = mathLib.getFunctions()
+
+        addNode1 = NodeBase.initializeFromFunction(foos["add"])
+        addNode2 = NodeBase.initializeFromFunction(foos["add"])
+        man.activeGraph().addNode(addNode1)
+        man.activeGraph().addNode(addNode2)
+        self.assertNotEqual(addNode1.name, addNode2.name)
+        self.assertIs(man.findNode(addNode2.name), addNode2)
+        self.assertIs(man.activeGraph().findNode(addNode1.name), addNode1)
+
+        pin = addNode1[str('a')]
+        self.assertIs(man.findPinByName(pin.getFullName()), pin)
+        self.assertIs(man.activeGraph().findPinByUid(pin.uid), pin)
+
+        addNode1.setName("first_add")
+        self.assertIsNone(man.findNode("add"))
+        self.assertIs(man.findNode("first_add"), addNode1)
+        self.assertIs(man.findPinByName("first_add_a"), pin)
+
+        var = man.activeGraph().createVariable(name=str("counter"))
+        self.assertIs(man.findVariableByUid(var.uid), var)
+        self.assertEqual(man.getUniqVariableName(str("counter")), "counter1")
+        var.name = str("total")
+        self.assertIs(man.findVariableByName("total"), var)
+        self.assertIsNone(man.findVariableByName("counter"))
+
+        addNode1.kill()
+        self.assertIsNone(man.findNode("first_add"))
+        self.assertIsNone(man.activeGraph().findPinByUid(pin.uid))
+        man.activeGraph().killVariable(var)
+        self.assertIsNone(man.findVariableByUid(var.uid))
+
+    def test_graph_bulk_load(self):
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        mathLib = packages['PyFlowBase'].GetFunctionLibraries()["MathAbstractLib"]
+        foos = mathLib.getFunctions()
+
+        defaultLibFoos = packages['PyFlowBase'].GetFunctionLibraries()["DefaultLib"].getFunctions()
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        addNodes = [NodeBase.initializeFromFunction(foos["add"]) for i in range(4)]
+        printNode = packages['PyFlowBase'].GetNodeClasses()["consoleOutput"]("print")
+        links = [(makeIntNode[str('out')], addNodes[0][str('a')]), (addNodes[-1][str('out')], printNode[str("entity")])]
+        for lhs, rhs in zip(addNodes, addNodes[1:]):
+            links.append((lhs[str('out')], rhs[str('a')]))
+        # closes a cycle
+        links.append((addNodes[-1][str('out')], addNodes[0][str('b')]))
+
+        failed = man.activeGraph().bulkLoad([makeIntNode, printNode] + addNodes, links)
+        self.assertEqual(failed, [links[-1]])
+        self.assertFalse(arePinsConnected(addNodes[-1][str('out')], addNodes[0][str('b')]))
+        for lhs, rhs in links[:-1]:
+            self.assertTrue(arePinsConnected(lhs, rhs))
+
+        for node in addNodes:
+            node.setData('b', 1)
+        makeIntNode.setData('i', 1)
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode[str("entity")].currentData(), 5)
+
+        with man.activeGraph().batch():
+            self.assertTrue(man.activeGraph().isBatching())
+            self.assertTrue(connectPins(addNodes[-1][str('out')], addNodes[1][str('b')]))
+        self.assertFalse(man.activeGraph().isBatching())
+        self.assertFalse(arePinsConnected(addNodes[-1][str('out')], addNodes[1][str('b')]))
+
+        # connections made in batch are propagated to leaf pins and dirty frontier
+        man = GraphManager()
+        makeIntNode = NodeBase.initializeFromFunction(defaultLibFoos["makeInt"])
+        addNode = NodeBase.initializeFromFunction(foos["add"])
+        printNode = packages['PyFlowBase'].GetNodeClasses()["consoleOutput"]("print")
+        links = [(makeIntNode[str('out')], addNode[str('a')]), (addNode[str('out')], printNode[str("entity")])]
+        self.assertEqual(man.activeGraph().bulkLoad([makeIntNode, addNode, printNode], links), [])
+        frontier = man.activeGraph().getDirtyFrontier()
+        for pin in [addNode[str('a')], addNode[str('out')], printNode[str("entity")]]:
+            self.assertTrue(pin.dirty)
+            self.assertIn(pin, frontier)
+
+    def test_editor_history(self):
+        from PyFlow.UI.EditorHistory import EditorHistory
+        from PyFlow.Core.GraphManager import GraphManagerSingleton
+        man = GraphManagerSingleton().get()
+        man.clear(keepRoot=True)
+        history = EditorHistory(None)
+        try:
+            history.capacity = 10
+            packages = GET_PACKAGES()
+            intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+            foos = intLib.getFunctions()
+            graph = man.activeGraph()
+            history.saveState("start")
+            self.assertIsNotNone(history.activeState.snapshot)
+
+            addNode1 = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+            addNode2 = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+            graph.addNode(addNode1)
+            graph.addNode(addNode2)
+            history.saveState("add nodes", modify=True)
+            self.assertEqual(len(history.activeState.delta.nodes), 2)
+
+            connectPins(addNode1[str('out')], addNode2[str('a')])
+            addNode2.setPosition(100, 50)
+            history.saveState("connect", modify=True)
+            # only changed nodes are stored
+            self.assertIsNone(history.activeState.snapshot)
+            self.assertEqual(len(history.activeState.delta.nodes), 2)
+
+            history.undo()
+            graph = man.activeGraph()
+            self.assertEqual(len(graph.getNodes()), 2)
+            restored1 = graph.getNodes()[addNode1.uid]
+            restored2 = graph.getNodes()[addNode2.uid]
+            self.assertFalse(restored2[str("a")].hasConnections())
+            self.assertFalse(restored1[str('out')].hasConnections())
+
+            history.undo()
+            self.assertEqual(len(man.activeGraph().getNodes()), 0)
+
+            history.redo()
+            history.redo()
+            nodes = man.activeGraph().getNodes()
+            self.assertEqual(len(nodes), 2)
+            self.assertTrue(arePinsConnected(nodes[addNode1.uid][str('out')], nodes[addNode2.uid][str('a')]))
+            self.assertEqual((nodes[addNode2.uid].x, nodes[addNode2.uid].y), (100, 50))
+
+            # variables
+            var = man.activeGraph().createVariable(dataType="IntPin", name="counter")
+            history.saveState("create var", modify=True)
+            self.assertEqual(len(history.activeState.delta.variables), 1)
+            history.undo()
+            self.assertNotIn(var.uid, man.activeGraph().getVars())
+            history.redo()
+            self.assertEqual(man.activeGraph().getVars()[var.uid].name, "counter")
+
+            # oldest state becomes checkpoint when trimmed
+            history.capacity = 3
+            history.saveState("nothing")
+            self.assertEqual(history.count(), 2)
+            self.assertIs(history.stack[-1], history.activeState)
+            self.assertIsNotNone(history.stack[0].snapshot)
+            self.assertEqual(len(history.stack[0].snapshot["vars"]), 1)
+            history.undo()
+            self.assertEqual(len(man.activeGraph().getNodes()), 2)
+        finally:
+            history.shutdown()
+            EditorHistory.destroy()
+            man.clear(keepRoot=True)
+
+    def test_spline_ramp(self):
+        from PyFlow.Core.structs import splineRamp
+        ramp = splineRamp()
+        ramp.addItem(1.0, 1.0)
+        first = ramp.addItem(0.0, 0.0)
+        ramp.addItem(0.5, 1.0)
+        self.assertEqual(ramp.uValues, [0.0, 0.5, 1.0])
+        self.assertEqual(ramp.evaluateMany([-1.0, 0.25, 0.75, 2.0]), [0.0, 0.5, 1.0, 1.0])
+
+        # moved tick is sorted again
+        first.setU(0.75)
+        self.assertEqual(ramp.uValues, [0.5, 0.75, 1.0])
+        self.assertEqual(ramp.evaluateAt(0.25), 1.0)
+
+        # many keys are evaluated in polynomial time
+        ramp.clear()
+        for i in range(40):
+            ramp.addItem(i / 39.0, 0.5)
+        values = ramp.evaluateMany([0.1, 0.5, 0.9], bezier=True)
+        for value in values:
+            self.assertAlmostEqual(value, 0.5)
+
+    def test_function_node_class_cache(self):
+        packages = GET_PACKAGES()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["MathLib"].getFunctions()
+        first = NodeBase.initializeFromFunction(foos["modf"])
+        second = NodeBase.initializeFromFunction(foos["modf"])
+        self.assertIs(type(first), type(second))
+        self.assertIs(type(first), NodeBase.getFunctionNodeClass(foos["modf"]))
+        self.assertEqual(type(first).__name__, "modf")
+        self.assertEqual(first.lib, "MathLib")
+        self.assertIsNot(first['f'], second['f'])
+
+        # instances do not share pins or values
+        first['x'].setData(2.5)
+        first.processNode()
+        second.processNode()
+        self.assertEqual(first.getData('f'), 0.5)
+        self.assertEqual(second.getData('f'), 0.0)
+
     def test_any_pin_speed(self):
         packages = GET_PACKAGES()
         man = GraphManager()
@@ -0,0 +1,109 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+from PyFlow.Tests.TestsBase import *
+from PyFlow.Core.Common import *
+
+
+class TestGraphFile(PyFlowTestCase):
+
+    def test_binary_graph_file(self):
+        import io
+        import os
+        import json
+        import shutil
+        import tempfile
+        from PyFlow.Core.GraphFile import readGraphFile, writeGraphFile, isBinaryGraphFile
+        man = GraphManager()
+        packages = GET_PACKAGES()
+        intLib = packages['PyFlowBase'].GetFunctionLibraries()["IntLib"]
+        foos = intLib.getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+        graph = man.activeGraph()
+
+        previous = None
+        for i in range(20):
+            node = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+            graph.addNode(node)
+            node.setPosition(-i * 1.5, i * 1000)
+            if previous is not None:
+                connectPins(previous[str('out')], node[str('a')])
+            previous = node
+        previous[str('b')].setData(-123456789)
+        graph.createVariable(dataType="FloatPin", name="ratio").value = 0.25
+        graph.addNode(classNodes["compound"]("compound"))
+        data = man.serialize()
+
+        tempDir = tempfile.mkdtemp()
+        binaryPath = os.path.join(tempDir, "graph.pygraph")
+        jsonPath = os.path.join(tempDir, "graph_json.pygraph")
+        writeGraphFile(binaryPath, data, binary=True)
+        writeGraphFile(jsonPath, data)
+        self.assertTrue(isBinaryGraphFile(binaryPath))
+        self.assertFalse(isBinaryGraphFile(jsonPath))
+        self.assertLess(os.path.getsize(binaryPath), os.path.getsize(jsonPath) / 4)
+
+        # both formats produce same data
+        self.assertEqual(readGraphFile(binaryPath), readGraphFile(jsonPath))
+        self.assertEqual(readGraphFile(jsonPath), json.loads(json.dumps(data)))
+
+        loaded = GraphManager()
+        loaded.deserialize(readGraphFile(binaryPath))
+        loadedGraph = loaded.findRootGraph()
+        self.assertEqual(len(loadedGraph.getNodes()), 21)
+        loadedNode = loadedGraph.getNodes()[previous.uid]
+        self.assertEqual(loadedNode[str('b')].getData(), -123456789)
+        self.assertTrue(loadedNode[str('a')].hasConnections())
+        self.assertEqual(list(loadedGraph.getVars().values())[0].value, 0.25)
+
+        # nested dicts with same keys as enclosing dict register shape once
+        from PyFlow.Core.GraphFile import dumpBinary, loadBinary
+        records = [{'a': {'a': 1, 'b': 2}, 'b': 0}, {'c': 1, 'd': 2}, {'c': 3, 'd': 4}, {'a': 5, 'b': 6}]
+        stream = io.BytesIO()
+        dumpBinary(records, stream)
+        stream.seek(0)
+        self.assertEqual(loadBinary(stream), records)
+
+        # file cut at any position is reported as truncated, including cuts inside varint,
+        # uuid and float payloads
+        withFloats = io.BytesIO()
+        dumpBinary({'uid': '01234567-89ab-cdef-0123-456789abcdef', 'x': 0.5, 'n': 1 << 40}, withFloats)
+        for encoded in (stream.getvalue(), withFloats.getvalue()):
+            for size in range(len(b"PFGB"), len(encoded)):
+                with self.assertRaises(ValueError) as context:
+                    loadBinary(io.BytesIO(encoded[:size]))
+                self.assertEqual(str(context.exception), "truncated graph file")
+
+        # nested compounds store graphs with same structure inside nodes
+        man = GraphManager()
+        outerCompound = classNodes["compound"]("outer")
+        man.activeGraph().addNode(outerCompound)
+        man.selectGraph(outerCompound)
+        innerCompound = classNodes["compound"]("inner")
+        man.activeGraph().addNode(innerCompound)
+        man.activeGraph().addNode(NodeBase.initializeFromFunction(foos["bitwiseAnd"]))
+        man.selectGraph(innerCompound)
+        andNode = NodeBase.initializeFromFunction(foos["bitwiseAnd"])
+        man.activeGraph().addNode(andNode)
+        andNode.setData('b', 6)
+        man.selectRootGraph()
+        data = man.serialize()
+        writeGraphFile(binaryPath, data, binary=True)
+        self.assertEqual(readGraphFile(binaryPath), json.loads(json.dumps(data)))
+        loaded = GraphManager()
+        loaded.deserialize(readGraphFile(binaryPath))
+        loadedOuter = loaded.findNode("outer")
+        self.assertEqual(loadedOuter.serialize()["graphData"], outerCompound.serialize()["graphData"])
+        shutil.rmtree(tempDir)
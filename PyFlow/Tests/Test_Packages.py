@@ -0,0 +1,147 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+from PyFlow.Tests.TestsBase import *
+from PyFlow.Core.Common import *
+
+
+class TestPackages(PyFlowTestCase):
+
+    def test_headless_initialize(self):
+        script = "\n".join([
+            "import sys",
+            "class QtBlocker(object):",
+            "    def find_module(self, name, path=None):",
+            "        if name.split('.')[0] in ('Qt', 'PySide', 'PySide2', 'PyQt4', 'PyQt5'):",
+            "            return self",
+            "    def load_module(self, name):",
+            "        raise ImportError(name)",
+            "sys.meta_path.insert(0, QtBlocker())",
+            "from PyFlow import INITIALIZE, GET_PACKAGES",
+            "INITIALIZE(headless=True, manifestPath=None)",
+            "from PyFlow.Core.Common import *",
+            "from PyFlow.Core.GraphManager import GraphManagerSingleton",
+            "import PyFlow.Scripts",
+            "printNode = GET_PACKAGES()['PyFlowBase'].GetNodeClasses()['consoleOutput']('print')",
+            "GraphManagerSingleton().get().activeGraph().addNode(printNode)",
+            "printNode.setData('entity', 'headless')",
+            "printNode[DEFAULT_IN_EXEC_NAME].call()",
+        ])
+        returnCode, out, err = runScript(script)
+        self.assertEqual(returnCode, 0, err)
+        self.assertEqual(out.strip(), "headless")
+
+    def test_package_registration_conflicts(self):
+        import os
+        import shutil
+        import tempfile
+        tempDir = tempfile.mkdtemp()
+        packageTemplate = "\n".join([
+            "from PyFlow.UI.UIInterfaces import IPackage",
+            "from PyFlow.Packages.PyFlowBase.Pins.IntPin import IntPin",
+            "{0}",
+            "class {1}(IPackage):",
+            "    @staticmethod",
+            "    def GetNodeClasses():",
+            "        return {{}}",
+            "    @staticmethod",
+            "    def GetFunctionLibraries():",
+            "        return {{}}",
+            "    @staticmethod",
+            "    def GetPinClasses():",
+            "        return {{'OtherIntPin': type('OtherIntPin', (IntPin,), {{}})}}",
+        ])
+
+        def writePackage(name, body=""):
+            os.makedirs(os.path.join(tempDir, name))
+            with open(os.path.join(tempDir, name, "__init__.py"), "w") as f:
+                f.write(packageTemplate.format(body, name))
+
+        def run():
+            script = "\n".join([
+                "import sys",
+                "from PyFlow import INITIALIZE, GET_PACKAGES",
+                "INITIALIZE([sys.argv[1]], headless=True, manifestPath=None)",
+                "print(sorted(GET_PACKAGES()))",
+            ])
+            returnCode, out, err = runScript(script, [tempDir])
+            return returnCode, out.strip(), err
+
+        try:
+            # package which fails to import is skipped
+            writePackage("BrokenPackage", "raise ImportError('broken')")
+            returnCode, out, err = run()
+            self.assertEqual(returnCode, 0, err)
+            self.assertEqual(out, "['PyFlowBase']")
+            self.assertIn("broken", err)
+
+            # conflicting internal pin data type stops initialization
+            writePackage("ConflictingPackage")
+            returnCode, out, err = run()
+            self.assertNotEqual(returnCode, 0)
+            self.assertIn("already been registered", err)
+        finally:
+            shutil.rmtree(tempDir)
+
+    def test_lazy_packages(self):
+        import os
+        import json
+        import shutil
+        import tempfile
+        tempDir = tempfile.mkdtemp()
+        manifestPath = os.path.join(tempDir, "manifest.json")
+        script = "\n".join([
+            "import sys",
+            "from PyFlow import INITIALIZE, GET_PACKAGES, GET_PACKAGE_MANIFEST, LazyPackage, getRawNodeInstance, findPinClassByType",
+            "INITIALIZE(headless=True, manifestPath=sys.argv[1])",
+            "package = GET_PACKAGES()['PyFlowBase']",
+            "print(isinstance(package, LazyPackage))",
+            "print('sin' in GET_PACKAGE_MANIFEST('PyFlowBase')['functions']['MathLib'])",
+            "node = getRawNodeInstance('sin', 'PyFlowBase', 'MathLib')",
+            "print(isinstance(GET_PACKAGES()['PyFlowBase'], LazyPackage))",
+            "INITIALIZE(headless=True, manifestPath=sys.argv[1])",
+            "print(findPinClassByType('IntPin') is not None)",
+        ])
+        def run(code=script):
+            returnCode, out, err = runScript(code, [manifestPath])
+            self.assertEqual(returnCode, 0, err)
+            return out.split()
+
+        def editManifest(edit):
+            with open(manifestPath, "r") as f:
+                data = json.load(f)
+            edit(data)
+            with open(manifestPath, "w") as f:
+                json.dump(data, f)
+
+        try:
+            # manifest is not written when packages are imported at once
+            self.assertEqual(run("import sys\nfrom PyFlow import INITIALIZE\nINITIALIZE(headless=True, lazy=False, manifestPath=sys.argv[1])"), [])
+            self.assertFalse(os.path.exists(manifestPath))
+
+            # manifest is written on first run, second run imports package on first use
+            self.assertEqual(run(), ["False", "True", "False", "True"])
+            self.assertTrue(os.path.exists(manifestPath))
+            self.assertEqual(run(), ["True", "True", "False", "True"])
+
+            # pin missing in manifest, for example written without optional dependency, is still found
+            editManifest(lambda data: data["packages"]["PyFlowBase"]["pins"].pop("IntPin"))
+            self.assertEqual(run(), ["True", "True", "False", "True"])
+
+            # manifest written by other interpreter is ignored
+            editManifest(lambda data: data.update(environment="other"))
+            self.assertEqual(run(), ["False", "True", "False", "True"])
+        finally:
+            shutil.rmtree(tempDir)
@@ -0,0 +1,193 @@
+## Copyright 2015-2019 Ilgar Lunin, Pedro Cabrera
+
+## Licensed under the Apache License, Version 2.0 (the "License");
+## you may not use this file except in compliance with the License.
+## You may obtain a copy of the License at
+
+##     http://www.apache.org/licenses/LICENSE-2.0
+
+## Unless required by applicable law or agreed to in writing, software
+## distributed under the License is distributed on an "AS IS" BASIS,
+## WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+## See the License for the specific language governing permissions and
+## limitations under the License.
+
+
+from PyFlow.Tests.TestsBase import *
+from PyFlow.Core.Common import *
+
+
+class TestVectorized(PyFlowTestCase):
+
+    def test_ndarray_pins(self):
+        packages = GET_PACKAGES()
+        if 'FloatArrayPin' not in packages['PyFlowBase'].GetPinClasses():
+            self.skipTest("NumPy is not installed")
+        import json
+        import numpy
+        man = GraphManager()
+        foos = packages['PyFlowBase'].GetFunctionLibraries()["NdArrayLib"].getFunctions()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        linspaceNode = NodeBase.initializeFromFunction(foos["linspace"])
+        toListNode = NodeBase.initializeFromFunction(foos["floatArrayToList"])
+        toIntNode = NodeBase.initializeFromFunction(foos["intArrayToList"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (linspaceNode, toListNode, toIntNode, printNode):
+            man.activeGraph().addNode(node)
+        linspaceNode.setData('num', 5)
+        linspaceNode.setData('stop', 4.0)
+
+        self.assertTrue(connectPins(linspaceNode['out'], toListNode['array']))
+        self.assertTrue(connectPins(linspaceNode['out'], toIntNode['array']))
+        self.assertTrue(connectPins(toListNode['out'], printNode['entity']))
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        self.assertEqual(printNode['entity'].currentData(), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+        # float output shares read only buffer with float input
+        array = linspaceNode['out'].currentData()
+        self.assertIs(toListNode['array'].currentData(), array)
+        self.assertFalse(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            array[0] = 1.0
+
+        # integer input gets converted copy
+        toIntNode.processNode()
+        self.assertEqual(toIntNode['array'].currentData().dtype, numpy.int64)
+        self.assertEqual(toIntNode.getData('out'), [0, 1, 2, 3, 4])
+
+        # lists are converted, arrays survive serialization
+        toListNode['array'].disconnectAll()
+        toListNode['array'].setData([1, 2])
+        self.assertEqual(toListNode['array'].currentData().dtype, numpy.float64)
+        value = toListNode['array'].serialize()['value']
+        self.assertEqual(json.loads(value), [1.0, 2.0])
+
+    def test_vectorized_math(self):
+        packages = GET_PACKAGES()
+        if 'FloatArrayPin' not in packages['PyFlowBase'].GetPinClasses():
+            self.skipTest("NumPy is not installed")
+        man = GraphManager()
+        libs = packages['PyFlowBase'].GetFunctionLibraries()
+        classNodes = packages['PyFlowBase'].GetNodeClasses()
+
+        linspaceNode = NodeBase.initializeFromFunction(libs["NdArrayLib"].getFunctions()["linspace"])
+        sinNode = NodeBase.initializeFromFunction(libs["MathLib"].getFunctions()["sin"])
+        multNode = NodeBase.initializeFromFunction(libs["MathAbstractLib"].getFunctions()["multiply"])
+        toListNode = NodeBase.initializeFromFunction(libs["NdArrayLib"].getFunctions()["floatArrayToList"])
+        printNode = classNodes["consoleOutput"]("print")
+        for node in (linspaceNode, sinNode, multNode, toListNode, printNode):
+            man.activeGraph().addNode(node)
+        linspaceNode.setData('num', 3)
+        linspaceNode.setData('stop', math.pi)
+
+        self.assertTrue(sinNode.isVectorizable())
+        self.assertFalse(printNode.isVectorizable())
+        sinUid = sinNode['rad'].uid
+        self.assertTrue(sinNode.setVectorized(True))
+        self.assertEqual(sinNode['rad'].dataType, 'FloatArrayPin')
+        self.assertEqual(sinNode['rad'].uid, sinUid)
+        self.assertTrue(multNode.setVectorized(True))
+        multNode.setData('b', [2.0])
+
+        self.assertTrue(connectPins(linspaceNode['out'], sinNode['rad']))
+        self.assertTrue(connectPins(sinNode['out'], multNode['a']))
+        self.assertTrue(connectPins(multNode['out'], toListNode['array']))
+        self.assertTrue(connectPins(toListNode['out'], printNode['entity']))
+        printNode[DEFAULT_IN_EXEC_NAME].call()
+        result = printNode['entity'].currentData()
+        self.assertEqual(len(result), 3)
+        for value, expected in zip(result, (0.0, 2.0, 0.0)):
+            self.assertAlmostEqual(value, expected)
+
+        # mode is serialized
+        data = man.serialize()
+        man.clear()
+        man.deserialize(data)
+        restored = man.activeGraph().findNode(sinNode.name)
+        self.assertTrue(restored.isVectorized())
+        self.assertEqual(restored['out'].dataType, 'FloatArrayPin')
+        self.assertEqual(len(restored['out'].linkedTo), 1)
+
+        # compiled graphs call functions directly, so vectorized nodes are not compiled
+        from PyFlow.Core.PyCodeCompiler import Py3GraphCompiler
+        self.assertFalse(Py3GraphCompiler.isCompilable(restored))
+        self.assertTrue(Py3GraphCompiler.isCompilable(NodeBase.initializeFromFunction(libs["MathLib"].getFunctions()["sin"])))
+
+        # mode is not changed while value pins are connected
+        self.assertFalse(restored.setVectorized(False))
+        self.assertTrue(restored.isVectorized())
+        self.assertEqual(len(restored['out'].linkedTo), 1)
+
+        # back to scalar
+        restored['rad'].disconnectAll()
+        restored['out'].disconnectAll()
+        outUid = restored['out'].uid
+        self.assertTrue(restored.setVectorized(False))
+        self.assertEqual(restored['rad'].dataType, 'FloatPin')
+        self.assertEqual(restored['out'].uid, outUid)
+        restored['rad'].setData(math.pi / 2)
+        restored.processNode()
+        self.assertAlmostEqual(restored.getData('out'), 1.0)
+
+        # values set in one mode are kept in other
+        scaleNode = NodeBase.initializeFromFunction(libs["MathLib"].getFunctions()["sin"])
+        man.activeGraph().addNode(scaleNode)
+        scaleNode.setData('rad', 0.5)
+        self.assertTrue(scaleNode.setVectorized(True))
+        self.assertEqual(list(scaleNode['rad'].currentData()), [0.5])
+        scaleNode.setData('rad', [1.5])
+        self.assertTrue(scaleNode.setVectorized(False))
+        self.assertEqual(scaleNode['rad'].currentData(), 1.5)
+        self.assertIs(type(scaleNode['rad'].currentData()), float)
+
+    def test_vectorized_matches_scalar(self):
+        packages = GET_PACKAGES()
+        if 'FloatArrayPin' not in packages['PyFlowBase'].GetPinClasses():
+            self.skipTest("NumPy is not installed")
+        man = GraphManager()
+        # samples are rotated per argument, so clamp gets swapped bounds too.
+        # Last samples are out of domain of some functions, like division by zero
+        floatSamples = ([0.25, 0.5, 0.75], [1.25, 1.5, 2.5], [0.0, -1.5, 0.5])
+        intSamples = ([1, 2, 3], [0, -2, 3])
+        checked = 0
+        failed = 0
+        for libName, lib in packages['PyFlowBase'].GetFunctionLibraries().items():
+            for name, foo in lib.getFunctions().items():
+                if not foo.__annotations__['meta'].get(NodeMeta.VECTORIZABLE, False):
+                    continue
+                node = NodeBase.initializeFromFunction(foo)
+                man.activeGraph().addNode(node)
+                self.assertTrue(node.setVectorized(True), name)
+                inputs = [pin for pin in node.orderedInputs.values() if not pin.isExec()]
+                bFloat = any(pin.dataType == 'FloatArrayPin' for pin in inputs)
+                bChecked = False
+                for samples in (floatSamples if bFloat else intSamples):
+                    arguments = {}
+                    for index, pin in enumerate(inputs):
+                        values = samples if pin.dataType == 'FloatArrayPin' else intSamples[0]
+                        arguments[pin.name] = values[index % 3:] + values[:index % 3]
+                    try:
+                        expected = [foo(**dict((argName, values[i]) for argName, values in arguments.items())) for i in range(3)]
+                    except (ValueError, OverflowError, ZeroDivisionError):
+                        expected = None
+                    for argName, values in arguments.items():
+                        node[argName].setData(values)
+                    node.clearError()
+                    node.processNode()
+                    if expected is None:
+                        # out of function domain, node fails in both modes
+                        self.assertFalse(node.isValid(), "{0}.{1}".format(libName, name))
+                        failed += 1
+                        continue
+                    self.assertTrue(node.isValid(), "{0}.{1}: {2}".format(libName, name, node.getLastErrorMessage()))
+                    result = node['out'].currentData()
+                    self.assertEqual(len(result), 3, name)
+                    for value, expectedValue in zip(result, expected):
+                        self.assertAlmostEqual(value, expectedValue, msg="{0}.{1}".format(libName, name))
+                    checked += 1
+                    bChecked = True
+                if not bChecked:
+                    self.fail("No valid samples for {0}.{1}".format(libName, name))
+        self.assertGreater(checked, 30)
+        self.assertGreater(failed, 0)
@@ -13,7 +13,10 @@
 ## limitations under the License.
 
 
+import os
+import sys
 import unittest
+import subprocess
 from nine import str
 
 from PyFlow.Core.Common import *
@@ -30,3 +33,32 @@ from PyFlow.Core import(
 )
 
 INITIALIZE()
+
+
+class PyFlowTestCase(unittest.TestCase):
+    """Base of PyFlow test cases, prints name of every test
+    """
+    def setUp(self):
+        print('\t[BEGIN TEST]', self._testMethodName)
+
+    def tearDown(self):
+        print('--------------------------------\n')
+
+
+def runScript(script, args=[]):
+    """Runs python code in new interpreter, which imports PyFlow from this source tree
+
+    :param script: Python code
+    :type script: str
+    :param args: Arguments available as sys.argv[1:]
+    :type args: list(str)
+    :returns: Return code, stdout and stderr
+    :rtype: tuple(int, str, str)
+    """
+    sourceRoot = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ)
+    # existing paths are kept, packages can be found through them
+    env["PYTHONPATH"] = os.pathsep.join([sourceRoot] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    process = subprocess.Popen([sys.executable, "-c", script] + list(args), env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    return process.returncode, out.decode("utf-8"), err.decode("utf-8")
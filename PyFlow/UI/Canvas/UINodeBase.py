@@ -259,6 +259,8 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
         self._rawNode.setWrapper(self)
         self._rawNode.killed.connect(self.kill)
         self._rawNode.tick.connect(self.Tick)
+        self._bTickSubscribed = False
+        self.updateTickSubscription()
         self._rawNode.errorOccured.connect(self.onNodeErrorOccurred)
         self._rawNode.errorCleared.connect(self.onNodeErrorCleared)
 
@@ -409,6 +411,15 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
         self._rawNode.compute()
         self._rawNode.checkForErrors()
 
+    def onToggleVectorized(self, bVectorized):
+        if self._rawNode.setVectorized(bVectorized):
+            for rawPin in self._rawNode.getOrderedPins():
+                self._createUIPinWrapper(rawPin)
+            self.updateNodeShape()
+            EditorHistory().saveState("{} vectorized mode".format("Enable" if bVectorized else "Disable"), modify=True)
+        else:
+            self.actionToggleVectorized.setChecked(self._rawNode.isVectorized())
+
     def onCopyPathToClipboard(self):
         QApplication.clipboard().clear()
         QApplication.clipboard().setText(self.path())
@@ -441,8 +452,16 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
 
     def setExposePropertiesToCompound(self, bExpose):
         self.bExposeInputsToCompound = bExpose
+        self.notifyModified()
         self.update()
 
+    def notifyModified(self):
+        """Tells editor history that data returned by :meth:`serializationHook` changed
+
+        .. seealso:: :meth:`~PyFlow.Core.NodeBase.NodeBase.notifyModified`
+        """
+        self._rawNode.notifyModified()
+
     def __repr__(self):
         return self._rawNode.__repr__()
 
@@ -549,6 +568,7 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
             for o in range(0, self.outputsLayout.count()):
                 out = self.outputsLayout.itemAt(o)
                 out.setVisible(not bCollapsed)
+            self.notifyModified()
             for cust in range(0, self.customLayout.count()):
                 out = self.customLayout.itemAt(cust)
                 out.setVisible(not bCollapsed)
@@ -702,6 +722,7 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
 
     def setHeaderHtml(self, html):
         self.nodeNameWidget.setHtml(html)
+        self.notifyModified()
 
     def getHeaderText(self):
         return self.nodeNameWidget.getPlainText()
@@ -901,6 +922,13 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
 
         self.createActionButtons()
 
+        if self._rawNode.isVectorizable():
+            self.actionToggleVectorized = self._menu.addAction("Vectorized")
+            self.actionToggleVectorized.setToolTip("Evaluate arrays of numbers at once. Value pins should be disconnected")
+            self.actionToggleVectorized.setCheckable(True)
+            self.actionToggleVectorized.setChecked(self._rawNode.isVectorized())
+            self.actionToggleVectorized.triggered.connect(self.onToggleVectorized)
+
         headerHtml = self.name
         if jsonTemplate is not None and jsonTemplate["wrapper"] is not None:
             if "exposeInputsToCompound" in jsonTemplate["wrapper"]:
@@ -1227,6 +1255,8 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
             self.update()
 
     def mouseReleaseEvent(self, event):
+        if self.bResize:
+            self.notifyModified()
         self.bResize = False
         self.resetResizeStrips()
         self.update()
@@ -1405,6 +1435,10 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
             self.resizeStrips[i] = 0
 
     def kill(self, *args, **kwargs):
+        if self._bTickSubscribed:
+            self._rawNode.unsubscribeTick()
+            self._bTickSubscribed = False
+        self._rawNode.tick.disconnect(self.Tick)
         scene = self.scene()
         if scene is not None:
             self.scene().removeItem(self)
@@ -1417,6 +1451,31 @@ class UINodeBase(QGraphicsWidget, IPropertiesViewSupport, IUINode):
         for pin in self.UIPins.values():
             pin.heartBeat()
 
+    def needsTick(self):
+        """Whether wrapper does any work in :meth:`Tick`
+
+        Base wrapper only moves watch widgets of pins, so it needs ticks while some pin is watched.
+        Subclasses which reimplement :meth:`Tick` or :meth:`heartBeat` are always ticked
+
+        :rtype: bool
+        """
+        cls = type(self)
+        if cls.Tick is not UINodeBase.Tick or cls.heartBeat is not UINodeBase.heartBeat:
+            return True
+        return any(pin.watchWidget is not None for pin in self.UIPins.values())
+
+    def updateTickSubscription(self):
+        """Subscribes to or unsubscribes from raw node ticks depending on :meth:`needsTick`
+
+        .. seealso:: :meth:`~PyFlow.Core.NodeBase.NodeBase.subscribeTick`
+        """
+        needsTick = self.needsTick()
+        if needsTick and not self._bTickSubscribed:
+            self._rawNode.subscribeTick()
+        elif not needsTick and self._bTickSubscribed:
+            self._rawNode.unsubscribeTick()
+        self._bTickSubscribed = needsTick
+
     def Tick(self, delta, *args, **kwargs):
         # NOTE: Do not call wrapped raw node Tick method here!
         # this ui node tick called from underlined raw node's emitted signal
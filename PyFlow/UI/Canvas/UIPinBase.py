@@ -135,6 +135,7 @@ class UIPinBase(QGraphicsWidget):
             self.watchWidget.setZValue(NodeDefaults().Z_LAYER + 1)
             self.updateWatchWidget()
             self.updateWatchWidgetValue(self.currentData())
+        self.owningNode().updateTickSubscription()
 
     def path(self):
         return self._rawPin.path()
@@ -207,6 +208,7 @@ class UIPinBase(QGraphicsWidget):
         if displayName != self._displayName:
             self._displayName = displayName
             self.displayNameChanged.emit(self._displayName)
+            self.owningNode().notifyModified()
             self.prepareGeometryChange()
             self.updateGeometry()
             self.update()
@@ -336,6 +338,10 @@ class UIPinBase(QGraphicsWidget):
 
     def setData(self, value):
         self._rawPin.setData(value)
+        if self._rawPin.direction == PinDirection.Input and not self._rawPin.hasConnections():
+            # value of not connected input is part of serialized node state,
+            # edits made by user detach compounds from definitions and reach editor history
+            self._rawPin.owningNode().notifyModified()
         self.dataBeenSet.emit(value)
 
     def getData(self):
@@ -14,21 +14,43 @@
 
 
 import uuid
+from copy import deepcopy
 from blinker import Signal
 from collections import OrderedDict
 
+from PyFlow import getRawNodeInstance
 from PyFlow.Core.Common import *
 from PyFlow.Core.Common import SingletonDecorator
 from PyFlow.Core.GraphManager import GraphManagerSingleton
+from PyFlow.Core.Variable import Variable
 from PyFlow.ConfigManager import ConfigManager
 
 
+class _HistoryDelta(object):
+    """Changes made between two history states
+
+    Only root graph nodes and variables are recorded. Changes inside compounds are recorded as change of top level compound node.
+    Every change is pair of serialized states before and after, None means object does not exist.
+    """
+    def __init__(self):
+        self.nodes = OrderedDict()
+        self.variables = OrderedDict()
+        self.activeGraph = (None, None)
+
+    def isEmpty(self):
+        return len(self.nodes) == 0 and len(self.variables) == 0
+
+
 class _EditorState(object):
-    """docstring for _EditorState."""
-    def __init__(self, text, modify):
+    """Entry of editor history
+
+    Holds either full serialized graph (checkpoint) or changes made since previous entry, or both.
+    """
+    def __init__(self, text, modify, snapshot=None, delta=None):
         super(_EditorState, self).__init__()
         self.text = text
-        self.editorState = GraphManagerSingleton().get().serialize()
+        self.snapshot = snapshot
+        self.delta = delta
         self._modify = modify
 
     def modifiesData(self):
@@ -38,10 +60,46 @@ class _EditorState(object):
         return self.text
 
 
+def _patchSnapshot(snapshot, delta):
+    """Applies changes to serialized graph, producing serialized graph of next state
+    """
+    result = dict(snapshot)
+    for key, changes in (('nodes', delta.nodes), ('vars', delta.variables)):
+        entries = OrderedDict((entry['uuid'], entry) for entry in snapshot[key])
+        for uid, (before, after) in changes.items():
+            if after is None:
+                entries.pop(uid, None)
+            else:
+                entries[uid] = after
+        result[key] = list(entries.values())
+    if delta.activeGraph[1] is not None:
+        result['activeGraph'] = delta.activeGraph[1]
+    return result
+
+
+def _iterSerializedVariables(graphJson):
+    """Yields owning graph name and serialized variable for graph and all graphs of compounds in it
+    """
+    stack = [graphJson]
+    while len(stack) > 0:
+        current = stack.pop()
+        for varJson in current['vars']:
+            yield current['name'], varJson
+        for nodeJson in current['nodes']:
+            if 'graphData' in nodeJson:
+                stack.append(nodeJson['graphData'])
+
+
 @SingletonDecorator
 class EditorHistory(object):
 
-    """docstring for EditorHistory."""
+    """Undo stack of the editor
+
+    Full serialized graph is stored only at checkpoints: first state, after file was loaded or new file created,
+    and oldest state in stack. Other states store changes of nodes and variables reported by
+    :attr:`~PyFlow.Core.GraphManager.GraphManager.nodeModified` since previous state.
+    Undo and redo apply these changes to existing graph, instead of reloading it.
+    """
     def __init__(self, app):
 
         self.statePushed = Signal(object)
@@ -57,7 +115,18 @@ class EditorHistory(object):
 
         self.activeState = None
 
+        # serialized state of root graph nodes and all variables as of active state
+        self._nodeStates = {}
+        self._variableStates = {}
+        self._activeGraphName = None
+        self._rootGraph = None
+        # nodes changed since active state
+        self._modifiedNodes = set()
+        self._bApplying = False
+        GraphManagerSingleton().get().nodeModified.connect(self.onNodeModified)
+
     def shutdown(self):
+        GraphManagerSingleton().get().nodeModified.disconnect(self.onNodeModified)
         clearSignal(self.statePushed)
         clearSignal(self.stateRemoved)
         clearSignal(self.stateSelected)
@@ -76,13 +145,12 @@ class EditorHistory(object):
     @capacity.setter
     def capacity(self, value):
         self._capacity = value
-        if value < len(self.stack):
-            for i in range(len(self.stack) - value):
-                state = self.stack.pop()
-                self.stateRemoved.send(state)
+        self._trim(value)
 
     def clear(self):
         clearList(self.stack)
+        self.activeState = None
+        self._rootGraph = None
 
     def stateIndex(self, state):
         if state in self.stack:
@@ -95,6 +163,10 @@ class EditorHistory(object):
             return self.stateIndex(self.activeState)
         return -1
 
+    def onNodeModified(self, node):
+        if not self._bApplying:
+            self._modifiedNodes.add(node)
+
     def push(self, edState):
 
         if self.currentIndex < self.count() - 1:
@@ -109,21 +181,24 @@ class EditorHistory(object):
 
         self.stack.append(edState)
 
-        if len(self.stack) >= self.capacity:
-            poppedState = self.stack.pop(0)
-            self.stateRemoved.send(poppedState)
+        self._trim(self.capacity - 1)
 
         self.statePushed.send(edState)
         self.activeState = edState
         self.stateSelected.send(edState)
 
+    def _trim(self, size):
+        """Removes oldest states, so oldest remaining state becomes a checkpoint
+        """
+        while len(self.stack) > max(size, 1):
+            poppedState = self.stack.pop(0)
+            if self.stack[0].snapshot is None:
+                self.stack[0].snapshot = _patchSnapshot(poppedState.snapshot, self.stack[0].delta)
+            self.stateRemoved.send(poppedState)
+
     def selectState(self, state):
-        for st in self.stack:
-            if state == st:
-                self.app.loadFromData(st.editorState)
-                self.activeState = st
-                self.stateSelected.send(st)
-                break
+        if state in self.stack:
+            self.select(self.stack.index(state))
 
     def select(self, index):
         index = clamp(index, 0, self.count() - 1)
@@ -134,16 +209,24 @@ class EditorHistory(object):
         if len(self.stack) == 0:
             return
 
-        stateData = self.stack[index].editorState
-
-        self.app.loadFromData(stateData)
+        self._moveTo(index)
 
         state = self.stack[index]
         self.activeState = state
         self.stateSelected.send(state)
 
     def saveState(self, text, modify=False):
-        self.push(_EditorState(text, modify))
+        manager = GraphManagerSingleton().get()
+        rootGraph = manager.findRootGraph()
+        if len(self.stack) == 0 or self._rootGraph is None or self._rootGraph is not rootGraph:
+            # graph was replaced, take checkpoint
+            state = _EditorState(text, modify, snapshot=manager.serialize())
+            self._resetStates(state.snapshot)
+            self._rootGraph = rootGraph
+        else:
+            state = _EditorState(text, modify, delta=self._collectDelta(manager, rootGraph))
+        self._modifiedNodes.clear()
+        self.push(state)
 
     def undo(self):
         if self.currentIndex > 0:
@@ -151,3 +234,238 @@ class EditorHistory(object):
 
     def redo(self):
         self.select(self.currentIndex + 1)
+
+    def _resetStates(self, snapshot):
+        self._nodeStates = dict((nodeJson['uuid'], nodeJson) for nodeJson in snapshot['nodes'])
+        self._variableStates = dict((varJson['uuid'], (graphName, varJson)) for graphName, varJson in _iterSerializedVariables(snapshot))
+        self._activeGraphName = snapshot['activeGraph']
+
+    def _findTopLevelNode(self, node, rootGraph, graphOwners):
+        """Returns root graph node which contains given node, None if node is not in graph tree anymore
+        """
+        if node.graph is None:
+            return None
+        graph = node.graph()
+        if graph is None:
+            return None
+        if graph is rootGraph:
+            return node
+        return self._findGraphOwner(graph, rootGraph, graphOwners)
+
+    def _findGraphOwner(self, graph, rootGraph, graphOwners):
+        """Returns root graph compound node which contains given subgraph
+        """
+        if graph not in graphOwners:
+            owner = None
+            parentGraph = graph.parentGraph
+            if parentGraph is not None and graph in parentGraph.childGraphs:
+                for candidate in parentGraph.getNodesList():
+                    if candidate.isCompoundNode and candidate.isGraphLoaded() and candidate.rawGraph is graph:
+                        owner = self._findTopLevelNode(candidate, rootGraph, graphOwners)
+                        break
+            graphOwners[graph] = owner
+        return graphOwners[graph]
+
+    def _collectDelta(self, manager, rootGraph):
+        delta = _HistoryDelta()
+        graphOwners = {}
+        topLevelNodes = set()
+
+        for node in self._modifiedNodes:
+            topLevelNode = self._findTopLevelNode(node, rootGraph, graphOwners)
+            if topLevelNode is not None:
+                topLevelNodes.add(topLevelNode)
+
+        # variables are few, so they are compared directly
+        variableStates = {}
+        for graph in manager.getAllGraphs(bLoadedOnly=True):
+            for var in graph.getVars().values():
+                variableStates[str(var.uid)] = (graph.name, var.serialize())
+        for uid in set(variableStates.keys()) | set(self._variableStates.keys()):
+            before = self._variableStates.get(uid)
+            after = variableStates.get(uid)
+            if before == after:
+                continue
+            for graphName, varJson in (before or (None, None), after or (None, None)):
+                if graphName is None or graphName == rootGraph.name:
+                    continue
+                # variables of compounds are stored with compound node
+                graph = manager.findGraph(graphName)
+                if graph is not None:
+                    owner = self._findGraphOwner(graph, rootGraph, graphOwners)
+                    if owner is not None:
+                        topLevelNodes.add(owner)
+            beforeJson = before[1] if before is not None and before[0] == rootGraph.name else None
+            afterJson = after[1] if after is not None and after[0] == rootGraph.name else None
+            if beforeJson != afterJson:
+                delta.variables[uid] = (beforeJson, afterJson)
+        self._variableStates = variableStates
+
+        # killed nodes first, so node recreated with same uid wins
+        rootNodes = rootGraph.getNodes()
+        for node in sorted(topLevelNodes, key=lambda n: rootNodes.get(n.uid) is n):
+            uid = str(node.uid)
+            after = node.serialize() if rootNodes.get(node.uid) is node else None
+            before = self._nodeStates.get(uid)
+            if uid in delta.nodes:
+                before = delta.nodes[uid][0]
+            if before == after:
+                delta.nodes.pop(uid, None)
+                continue
+            delta.nodes[uid] = (before, after)
+            if after is None:
+                self._nodeStates.pop(uid, None)
+            else:
+                self._nodeStates[uid] = after
+
+        activeGraphName = manager.activeGraph().name
+        delta.activeGraph = (self._activeGraphName, activeGraphName)
+        self._activeGraphName = activeGraphName
+        return delta
+
+    def _canStep(self, fromIndex, toIndex):
+        for index in range(min(fromIndex, toIndex) + 1, max(fromIndex, toIndex) + 1):
+            if self.stack[index].delta is None:
+                return False
+        return True
+
+    def _moveTo(self, index):
+        current = self.currentIndex
+        if current != -1 and self._canStep(current, index):
+            if index < current:
+                for i in range(current, index, -1):
+                    self._applyDelta(self.stack[i].delta, bUndo=True)
+            else:
+                for i in range(current + 1, index + 1):
+                    self._applyDelta(self.stack[i].delta, bUndo=False)
+            return
+
+        # restore nearest checkpoint and replay changes after it
+        checkpoint = index
+        while self.stack[checkpoint].snapshot is None:
+            checkpoint -= 1
+        self._loadSnapshot(self.stack[checkpoint].snapshot)
+        for i in range(checkpoint + 1, index + 1):
+            self._applyDelta(self.stack[i].delta, bUndo=False)
+
+    def _loadSnapshot(self, snapshot):
+        manager = GraphManagerSingleton().get()
+        self._bApplying = True
+        try:
+            # loading modifies passed data
+            data = deepcopy(snapshot)
+            if self.app is not None:
+                self.app.loadFromData(data)
+            else:
+                manager.deserialize(data)
+                manager.selectGraphByName(data["activeGraph"])
+        finally:
+            self._bApplying = False
+        self._resetStates(snapshot)
+        self._rootGraph = manager.findRootGraph()
+        self._modifiedNodes.clear()
+
+    def _applyDelta(self, delta, bUndo):
+        manager = GraphManagerSingleton().get()
+        rootGraph = manager.findRootGraph()
+        side = 0 if bUndo else 1
+
+        self._bApplying = True
+        try:
+            rootVars = rootGraph.getVars()
+            # variables should exist before accessor nodes are created
+            for uid, change in delta.variables.items():
+                target = change[side]
+                if target is None:
+                    continue
+                var = rootVars.get(uuid.UUID(uid))
+                restored = Variable.deserialize(rootGraph, target)
+                if var is None:
+                    rootVars[restored.uid] = restored
+                    manager.onVariableCreated(restored)
+                else:
+                    if var.name != restored.name:
+                        var.name = restored.name
+                    var.structure = restored.structure
+                    var.dataType = restored.dataType
+                    var.accessLevel = restored.accessLevel
+                    var.value = restored.value
+
+            rootNodes = rootGraph.getNodes()
+            for uid in delta.nodes:
+                node = rootNodes.get(uuid.UUID(uid))
+                if node is not None:
+                    node.kill()
+
+            restoredNodes = []
+            for uid, change in delta.nodes.items():
+                target = change[side]
+                if target is None:
+                    continue
+                jsonTemplate = deepcopy(target)
+                nodeKwargs = {}
+                if jsonTemplate['type'] in ('getVar', 'setVar'):
+                    nodeKwargs['var'] = manager.findVariableByUid(uuid.UUID(jsonTemplate['varUid']))
+                jsonTemplate['owningGraphName'] = rootGraph.name
+                node = getRawNodeInstance(jsonTemplate['type'], packageName=jsonTemplate['package'], libName=jsonTemplate['lib'], **nodeKwargs)
+                if node is not None and rootGraph.addNode(node, jsonTemplate):
+                    restoredNodes.append((node, target))
+
+            # restore connections of recreated nodes, both sides
+            for node, target in restoredNodes:
+                for pinJson in target['inputs'] + target['outputs']:
+                    for linkData in pinJson['linkedTo']:
+                        lhsNode = rootNodes.get(uuid.UUID(linkData['lhsNodeUid']))
+                        rhsNode = rootNodes.get(uuid.UUID(linkData['rhsNodeUid']))
+                        if lhsNode is None or rhsNode is None:
+                            continue
+                        lhsPin = lhsNode.orderedOutputs.get(linkData['outPinId'])
+                        rhsPin = rhsNode.orderedInputs.get(linkData['inPinId'])
+                        if lhsPin is not None and rhsPin is not None and not arePinsConnected(lhsPin, rhsPin):
+                            connectPins(lhsPin, rhsPin)
+
+            for uid, change in delta.variables.items():
+                if change[side] is None:
+                    var = rootVars.get(uuid.UUID(uid))
+                    if var is not None:
+                        rootGraph.killVariable(var)
+
+            # active graph could be removed together with compound node
+            activeGraphName = delta.activeGraph[side]
+            if manager.activeGraph() not in manager.getAllGraphs(bLoadedOnly=True):
+                manager.selectRootGraph()
+            if activeGraphName is not None:
+                manager.selectGraphByName(activeGraphName)
+
+            if self.app is not None:
+                self._createWrappers([node for node, target in restoredNodes])
+                if len(delta.variables) > 0:
+                    for variablesTool in self.app.getRegisteredTools(classNameFilters=["VariablesTool"]):
+                        variablesTool.varsWidget.actualize()
+        finally:
+            self._bApplying = False
+
+        for uid, change in delta.nodes.items():
+            if change[side] is None:
+                self._nodeStates.pop(uid, None)
+            else:
+                self._nodeStates[uid] = change[side]
+        self._variableStates = {}
+        for graph in manager.getAllGraphs(bLoadedOnly=True):
+            for var in graph.getVars().values():
+                self._variableStates[str(var.uid)] = (graph.name, var.serialize())
+        self._activeGraphName = manager.activeGraph().name
+        self._modifiedNodes.clear()
+
+    def _createWrappers(self, nodes):
+        canvas = self.app.getCanvas()
+        canvas.createWrappersForNodes(nodes)
+        # recreated compounds bring their graphs
+        graphs = []
+        for node in nodes:
+            if node.isCompoundNode and node.isGraphLoaded():
+                graphs.append(node.rawGraph)
+        while len(graphs) > 0:
+            graph = graphs.pop()
+            canvas.createWrappersForGraph(graph)
+            graphs.extend(graph.childGraphs)
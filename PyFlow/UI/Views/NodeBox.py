@@ -32,6 +32,7 @@ from PyFlow.Core.Common import *
 from PyFlow.UI.Canvas.UICommon import *
 from PyFlow.UI.EditorHistory import EditorHistory
 from PyFlow.Core.NodeBase import NodeBase
+from PyFlow.Core.CompoundRegistry import CompoundRegistry
 
 from PyFlow.UI.Utils.stylesheet import editableStyleSheet
 
@@ -260,20 +261,9 @@ class NodeBoxTreeWidget(QTreeWidget):
                             self.insertNode(category, pyNodeName, bPyNode=True)
 
             # populate exported compounds
-            compoundNodesRoot = os.path.join(packagePath, "Compounds")
-            if os.path.exists(compoundNodesRoot):
-                for path, dirs, files in os.walk(compoundNodesRoot):
-                    for f in files:
-                        _, extension = os.path.splitext(f)
-                        if extension == ".compound":
-                            compoundsRoot = os.path.normpath(path)
-                            fullCompoundPath = os.path.join(compoundsRoot, f)
-                            with open(fullCompoundPath, 'r') as compoundFile:
-                                data = json.load(compoundFile)
-                                compoundCategoryName = data["category"]
-                                compoundNodeName = data["name"]
-                                category = "{0}|{1}|{2}".format(package_name, "Compounds", compoundCategoryName)
-                                self.insertNode(category, compoundNodeName, bCompoundNode=True)
+            for definition in CompoundRegistry().getDefinitions(package_name):
+                category = "{0}|{1}|{2}".format(package_name, "Compounds", definition.category)
+                self.insertNode(category, definition.name, bCompoundNode=True)
 
             # expand all categories
             if dataType is not None:
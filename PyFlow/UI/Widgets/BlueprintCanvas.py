@@ -46,6 +46,7 @@ from PyFlow.UI.Canvas.AutoPanController import AutoPanController
 from PyFlow.UI.UIInterfaces import IPropertiesViewSupport
 from PyFlow.Core.PinBase import PinBase
 from PyFlow.Core.NodeBase import NodeBase
+from PyFlow.Core.GraphFile import readGraphFile
 from PyFlow.Input import InputManager, InputAction, InputActionType
 from PyFlow.UI.Views.VariablesWidget import (
     VARIABLE_TAG,
@@ -294,7 +295,7 @@ class BlueprintCanvas(CanvasBase):
         """returns all ui nodes dict including compounds
         """
         result = {}
-        for rawNode in self.graphManager.getAllNodes():
+        for rawNode in self.graphManager.getAllNodes(bLoadedOnly=True):
             uiNode = rawNode.getWrapper()
             if uiNode is None:
                 print("{0} has not UI wrapper".format(rawNode.name))
@@ -308,7 +309,7 @@ class BlueprintCanvas(CanvasBase):
         """Returns UI pins dict {uuid: UIPinBase}
         """
         result = {}
-        for node in self.graphManager.getAllNodes():
+        for node in self.graphManager.getAllNodes(bLoadedOnly=True):
             for pin in node.pins:
                 result[pin.uid] = pin.getWrapper()()
         return result
@@ -1331,12 +1332,11 @@ class BlueprintCanvas(CanvasBase):
                 if url.isLocalFile():
                     filePath = url.toLocalFile()
                     if filePath.endswith(".pygraph"):
-                        with open(filePath, 'r') as f:
-                            data = json.load(f)
-                            if "fileVersion" in data:
-                                event.accept()
-                                self.dropCallback = partial(self.getApp().loadFromFileChecked, filePath)
-                                return
+                        data = readGraphFile(filePath)
+                        if "fileVersion" in data:
+                            event.accept()
+                            self.dropCallback = partial(self.getApp().loadFromFileChecked, filePath)
+                            return
                     elif filePath.endswith(".compound"):
                         with open(filePath, 'r') as f:
                             data = json.load(f)
@@ -1614,24 +1614,43 @@ class BlueprintCanvas(CanvasBase):
 
     def createWrappersForGraph(self, rawGraph):
         # when raw graph was created, we need to create all ui wrappers for it
+        self.createWrappersForNodes(rawGraph.getNodesList())
+
+    def createWrappersForNodes(self, rawNodes):
+        """Creates ui wrappers for raw nodes which were added to graphs directly, and ui connections for their pins
+
+        :param rawNodes: Raw nodes, can belong to different graphs
+        :type rawNodes: list(:class:`~PyFlow.Core.NodeBase.NodeBase`)
+        """
         uiNodesJsonData = {}
-        for node in rawGraph.getNodesList():
+        graphs = set()
+        for node in rawNodes:
+            graphs.add(node.graph())
             if node.getWrapper() is not None:
                 continue
             uiNode = getUINodeInstance(node)
             uiNodeJsonTemplate = node.serialize()
             uiNodeJsonTemplate["wrapper"] = node.wrapperJsonData
-            self.addNode(uiNode, uiNodeJsonTemplate, parentGraph=rawGraph)
+            self.addNode(uiNode, uiNodeJsonTemplate, parentGraph=node.graph())
             uiNode.updateNodeShape()
             uiNodesJsonData[uiNode] = uiNodeJsonTemplate
 
         # restore ui connections
-        for rawNode in rawGraph.getNodesList():
+        for rawNode in rawNodes:
             uiNode = rawNode.getWrapper()
-            for outUiPin in uiNode.UIoutputs.values():
-                for inputRawPin in getConnectedPins(outUiPin._rawPin):
-                    inUiPin = inputRawPin.getWrapper()()
-                    self.createUIConnectionForConnectedPins(outUiPin, inUiPin)
+            for uiPin in list(uiNode.UIoutputs.values()) + list(uiNode.UIinputs.values()):
+                for connectedRawPin in getConnectedPins(uiPin._rawPin):
+                    connectedWrapper = connectedRawPin.getWrapper()
+                    if connectedWrapper is None or connectedWrapper() is None:
+                        continue
+                    connectedUiPin = connectedWrapper()
+                    bExists = False
+                    for connection in uiPin.uiConnectionList:
+                        if connection.source() is connectedUiPin or connection.destination() is connectedUiPin:
+                            bExists = True
+                            break
+                    if not bExists:
+                        self.createUIConnectionForConnectedPins(uiPin, connectedUiPin)
 
         for uiNode, data in uiNodesJsonData.items():
             if uiNode.isUnderActiveGraph():
@@ -1648,8 +1667,9 @@ class BlueprintCanvas(CanvasBase):
         for uiNode, data in uiNodesJsonData.items():
             if uiNode.isCommentNode:
                 uiNode.collapsed = data["wrapper"]["collapsed"]
-        self.validateCommentNodesOwnership(rawGraph)
-        self.validateConnections(rawGraph)
+        for rawGraph in graphs:
+            self.validateCommentNodesOwnership(rawGraph)
+            self.validateConnections(rawGraph)
 
     def addNode(self, uiNode, jsonTemplate, parentGraph=None):
         """Adds node to a graph
@@ -1798,7 +1818,7 @@ class BlueprintCanvasWidget(QWidget):
         self.canvas.Tick(delta)
 
     def onFileBeenLoaded(self):
-        for graph in self.manager.getAllGraphs():
+        for graph in self.manager.getAllGraphs(bLoadedOnly=True):
             self.canvas.createWrappersForGraph(graph)
 
     def updateGraphTreeLocation(self, *args, **kwargs):
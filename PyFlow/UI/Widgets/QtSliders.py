@@ -1075,7 +1075,7 @@ class uiTick(QtWidgets.QGraphicsWidget):
         :param u: new position
         :type u: float
         """
-        self._rawTick._u = u
+        self._rawTick.setU(u)
 
     def setV(self, v):
         """Sets V value
@@ -1083,7 +1083,7 @@ class uiTick(QtWidgets.QGraphicsWidget):
         :param v: new Y position
         :type v: object
         """
-        self._rawTick._v = v
+        self._rawTick.setV(v)
 
     def setColor(self, color):
         """Sets Color value
@@ -22,17 +22,24 @@ __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 import importlib
 import pkgutil
 import collections
+import hashlib
+import json
 from copy import copy
 import os
-import json
+import sys
+import logging
 
 from PyFlow.Packages import *
 
+logger = logging.getLogger(None)
+
 
 __all__ = [
     "INITIALIZE",
     "GET_PACKAGES",
     "GET_PACKAGE_CHECKED",
+    "GET_PACKAGE_MANIFEST",
+    "LazyPackage",
     "CreateRawPin",
     "getPinDefaultValueByType",
     "findPinClassByType",
@@ -45,6 +52,84 @@ __all__ = [
 __PACKAGES = {}
 __PACKAGE_PATHS = {}
 __HASHABLE_TYPES = []
+# package name -> manifest entry
+__MANIFEST = {}
+__REGISTERED_INTERNAL_PIN_TYPES = set()
+
+
+def _userCacheDir():
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        root = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(root, "PyFlow")
+
+
+#: Manifest with contents of packages, used to import packages lazily
+DEFAULT_MANIFEST_PATH = os.path.join(_userCacheDir(), "packages_manifest.json")
+MANIFEST_VERSION = 2
+
+
+def _environmentKey():
+    """Identifies interpreter and import paths. Packages can provide different contents
+    depending on installed optional dependencies, so manifest is valid only for same environment.
+    First entry of sys.path is folder of running script and does not change what is installed.
+    Computed on import, before package locations are added to sys.path
+    """
+    description = json.dumps([sys.executable, sys.version, sys.path[1:]])
+    return hashlib.md5(description.encode("utf-8")).hexdigest()
+
+
+#: Key of environment manifest is valid for
+ENVIRONMENT_KEY = _environmentKey()
+
+
+class LazyPackage(object):
+    """Stands for package which is not imported yet
+
+    Created by :func:`INITIALIZE` for packages which did not change since manifest was written.
+    Package is imported when any of it's members is accessed, for example when node of it is created.
+    What package provides can be checked using :meth:`manifest` without importing it.
+
+    :param name: Package name
+    :type name: str
+    :param manifest: Manifest entry of package
+    :type manifest: dict
+    :param loader: Imports and registers package, returns package instance
+    :type loader: function
+    """
+    def __init__(self, name, manifest, loader):
+        self.name = name
+        self._manifest = manifest
+        self._loader = loader
+        self._package = None
+
+    def manifest(self):
+        """Returns nodes, functions and pins of package
+
+        :rtype: dict
+        """
+        return self._manifest
+
+    def providesPin(self, dataType):
+        return dataType in self._manifest["pins"]
+
+    def isLoaded(self):
+        return self._package is not None
+
+    def load(self):
+        """Imports package if it was not imported yet
+
+        :rtype: :class:`~PyFlow.UI.UIInterfaces.IPackage`
+        """
+        if self._package is None:
+            self._package = self._loader()
+        return self._package
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
 
 
 def GET_PACKAGES():
@@ -61,6 +146,18 @@ def GET_PACKAGE_CHECKED(package_name):
     return __PACKAGES[package_name]
 
 
+def GET_PACKAGE_MANIFEST(packageName):
+    """Returns nodes, functions and pins of package without importing it
+
+    Manifest is only kept when packages are loaded lazily, see :func:`INITIALIZE`
+
+    :param packageName: Package name
+    :type packageName: str
+    :rtype: dict or None
+    """
+    return __MANIFEST.get(packageName)
+
+
 def getAllPinClasses():
     result = []
     for package in list(__PACKAGES.values()):
@@ -70,9 +167,17 @@ def getAllPinClasses():
 
 def findPinClassByType(dataType):
     for package_name, package in GET_PACKAGES().items():
+        if isinstance(package, LazyPackage) and not package.isLoaded() and not package.providesPin(dataType):
+            continue
         pins = package.GetPinClasses()
         if dataType in pins:
             return pins[dataType]
+    # manifest could be written when optional dependencies of package were missing
+    for package_name, package in list(GET_PACKAGES().items()):
+        if isinstance(package, LazyPackage) and not package.isLoaded():
+            pins = package.GetPinClasses()
+            if dataType in pins:
+                return pins[dataType]
     return None
 
 
@@ -83,12 +188,23 @@ def getPinDefaultValueByType(dataType):
     return None
 
 
+def _isHashablePinClass(pin):
+    t = pin.internalDataStructure()
+    if t is not type(None) and t is not None:
+        return isinstance(t(), collections.Hashable)
+    return False
+
+
 def getHashableDataTypes():
     if len(__HASHABLE_TYPES) == 0:
-        for pin in getAllPinClasses():
-            t = pin.internalDataStructure()
-            if t is not type(None) and t is not None:
-                if isinstance(pin.internalDataStructure()(), collections.Hashable):
+        for package in list(__PACKAGES.values()):
+            if isinstance(package, LazyPackage):
+                for pinName, pinInfo in package.manifest()["pins"].items():
+                    if pinInfo["hashable"]:
+                        __HASHABLE_TYPES.append(pinName)
+                continue
+            for pin in package.GetPinClasses().values():
+                if _isHashablePinClass(pin):
                     __HASHABLE_TYPES.append(pin.__name__)
     return copy(__HASHABLE_TYPES)
 
@@ -138,30 +254,145 @@ def getRawNodeInstance(nodeClassName, packageName=None, libName=None, **kwargs):
                     return pythonNode
 
     # try find exported compound nodes
-    compoundNodesPath = os.path.join(packagePath, "Compounds")
-    if os.path.exists(compoundNodesPath):
-        for path, dirs, files in os.walk(compoundNodesPath):
-            for compoundNodeFileName in files:
-                compoundNodeName, _ = os.path.splitext(compoundNodeFileName)
-                compoundNodeFullPath = os.path.join(path, compoundNodeFileName)
-                with open(compoundNodeFullPath, 'r') as f:
-                    compoundData = json.load(f)
-                    if compoundData["name"] == nodeClassName:
-                        compoundNode = getRawNodeInstance("compound", "PyFlowBase")
-                        compoundNodeFullPath = os.path.join(path, compoundNodeFileName)
-                        with open(compoundNodeFullPath, "r") as f:
-                            jsonString = f.read()
-                            compoundNode._rawGraphJson = json.loads(jsonString)
-                        return compoundNode
-
-
-def INITIALIZE(additionalPackageLocations=[], software=""):
+    from PyFlow.Core.CompoundRegistry import CompoundRegistry
+    definition = CompoundRegistry().findDefinition(packageName, nodeClassName)
+    if definition is not None:
+        compoundNode = getRawNodeInstance("compound", "PyFlowBase")
+        compoundNode._definition = definition
+        return compoundNode
+
+
+def _packageFileTimes(packagePath):
+    """Returns modification times of package python files. Manifest entry is valid while they stay same
+    """
+    result = {}
+    for path, dirs, files in os.walk(packagePath):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for fileName in files:
+            if os.path.splitext(fileName)[1] == ".py":
+                filePath = os.path.join(path, fileName)
+                result[os.path.relpath(filePath, packagePath).replace(os.sep, "/")] = os.path.getmtime(filePath)
+    return result
+
+
+def _describePackage(package, packagePath, fileTimes):
+    """Makes manifest entry of imported package
+    """
+    from PyFlow.Core.Common import NodeMeta
+    functions = {}
+    for libName, lib in package.GetFunctionLibraries().items():
+        functions[libName] = {}
+        for name, foo in lib.getFunctions().items():
+            meta = foo.__annotations__["meta"]
+            functions[libName][name] = {"category": meta[NodeMeta.CATEGORY], "keywords": list(meta[NodeMeta.KEYWORDS])}
+    nodes = {}
+    for name, nodeClass in package.GetNodeClasses().items():
+        nodes[name] = {"category": nodeClass.category(), "keywords": list(nodeClass.keywords())}
+    pins = {}
+    for name, pinClass in package.GetPinClasses().items():
+        pins[name] = {"hashable": _isHashablePinClass(pinClass)}
+    return {
+        "path": packagePath,
+        "files": fileTimes,
+        "nodes": nodes,
+        "functions": functions,
+        "pins": pins
+    }
+
+
+def _readManifest(manifestPath):
+    try:
+        with open(manifestPath, "r") as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION and data.get("environment") == ENVIRONMENT_KEY:
+            return data["packages"]
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _writeManifest(manifestPath, packages):
+    try:
+        manifestDir = os.path.dirname(manifestPath)
+        if not os.path.isdir(manifestDir):
+            os.makedirs(manifestDir)
+        with open(manifestPath, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "environment": ENVIRONMENT_KEY, "packages": packages}, f)
+    except (IOError, OSError) as e:
+        logger.warning("Failed to write packages manifest {0}: {1}".format(manifestPath, e))
+
+
+def _registerPackage(package, headless, software):
+    """Registers classes of imported package
+    """
+    packageName = package.__class__.__name__
+    for node in package.GetNodeClasses().values():
+        node._packageName = packageName
+
+    for pin in package.GetPinClasses().values():
+        pin._packageName = packageName
+        if pin.IsValuePin():
+            internalType = pin.internalDataStructure()
+            if internalType in __REGISTERED_INTERNAL_PIN_TYPES:
+                raise Exception("Pin with {0} internal data type already been registered".format(internalType))
+            __REGISTERED_INTERNAL_PIN_TYPES.add(internalType)
+
+    if headless:
+        return
+
     from PyFlow.UI.Tool import REGISTER_TOOL
     from PyFlow.UI.Widgets.InputWidgets import REGISTER_UI_INPUT_WIDGET_PIN_FACTORY
     from PyFlow.UI.Canvas.UINodeBase import REGISTER_UI_NODE_FACTORY
     from PyFlow.UI.Canvas.UIPinBase import REGISTER_UI_PIN_FACTORY
-    from PyFlow import ConfigManager
-    from Qt.QtWidgets import QMessageBox
+
+    uiPinsFactory = package.UIPinsFactory()
+    if uiPinsFactory is not None:
+        REGISTER_UI_PIN_FACTORY(packageName, uiPinsFactory)
+
+    uiPinInputWidgetsFactory = package.PinsInputWidgetFactory()
+    if uiPinInputWidgetsFactory is not None:
+        REGISTER_UI_INPUT_WIDGET_PIN_FACTORY(packageName, uiPinInputWidgetsFactory)
+
+    uiNodesFactory = package.UINodesFactory()
+    if uiNodesFactory is not None:
+        REGISTER_UI_NODE_FACTORY(packageName, uiNodesFactory)
+
+    for toolClass in package.GetToolClasses().values():
+        supportedSoftwares = toolClass.supportedSoftwares()
+        if "any" not in supportedSoftwares:
+            if software not in supportedSoftwares:
+                continue
+        REGISTER_TOOL(packageName, toolClass)
+
+
+def INITIALIZE(additionalPackageLocations=[], software="", headless=False, lazy=None, manifestPath=DEFAULT_MANIFEST_PATH):
+    """Loads packages and registers their classes
+
+    In lazy mode contents of packages are stored in manifest. Packages which files did not change since manifest
+    was written are represented by :class:`LazyPackage` until one of their nodes, pins or libraries is used.
+    Manifest is not read or written when packages are imported at once.
+
+    :param additionalPackageLocations: Extra folders to search packages in
+    :type additionalPackageLocations: list(str)
+    :param software: Host software name, used to filter tools
+    :type software: str
+    :param headless: If True, only nodes, pins and function libraries are loaded. Qt and editor registries are not touched
+    :type headless: bool
+    :param lazy: Whether to import packages on first use. By default packages are imported lazily only in headless mode,
+        since editor reads tools, exporters and preferences of all packages on startup
+    :type lazy: bool or None
+    :param manifestPath: Manifest file used in lazy mode. If None, manifest is not used
+    :type manifestPath: str or None
+    """
+    if not headless:
+        from PyFlow import ConfigManager
+        from Qt.QtWidgets import QMessageBox
+
+    if lazy is None:
+        lazy = headless
+    if not lazy:
+        # nothing would read it
+        manifestPath = None
 
     packagePaths = Packages.__path__
 
@@ -204,48 +435,59 @@ def INITIALIZE(additionalPackageLocations=[], software=""):
 
     packagePaths.extend(additionalPackageLocations)
 
+    oldManifest = _readManifest(manifestPath) if manifestPath is not None else {}
+    __MANIFEST.clear()
+    __REGISTERED_INTERNAL_PIN_TYPES.clear()
+
+    def importPackage(importer, modname):
+        mod = importer.find_module(modname).load_module(modname)
+        return getattr(mod, modname)(), os.path.normpath(mod.__path__[0])
+
+    def lazyLoader(importer, modname):
+        def load():
+            package = importPackage(importer, modname)[0]
+            _registerPackage(package, headless, software)
+            __PACKAGES[modname] = package
+            return package
+        return load
+
     for importer, modname, ispkg in pkgutil.iter_modules(packagePaths):
+        if not ispkg:
+            continue
+        package = None
         try:
-            if ispkg:
-                mod = importer.find_module(modname).load_module(modname)
-                package = getattr(mod, modname)()
-                __PACKAGES[modname] = package
-                __PACKAGE_PATHS[modname] = os.path.normpath(mod.__path__[0])
+            # packages found not on file system, in zip for example, are always imported
+            manifestPackagePath = None
+            fileTimes = None
+            if manifestPath is not None and getattr(importer, "path", None) is not None:
+                manifestPackagePath = os.path.normpath(os.path.join(importer.path, modname))
+                fileTimes = _packageFileTimes(manifestPackagePath)
+            entry = oldManifest.get(modname)
+            packagePath = manifestPackagePath
+            if entry is not None and (entry["path"] != manifestPackagePath or entry["files"] != fileTimes):
+                entry = None
+
+            if lazy and entry is not None:
+                __PACKAGES[modname] = LazyPackage(modname, entry, lazyLoader(importer, modname))
+            else:
+                package, packagePath = importPackage(importer, modname)
         except Exception as e:
-            QMessageBox.critical(None, str("Fatal error"), "Error On Module %s :\n%s" % (modname, str(e)))
+            if headless:
+                logger.error("Error On Module %s :\n%s" % (modname, str(e)))
+            else:
+                QMessageBox.critical(None, str("Fatal error"), "Error On Module %s :\n%s" % (modname, str(e)))
             continue
 
-    registeredInternalPinDataTypes = set()
-
-    for name, package in __PACKAGES.items():
-        packageName = package.__class__.__name__
-        for node in package.GetNodeClasses().values():
-            node._packageName = packageName
-
-        for pin in package.GetPinClasses().values():
-            pin._packageName = packageName
-            if pin.IsValuePin():
-                internalType = pin.internalDataStructure()
-                if internalType in registeredInternalPinDataTypes:
-                    raise Exception("Pin with {0} internal data type already been registered".format(internalType))
-                registeredInternalPinDataTypes.add(internalType)
-
-        uiPinsFactory = package.UIPinsFactory()
-        if uiPinsFactory is not None:
-            REGISTER_UI_PIN_FACTORY(packageName, uiPinsFactory)
-
-        uiPinInputWidgetsFactory = package.PinsInputWidgetFactory()
-        if uiPinInputWidgetsFactory is not None:
-            REGISTER_UI_INPUT_WIDGET_PIN_FACTORY(packageName, uiPinInputWidgetsFactory)
-
-        uiNodesFactory = package.UINodesFactory()
-        if uiNodesFactory is not None:
-            REGISTER_UI_NODE_FACTORY(packageName, uiNodesFactory)
-
-        for toolClass in package.GetToolClasses().values():
-            supportedSoftwares = toolClass.supportedSoftwares()
-            if "any" not in supportedSoftwares:
-                if software not in supportedSoftwares:
-                    continue
-            REGISTER_TOOL(packageName, toolClass)
+        if package is not None:
+            # broken package is skipped, but registration conflicts between packages are fatal
+            _registerPackage(package, headless, software)
+            __PACKAGES[modname] = package
+            if entry is None and fileTimes is not None:
+                entry = _describePackage(package, manifestPackagePath, fileTimes)
+        __PACKAGE_PATHS[modname] = packagePath
+        if entry is not None:
+            __MANIFEST[modname] = entry
+
+    if manifestPath is not None and __MANIFEST != oldManifest:
+        _writeManifest(manifestPath, __MANIFEST)
     getHashableDataTypes()
@@ -14,7 +14,6 @@
 
 import os
 import sys
-import json
 import threading
 import time
 
@@ -24,6 +23,7 @@ from Qt import QtCore
 from PyFlow import INITIALIZE
 from PyFlow.Core.Common import *
 from PyFlow.Core.GraphManager import GraphManagerSingleton
+from PyFlow.Core.GraphFile import readGraphFile
 from PyFlow.UI.Canvas.UINodeBase import getUINodeInstance
 from PyFlow.UI.Utils.stylesheet import editableStyleSheet
 from PyFlow.UI.Widgets.PropertiesFramework import CollapsibleFormWidget
@@ -40,8 +40,7 @@ def run(filePath):
     msg.setIcon(QMessageBox.Critical)
 
     if os.path.exists(filePath):
-        with open(filePath, 'r') as f:
-            data = json.load(f)
+        data = readGraphFile(filePath)
 
         # Window to display inputs
         prop = QDialog()